@@ -1,7 +1,21 @@
 # Core utilities
-from .logging import logger, plugin_name
-from .config import configPlugin, ConfigPlugin
-from .state import state
-from .storage import load_json, save_json, get_plugin_dir, get_data_dir
-from .duplicate import track_journal_event, process_powerplay_event, reset_duplicate_tracking
-from .report import report, Report
+# Exports are imported on first use, so standalone tools such as
+# `python -m emt_core.history` do not pull in EDMC, tkinter or requests
+import importlib
+
+_EXPORTS = {
+    "logger": "logging", "plugin_name": "logging",
+    "configPlugin": "config", "ConfigPlugin": "config",
+    "state": "state",
+    "load_json": "storage", "save_json": "storage", "get_plugin_dir": "storage", "get_data_dir": "storage",
+    "track_journal_event": "duplicate", "process_powerplay_event": "duplicate",
+    "reset_duplicate_tracking": "duplicate",
+    "report": "report", "Report": "report",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -0,0 +1,192 @@
+"""
+PowerPlay Cycle Archive
+
+Moves the previous cycle's systems out of the live systems dict when the
+weekly PowerPlay cycle ticks over, so the hot set only holds the current
+cycle while past cycles stay queryable.
+
+The rollover is detected from journal timestamps (see emt_core/cycle.py), so
+it works the same for a live session crossing the Thursday tick and for a
+first session after days offline.
+
+On-disk layout (data/archive/):
+    index.json                  - current cycle id plus per-cycle summaries
+    cycle-2026-10-08.json.gz    - {name: system dict} as of the rollover
+"""
+import gzip
+import json
+import os
+from typing import Dict, Any, Optional, List
+
+from emt_core.cycle import cycle_id
+from emt_core.logging import logger
+from emt_core.storage import get_data_dir
+
+ARCHIVE_DIR = "archive"
+INDEX_FILE = "index.json"
+
+
+class CycleArchive:
+    """
+    Per-cycle compressed archive of system dicts.
+
+    Rollover detection is disabled until open() is called so tests and tools
+    that drive journal_entry directly never archive the live systems.
+    """
+
+    def __init__(self, archive_dir: Optional[str] = None):
+        """
+        Initialize archive.
+
+        Args:
+            archive_dir: Directory for archive files (default: data/archive)
+        """
+        self._archive_dir = archive_dir
+        self._dir_ready = False
+        self.enabled = False
+        self._index: Optional[Dict[str, Any]] = None
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def archive_dir(self) -> str:
+        if not self._dir_ready:
+            if self._archive_dir is None:
+                self._archive_dir = os.path.join(get_data_dir(), ARCHIVE_DIR)
+            os.makedirs(self._archive_dir, exist_ok=True)
+            self._dir_ready = True
+        return self._archive_dir
+
+    def open(self):
+        """Enable rollover detection."""
+        self.enabled = True
+
+    # ----- index -----
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        if self._index is None:
+            path = os.path.join(self.archive_dir, INDEX_FILE)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+            except Exception as e:
+                logger.error(f"Failed to read cycle archive index: {e}")
+                self._index = {}
+            self._index.setdefault("current", None)
+            self._index.setdefault("cycles", {})
+        return self._index
+
+    def _save_index(self):
+        path = os.path.join(self.archive_dir, INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(temp_path, path)
+
+    @property
+    def current_cycle(self) -> Optional[str]:
+        return self.index["current"]
+
+    # ----- rollover -----
+
+    def check_rollover(self, timestamp: Optional[str]) -> Optional[str]:
+        """
+        Check whether a journal timestamp falls in a later cycle than the live one.
+
+        The first timestamp ever seen only sets the current cycle.
+
+        Args:
+            timestamp: Journal timestamp of the event about to be processed
+
+        Returns:
+            Id of the cycle that just ended, or None if no rollover happened
+        """
+        if not self.enabled or not timestamp:
+            return None
+        try:
+            cycle = cycle_id(timestamp)
+        except ValueError:
+            return None
+        current = self.current_cycle
+        if current == cycle:
+            return None
+        if current is None:
+            self.index["current"] = cycle
+            self._save_index()
+            return None
+        if cycle < current:
+            # Older journal replayed; never roll backwards
+            return None
+        self.index["current"] = cycle
+        self._save_index()
+        return current
+
+    def archive_cycle(self, cycle: str, systems: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Write a cycle's systems to its compressed archive file.
+
+        Archiving the same cycle twice merges the systems into the existing file.
+
+        Args:
+            cycle: Cycle id (start date) the systems belong to
+            systems: {name: system dict} as produced by StarSystem.to_dict()
+
+        Returns:
+            True if the archive was written
+        """
+        name = f"cycle-{cycle}.json.gz"
+        try:
+            archived = dict(self.load_cycle(cycle)) if cycle in self.index["cycles"] else {}
+            archived.update(systems)
+            payload = json.dumps(archived, separators=(',', ':'))
+            with gzip.open(os.path.join(self.archive_dir, name), "wt", encoding="utf-8") as f:
+                f.write(payload)
+            self.index["cycles"][cycle] = {
+                "file": name,
+                "systems": len(archived),
+                "merits": sum(int(s.get("Merits", 0)) for s in archived.values()),
+            }
+            self._save_index()
+            self._cache[cycle] = archived
+        except Exception as e:
+            logger.error(f"Failed to archive cycle {cycle}: {e}")
+            return False
+        logger.info(f"Archived {len(systems)} systems from cycle {cycle}")
+        return True
+
+    # ----- querying -----
+
+    def list_cycles(self) -> List[Dict[str, Any]]:
+        """Return archived cycle summaries (cycle, file, systems, merits), oldest first."""
+        return [dict(info, cycle=cycle) for cycle, info in sorted(self.index["cycles"].items())]
+
+    def load_cycle(self, cycle: str) -> Dict[str, Dict[str, Any]]:
+        """Return {name: system dict} for an archived cycle, or {} if not archived."""
+        if cycle in self._cache:
+            return self._cache[cycle]
+        info = self.index["cycles"].get(cycle)
+        if not info:
+            return {}
+        try:
+            with gzip.open(os.path.join(self.archive_dir, info["file"]), "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to read archived cycle {cycle}: {e}")
+            return {}
+        self._cache[cycle] = data
+        return data
+
+    def system_history(self, system_name: str) -> Dict[str, Dict[str, Any]]:
+        """Return {cycle: system dict} for every archived cycle that tracked a system."""
+        history = {}
+        for cycle in sorted(self.index["cycles"]):
+            system = self.load_cycle(cycle).get(system_name)
+            if system is not None:
+                history[cycle] = system
+        return history
+
+
+# Global instance
+cycle_archive = CycleArchive()
@@ -0,0 +1,222 @@
+"""
+Content-addressed Backup Snapshots
+
+Keeps a rotating history of the data files under data/backups/. File contents
+are stored once, gzip-compressed and named by their SHA-256 hash, so backing
+up an unchanged file costs a hash and nothing else. A snapshot is a small
+manifest mapping file names to content hashes.
+
+On-disk layout (data/backups/):
+    objects/ab/ab12...ef.gz                  - compressed file contents, named by hash
+    snapshots/20261019T071500Z-update.json   - {"created", "label", "files": {name: hash}}
+
+Retention keeps the newest max_snapshots manifests; objects no longer
+referenced by any manifest are deleted.
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Iterable
+
+from emt_core import storage
+from emt_core.logging import logger
+
+BACKUP_DIR = "backups"
+
+# Data files included in a full snapshot when present
+DATA_FILES = ("systems.json", "power.json", "backpack.json", "salvage.json", "tracker.db.backup")
+
+
+class BackupStore:
+    """Deduplicated snapshot store for data files."""
+
+    def __init__(self, backup_dir: Optional[str] = None, data_dir: Optional[str] = None, max_snapshots: int = 20):
+        """
+        Initialize backup store.
+
+        Args:
+            backup_dir: Directory for backups (default: backups/ in the current data directory)
+            data_dir: Directory the backed up files live in (default: the current data directory)
+            max_snapshots: Number of snapshots kept; older ones are deleted
+        """
+        self._backup_dir = backup_dir
+        self._data_dir = data_dir
+        self.max_snapshots = max_snapshots
+
+    # Defaults are resolved on every use so they follow a redirected data directory
+
+    @property
+    def backup_dir(self) -> str:
+        if self._backup_dir is None:
+            return os.path.join(storage.get_data_dir(), BACKUP_DIR)
+        return self._backup_dir
+
+    @property
+    def data_dir(self) -> str:
+        if self._data_dir is None:
+            return storage.get_data_dir()
+        return self._data_dir
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.backup_dir, "objects", digest[:2], f"{digest}.gz")
+
+    def _snapshot_dir(self) -> str:
+        return os.path.join(self.backup_dir, "snapshots")
+
+    # ----- writing -----
+
+    def _store_object(self, content: bytes) -> str:
+        """Store content under its hash unless it is already there; return the hash"""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = path + ".tmp"
+            with gzip.open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        return digest
+
+    def snapshot(self, label: str = "manual", filenames: Optional[Iterable[str]] = None) -> Optional[str]:
+        """
+        Snapshot data files.
+
+        When the latest snapshot already holds exactly these files with the
+        same contents, nothing is written and its id is returned. An older
+        snapshot with the same contents is replaced by a new manifest, so the
+        content currently on disk is always the newest snapshot and is never
+        the first to go under retention; saving A, B, A keeps two snapshots.
+
+        Args:
+            label: Short tag stored with the snapshot (e.g. "update")
+            filenames: Files in the data directory to include (default: DATA_FILES)
+
+        Returns:
+            Snapshot id, or None if there was nothing to back up or it failed
+        """
+        files: Dict[str, str] = {}
+        try:
+            for filename in filenames or DATA_FILES:
+                path = os.path.join(self.data_dir, filename)
+                if not os.path.exists(path):
+                    continue
+                with open(path, "rb") as f:
+                    files[filename] = self._store_object(f.read())
+        except Exception as e:
+            logger.error(f"Failed to back up data files: {e}")
+            return None
+        if not files:
+            return None
+
+        snapshots = self.list_snapshots()
+        if snapshots and snapshots[-1]["files"] == files:
+            return snapshots[-1]["id"]
+        # Objects are shared, so moving a duplicate to the front costs one manifest
+        duplicates = [s["id"] for s in snapshots if s["files"] == files]
+
+        created = datetime.now(timezone.utc)
+        snapshot_id = f"{created.strftime('%Y%m%dT%H%M%S%fZ')}-{label}"
+        manifest = {"created": created.strftime("%Y-%m-%dT%H:%M:%SZ"), "label": label, "files": files}
+        try:
+            os.makedirs(self._snapshot_dir(), exist_ok=True)
+            path = os.path.join(self._snapshot_dir(), f"{snapshot_id}.json")
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            logger.error(f"Failed to write backup snapshot: {e}")
+            return None
+        for old_id in duplicates:
+            try:
+                os.remove(os.path.join(self._snapshot_dir(), f"{old_id}.json"))
+            except OSError:
+                pass
+        logger.info(f"Created backup snapshot {snapshot_id} ({len(files)} files)")
+        self._prune()
+        return snapshot_id
+
+    def _prune(self):
+        """Apply retention and delete objects no snapshot references."""
+        snapshots = self.list_snapshots()
+        for old in snapshots[:-self.max_snapshots] if self.max_snapshots else []:
+            try:
+                os.remove(os.path.join(self._snapshot_dir(), f"{old['id']}.json"))
+            except OSError:
+                pass
+        referenced = {digest for s in snapshots[-self.max_snapshots:] for digest in s["files"].values()}
+        objects_dir = os.path.join(self.backup_dir, "objects")
+        for root, _, names in os.walk(objects_dir):
+            for name in names:
+                if name.endswith(".gz") and name[:-3] not in referenced:
+                    try:
+                        os.remove(os.path.join(root, name))
+                    except OSError:
+                        pass
+
+    # ----- reading -----
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """Return snapshot manifests (id, created, label, files), oldest first."""
+        directory = self._snapshot_dir()
+        if not os.path.isdir(directory):
+            return []
+        snapshots = []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable backup snapshot {name}: {e}")
+                continue
+            manifest["id"] = name[:-5]
+            snapshots.append(manifest)
+        return snapshots
+
+    def read_file(self, snapshot_id: str, filename: str) -> bytes:
+        """Return a file's contents as stored in a snapshot."""
+        manifest = self._manifest(snapshot_id)
+        with gzip.open(self._object_path(manifest["files"][filename]), "rb") as f:
+            return f.read()
+
+    def _manifest(self, snapshot_id: str) -> Dict[str, Any]:
+        with open(os.path.join(self._snapshot_dir(), f"{snapshot_id}.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def restore(self, snapshot_id: str, filenames: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Restore files from a snapshot into the data directory.
+
+        The current files are snapshotted first (label "pre-restore") so a
+        restore can itself be undone. Each file is replaced atomically.
+
+        Args:
+            snapshot_id: Id from list_snapshots()
+            filenames: Subset of the snapshot's files to restore (default: all)
+
+        Returns:
+            Names of the restored files
+        """
+        manifest = self._manifest(snapshot_id)
+        wanted = list(filenames) if filenames else list(manifest["files"])
+        self.snapshot(label="pre-restore")
+        restored = []
+        for filename in wanted:
+            digest = manifest["files"].get(filename)
+            if digest is None:
+                logger.warning(f"{filename} is not in backup snapshot {snapshot_id}")
+                continue
+            path = os.path.join(self.data_dir, filename)
+            with gzip.open(self._object_path(digest), "rb") as src, open(path + ".tmp", "wb") as dst:
+                dst.write(src.read())
+            os.replace(path + ".tmp", path)
+            restored.append(filename)
+        logger.info(f"Restored {len(restored)} files from backup snapshot {snapshot_id}")
+        return restored
+
+
+# Global instance
+backup_store = BackupStore()
@@ -14,6 +14,12 @@ class ConfigPlugin:
     def getCacheTime(self):
         return 43200
     
+    def getMaxResidentSystems(self):
+        return 2000
+
+    def getStaleAfterHours(self):
+        return 168
+
     def old(self):
         self.never = True
     
@@ -21,6 +27,7 @@ class ConfigPlugin:
         self.power_info_width = int(config.get_str("power_info_width") or "1280")
         self.power_info_height = int(config.get_str("power_info_height") or "800")
         self.cacheTime = int(config.get_str("cacheTime") or self.getCacheTime())
+        self.maxResidentSystems = int(config.get_str("maxResidentSystems") or self.getMaxResidentSystems())
         self.copyText = tk.StringVar(value=config.get_str("copyText") or self.getTextCopy())
         self.reportOnFSDJump = tk.BooleanVar(value=config.get_bool("reportOnFSDJump") or False)
         self.discordHook = tk.StringVar(value=config.get_str("discordHook") or "")
@@ -28,11 +35,16 @@ class ConfigPlugin:
         self.never = config.get_bool("never") or False
         self.beta = config.get_bool("beta") or False
         self.hide_stats = tk.BooleanVar(value=config.get_bool("hide_stats") or False)
+        self.useSqlite = tk.BooleanVar(value=config.get_bool("useSqlite") or False)
+        self.durability = config.get_str("durability") or "fsync-file"
+        self.bagRemovalOrder = config.get_str("bagRemovalOrder") or "alphabetical"
+        self.staleAfterHours = float(config.get_str("staleAfterHours") or self.getStaleAfterHours())
 
     def dumpConfig(self):
         config.set("power_info_width", str(self.power_info_width))
         config.set("power_info_height", str(self.power_info_height))
         config.set("cacheTime", str(self.cacheTime))
+        config.set("maxResidentSystems", str(self.maxResidentSystems))
         config.set("copyText", str(self.copyText.get()))
         config.set("reportOnFSDJump", bool(self.reportOnFSDJump.get()))
         config.set("discordHook", str(self.discordHook.get()))
@@ -40,6 +52,10 @@ class ConfigPlugin:
         config.set("never", bool(self.never))
         config.set("beta", bool(self.beta))
         config.set("hide_stats", bool(self.hide_stats.get()))
+        config.set("useSqlite", bool(self.useSqlite.get()))
+        config.set("durability", str(self.durability))
+        config.set("bagRemovalOrder", str(self.bagRemovalOrder))
+        config.set("staleAfterHours", str(self.staleAfterHours))
 
 class ConfigEncoder(json.JSONEncoder):
     def default(self, o):
@@ -0,0 +1,26 @@
+# core/cycle.py - PowerPlay weekly cycle helpers
+from datetime import datetime, timedelta, timezone
+
+# PowerPlay cycles tick over every Thursday at 07:00 UTC
+CYCLE_WEEKDAY = 3
+CYCLE_HOUR = 7
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse a journal timestamp ("2026-10-12T21:05:00Z") into an aware UTC datetime"""
+    return datetime.strptime(timestamp[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+
+
+def cycle_start(timestamp: str) -> datetime:
+    """Start of the PowerPlay cycle containing a journal timestamp"""
+    moment = parse_timestamp(timestamp)
+    tick = (moment - timedelta(days=(moment.weekday() - CYCLE_WEEKDAY) % 7)).replace(
+        hour=CYCLE_HOUR, minute=0, second=0, microsecond=0)
+    if tick > moment:
+        tick -= timedelta(days=7)
+    return tick
+
+
+def cycle_id(timestamp: str) -> str:
+    """Identify a cycle by the date it started on, e.g. "2026-10-15" """
+    return cycle_start(timestamp).strftime("%Y-%m-%d")
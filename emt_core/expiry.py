@@ -0,0 +1,66 @@
+# core/expiry.py - Time-ordered expiry of tracked entries
+from datetime import timedelta
+from heapq import heappush, heappop, heapify
+from .cycle import parse_timestamp
+
+
+def stale_cutoff(timestamp: str, max_age_hours: float) -> str:
+    """Journal timestamp max_age_hours before `timestamp`; entries collected earlier are stale"""
+    return (parse_timestamp(timestamp) - timedelta(hours=max_age_hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ExpiryQueue:
+    """Min-heap of (timestamp, key) giving the oldest entries first.
+
+    Timestamps are journal timestamps, which order correctly as strings.
+    Re-stamping or discarding a key leaves its old heap entry in place; such
+    entries are skipped when popped (their timestamp no longer matches) and the
+    heap is rebuilt once they outnumber the live ones.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._stamps = {}  # key -> current timestamp
+
+    def __len__(self):
+        return len(self._stamps)
+
+    def __contains__(self, key):
+        return key in self._stamps
+
+    def get(self, key, default=None):
+        """Current timestamp of a key"""
+        return self._stamps.get(key, default)
+
+    def items(self):
+        """(key, timestamp) pairs in no particular order"""
+        return self._stamps.items()
+
+    def touch(self, key, timestamp: str):
+        """Set a key's timestamp"""
+        if self._stamps.get(key) == timestamp:
+            return
+        self._stamps[key] = timestamp
+        heappush(self._heap, (timestamp, key))
+        if len(self._heap) > 2 * len(self._stamps) + 64:
+            self._heap = [(stamp, k) for k, stamp in self._stamps.items()]
+            heapify(self._heap)
+
+    def discard(self, key):
+        """Stop tracking a key"""
+        self._stamps.pop(key, None)
+
+    def clear(self):
+        self._heap.clear()
+        self._stamps.clear()
+
+    def pop_expired(self, cutoff: str) -> list:
+        """Remove and return the keys stamped before cutoff, oldest first"""
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] < cutoff:
+            timestamp, key = heappop(heap)
+            if self._stamps.get(key) == timestamp:
+                del self._stamps[key]
+                expired.append(key)
+        return expired
@@ -0,0 +1,349 @@
+"""
+Point-in-time State History
+
+Keeps periodic compact snapshots of the tracker's model state plus a log of
+the changes applied between them, keyed by journal timestamp. "What did the
+tracker believe at 2026-10-12 21:05" is answered by loading the nearest
+snapshot at or before that moment and replaying the short tail of its log
+instead of the whole history.
+
+On-disk layout (data/history/):
+    index.json                 - list of segments with their snapshot timestamps
+    snapshot-000001.json.gz    - full state at the start of a segment
+    log-000001.jsonl           - one change record per line until the next snapshot
+
+State and change records are plain dicts as produced by the models' to_dict():
+    {"systems": {name: dict}, "backpack": dict, "salvage": {name: dict}, "power": dict}
+A change record carries only the parts that changed; a None value for a
+system or salvage entry means it was removed.
+
+Command line usage (from the plugin directory, EDMC need not be running):
+    python -m emt_core.history --list
+    python -m emt_core.history --at "2026-10-12 21:05" [--system "Czerno"]
+    python -m emt_core.history --data-dir /path/to/data --list
+"""
+import argparse
+import bisect
+import gzip
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Callable
+
+from emt_core.logging import logger
+from emt_core.storage import get_data_dir
+
+HISTORY_DIR = "history"
+INDEX_FILE = "index.json"
+
+# Parts of the state that hold per-name entries (merged on replay); others are replaced whole
+KEYED_PARTS = ("systems", "salvage")
+
+
+def normalize_timestamp(value: str) -> str:
+    """
+    Normalize a user supplied time to the journal timestamp format.
+
+    Accepts "2026-10-12", "2026-10-12 21:05", "2026-10-12T21:05:30" and full
+    journal timestamps; missing parts are filled with zeros.
+
+    Returns:
+        Timestamp string like "2026-10-12T21:05:00Z"
+    """
+    text = value.strip().rstrip('Z').replace(' ', 'T')
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%dT%H", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised timestamp: {value}")
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in journal timestamp format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def apply_changes(state: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply one change record to a state dict in place and return it."""
+    for part, value in changes.items():
+        if part in KEYED_PARTS:
+            target = state.setdefault(part, {})
+            for name, entry in value.items():
+                if entry is None:
+                    target.pop(name, None)
+                else:
+                    target[name] = entry
+        else:
+            state[part] = value
+    return state
+
+
+class StateHistory:
+    """
+    Snapshot + change log store for model state.
+
+    Recording is disabled until attach() supplies a function that captures the
+    full current state; until then record() is a no-op so tests and tools that
+    drive journal_entry directly pay nothing.
+    """
+
+    def __init__(self, history_dir: Optional[str] = None, snapshot_interval: int = 1000, max_snapshots: int = 200):
+        """
+        Initialize history store.
+
+        Args:
+            history_dir: Directory for history files (default: data/history)
+            snapshot_interval: Change records per segment before a new snapshot is taken
+            max_snapshots: Number of segments kept; older ones are deleted
+        """
+        self._history_dir = history_dir
+        self._dir_ready = False
+        self.snapshot_interval = snapshot_interval
+        self.max_snapshots = max_snapshots
+        self.capture_state: Optional[Callable[[], Dict[str, Any]]] = None
+        self._segments: Optional[List[Dict[str, Any]]] = None
+        self._pending: List[str] = []
+        self._segment_records = 0
+        self.last_timestamp: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.capture_state is not None
+
+    @property
+    def history_dir(self) -> str:
+        if not self._dir_ready:
+            if self._history_dir is None:
+                self._history_dir = os.path.join(get_data_dir(), HISTORY_DIR)
+            os.makedirs(self._history_dir, exist_ok=True)
+            self._dir_ready = True
+        return self._history_dir
+
+    def attach(self, capture_state: Callable[[], Dict[str, Any]]):
+        """Enable recording; capture_state returns the full current state dict."""
+        self.capture_state = capture_state
+
+    # ----- index -----
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        if self._segments is None:
+            path = os.path.join(self.history_dir, INDEX_FILE)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._segments = json.load(f).get("segments", [])
+            except FileNotFoundError:
+                self._segments = []
+            except Exception as e:
+                logger.error(f"Failed to read history index: {e}")
+                self._segments = []
+        return self._segments
+
+    def _save_index(self):
+        path = os.path.join(self.history_dir, INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"segments": self.segments}, f)
+        os.replace(temp_path, path)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.history_dir, name)
+
+    # ----- writing -----
+
+    def record(self, timestamp: Optional[str], event: str, changes: Dict[str, Any]):
+        """
+        Record the state changes caused by one journal event.
+
+        Args:
+            timestamp: Journal timestamp of the event
+            event: Journal event name (kept for auditing)
+            changes: Partial state dict with the changed parts only
+        """
+        if not self.enabled or not changes:
+            return
+        if not self.segments:
+            self.snapshot(timestamp)
+        timestamp = timestamp or self.last_timestamp or utc_timestamp()
+        self.last_timestamp = timestamp
+        self._pending.append(json.dumps({"ts": timestamp, "event": event, "changes": changes},
+                                        separators=(',', ':')))
+        self._segment_records += 1
+        if self._segment_records >= self.snapshot_interval:
+            self.snapshot(timestamp)
+
+    def flush(self):
+        """Append buffered change records to the current segment log."""
+        if not self._pending or not self.segments:
+            return
+        try:
+            with open(self._path(self.segments[-1]["log"]), "a", encoding="utf-8") as f:
+                f.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+        except Exception as e:
+            logger.error(f"Failed to write history log: {e}")
+
+    def snapshot(self, timestamp: Optional[str] = None) -> bool:
+        """
+        Write a full snapshot of the current state and start a new segment.
+
+        Args:
+            timestamp: Journal timestamp the snapshot represents (default: last seen or now)
+
+        Returns:
+            True if the snapshot was written
+        """
+        if not self.enabled:
+            return False
+        self.flush()
+        timestamp = timestamp or self.last_timestamp or utc_timestamp()
+        # Never key a snapshot before the segment it follows; replay relies on ordering
+        if self.segments and timestamp < self.segments[-1]["timestamp"]:
+            timestamp = self.segments[-1]["timestamp"]
+        seq = self.segments[-1]["seq"] + 1 if self.segments else 1
+        segment = {
+            "seq": seq,
+            "timestamp": timestamp,
+            "snapshot": f"snapshot-{seq:06d}.json.gz",
+            "log": f"log-{seq:06d}.jsonl",
+        }
+        try:
+            payload = json.dumps({"timestamp": timestamp, "state": self.capture_state()}, separators=(',', ':'))
+            with gzip.open(self._path(segment["snapshot"]), "wt", encoding="utf-8") as f:
+                f.write(payload)
+            self.segments.append(segment)
+            self._prune()
+            self._save_index()
+        except Exception as e:
+            logger.error(f"Failed to write history snapshot: {e}")
+            return False
+        self._segment_records = 0
+        self.last_timestamp = timestamp
+        return True
+
+    def _prune(self):
+        """Delete the oldest segments beyond max_snapshots."""
+        while len(self.segments) > self.max_snapshots:
+            old = self.segments.pop(0)
+            for name in (old["snapshot"], old["log"]):
+                try:
+                    os.remove(self._path(name))
+                except FileNotFoundError:
+                    pass
+
+    # ----- querying -----
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """Return segment metadata (seq, timestamp, file names), oldest first."""
+        return [dict(s) for s in self.segments]
+
+    def _load_snapshot(self, segment: Dict[str, Any]) -> Dict[str, Any]:
+        with gzip.open(self._path(segment["snapshot"]), "rt", encoding="utf-8") as f:
+            return json.load(f)["state"]
+
+    def _log_records(self, segment: Dict[str, Any]):
+        path = self._path(segment["log"])
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        if segment is self.segments[-1]:
+            for line in self._pending:
+                yield json.loads(line)
+
+    def state_at(self, timestamp: str) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the state as of a moment.
+
+        Args:
+            timestamp: Journal timestamp or a value accepted by normalize_timestamp
+
+        Returns:
+            State dict, or None if the moment predates the oldest snapshot
+        """
+        target = normalize_timestamp(timestamp)
+        keys = [s["timestamp"] for s in self.segments]
+        index = bisect.bisect_right(keys, target) - 1
+        if index < 0:
+            return None
+        segment = self.segments[index]
+        state = self._load_snapshot(segment)
+        for record in self._log_records(segment):
+            if record["ts"] > target:
+                break
+            apply_changes(state, record["changes"])
+        return state
+
+    def system_at(self, system_name: str, timestamp: str) -> Optional[Dict[str, Any]]:
+        """Return one system's dict as of a moment, or None if it was not tracked."""
+        state = self.state_at(timestamp)
+        if state is None:
+            return None
+        return state.get("systems", {}).get(system_name)
+
+    def changes_between(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """Return change records with start <= ts <= end for auditing."""
+        start, end = normalize_timestamp(start), normalize_timestamp(end)
+        keys = [s["timestamp"] for s in self.segments]
+        first = max(0, bisect.bisect_right(keys, start) - 1)
+        records = []
+        for segment in self.segments[first:]:
+            if segment["timestamp"] > end:
+                break
+            for record in self._log_records(segment):
+                if start <= record["ts"] <= end:
+                    records.append(record)
+        return records
+
+
+# Global instance
+state_history = StateHistory()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Query EliteMeritTracker state history")
+    parser.add_argument("--data-dir", help="plugin data directory holding history/ (default: the plugin's data/)")
+    parser.add_argument("--dir", help="history directory (overrides --data-dir)")
+    parser.add_argument("--list", action="store_true", help="list snapshots")
+    parser.add_argument("--at", help='moment to rebuild, e.g. "2026-10-12 21:05"')
+    parser.add_argument("--system", help="only show this system")
+    parser.add_argument("--changes", nargs=2, metavar=("START", "END"), help="list change records in a range")
+    args = parser.parse_args(argv)
+
+    history_dir = args.dir
+    if history_dir is None and args.data_dir:
+        history_dir = os.path.join(args.data_dir, HISTORY_DIR)
+    history = StateHistory(history_dir=history_dir)
+
+    if args.list:
+        for segment in history.list_snapshots():
+            print(f"{segment['seq']:>6}  {segment['timestamp']}")
+        return 0
+
+    if args.changes:
+        for record in history.changes_between(*args.changes):
+            print(json.dumps(record))
+        return 0
+
+    if args.at:
+        state = history.state_at(args.at)
+        if state is None:
+            print(f"No snapshot at or before {args.at}", file=sys.stderr)
+            return 1
+        if args.system:
+            state = state.get("systems", {}).get(args.system)
+            if state is None:
+                print(f"{args.system} not tracked at {args.at}", file=sys.stderr)
+                return 1
+        print(json.dumps(state, indent=2))
+        return 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
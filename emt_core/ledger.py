@@ -0,0 +1,351 @@
+"""
+Merit Ledger
+
+Append-only record of every merit credited to a system. StarSystem.Merits is
+zeroed when a system is reported or the tracker is reset; the ledger keeps
+the individual credits so totals for any system, day, PowerPlay cycle or
+source can still be answered afterwards.
+
+On-disk layout (data/ledger/):
+    index.json            - per segment: row count, first/last timestamp and
+                            totals per system, day, cycle, source and power
+    ledger-000001.csv     - one row per credit: timestamp,system,source,amount,power
+
+Segments rotate after segment_rows rows. Single-dimension totals are answered
+from the index alone; range and multi-filter queries only read the segments
+the index cannot rule out.
+
+A flush appends to the segment and syncs it before the index is replaced, and
+the index records each segment's size. On load, a segment whose size differs
+from the index (rows written after the last index save, or an index that
+outlived unsynced rows) has its entry rebuilt from the file.
+"""
+import csv
+import io
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Iterator
+
+from emt_core.cycle import cycle_id
+from emt_core.logging import logger
+from emt_core.storage import get_data_dir, get_durability, DURABILITY_NONE
+
+LEDGER_DIR = "ledger"
+INDEX_FILE = "index.json"
+
+# Merit sources
+SOURCE_COMBAT = "combat"          # PowerplayMerits credited to the current system
+SOURCE_DATA = "data"              # Data hand-in distributed over collection systems
+SOURCE_SALVAGE = "salvage"        # Search and Rescue salvage distributed over collection systems
+SOURCE_CARGO = "cargo"            # Cargo delivery with the reduction formula applied
+SOURCE_CORRECTION = "correction"  # Retroactive duplicate correction (negative amount)
+
+FIELDS = ("timestamp", "system", "source", "amount", "power")
+DIMENSIONS = ("system", "day", "cycle", "source", "power")
+
+
+def _row_keys(timestamp: str, system: str, source: str, power: str) -> Dict[str, str]:
+    return {"system": system, "day": timestamp[:10], "cycle": cycle_id(timestamp),
+            "source": source, "power": power}
+
+
+def _empty_totals() -> Dict[str, Dict[str, int]]:
+    return {dimension: {} for dimension in DIMENSIONS}
+
+
+def _add_totals(target: Dict[str, Dict[str, int]], source: Dict[str, Dict[str, int]]):
+    for dimension, values in source.items():
+        bucket = target.setdefault(dimension, {})
+        for key, amount in values.items():
+            bucket[key] = bucket.get(key, 0) + amount
+
+
+class MeritLedger:
+    """
+    Segment-rotated append-only merit ledger with an aggregate index.
+
+    Recording is disabled until open() is called so tests and tools that drive
+    journal_entry directly do not write ledger files.
+    """
+
+    def __init__(self, ledger_dir: Optional[str] = None, segment_rows: int = 50_000):
+        """
+        Initialize ledger.
+
+        Args:
+            ledger_dir: Directory for ledger files (default: data/ledger)
+            segment_rows: Rows per segment file before a new one is started
+        """
+        self._ledger_dir = ledger_dir
+        self._dir_ready = False
+        self.segment_rows = segment_rows
+        self.enabled = False
+        self._segments: Optional[List[Dict[str, Any]]] = None
+        self._totals: Optional[Dict[str, Dict[str, int]]] = None
+        self._pending: List[List[Any]] = []
+        # record() runs on the main thread, flush() also on the autosave timer
+        self._lock = threading.RLock()
+
+    @property
+    def ledger_dir(self) -> str:
+        if not self._dir_ready:
+            if self._ledger_dir is None:
+                self._ledger_dir = os.path.join(get_data_dir(), LEDGER_DIR)
+            os.makedirs(self._ledger_dir, exist_ok=True)
+            self._dir_ready = True
+        return self._ledger_dir
+
+    def open(self):
+        """Enable recording."""
+        self.enabled = True
+
+    # ----- index -----
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        if self._segments is None:
+            path = os.path.join(self.ledger_dir, INDEX_FILE)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._segments = json.load(f).get("segments", [])
+            except FileNotFoundError:
+                self._segments = []
+            except Exception as e:
+                logger.error(f"Failed to read ledger index: {e}")
+                self._segments = []
+            self._recover()
+        return self._segments
+
+    def _save_index(self):
+        path = os.path.join(self.ledger_dir, INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"segments": self.segments}, f, separators=(',', ':'))
+            if get_durability() != DURABILITY_NONE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _recover(self):
+        """Rebuild index entries that do not match their segment files."""
+        known = {segment["file"] for segment in self._segments}
+        for name in sorted(os.listdir(self.ledger_dir)):
+            if name.startswith("ledger-") and name.endswith(".csv") and name not in known:
+                # Segment started but never indexed
+                self._segments.append({"seq": int(name[7:-4]), "file": name, "bytes": None})
+        self._segments.sort(key=lambda segment: segment["seq"])
+
+        rebuilt = False
+        for segment in self._segments:
+            path = self._path(segment["file"])
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if size != segment.get("bytes"):
+                self._rebuild_segment(segment)
+                rebuilt = True
+        if rebuilt:
+            try:
+                self._save_index()
+            except Exception as e:
+                logger.error(f"Failed to save rebuilt ledger index: {e}")
+
+    def _rebuild_segment(self, segment: Dict[str, Any]):
+        """Recompute a segment's rows, range and totals from its file, cutting off a torn last row."""
+        path = self._path(segment["file"])
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(end)
+
+        segment.update(rows=0, first=None, last=None, totals=_empty_totals(), bytes=end)
+        for row in csv.reader(io.StringIO(data[:end].decode("utf-8"), newline="")):
+            if len(row) != len(FIELDS):
+                continue
+            timestamp, system, source, amount, power = row[0], row[1], row[2], int(row[3]), row[4]
+            segment["rows"] += 1
+            segment["first"] = segment["first"] or timestamp
+            segment["last"] = max(segment["last"] or timestamp, timestamp)
+            for dimension, key in _row_keys(timestamp, system, source, power).items():
+                bucket = segment["totals"][dimension]
+                bucket[key] = bucket.get(key, 0) + amount
+        logger.warning(f"Rebuilt merit ledger index entry for {segment['file']} ({segment['rows']} rows)")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.ledger_dir, name)
+
+    def _new_segment(self) -> Dict[str, Any]:
+        seq = self.segments[-1]["seq"] + 1 if self.segments else 1
+        segment = {"seq": seq, "file": f"ledger-{seq:06d}.csv", "rows": 0, "bytes": 0,
+                   "first": None, "last": None, "totals": _empty_totals()}
+        self.segments.append(segment)
+        return segment
+
+    @property
+    def totals(self) -> Dict[str, Dict[str, int]]:
+        """Totals over the whole ledger per dimension, kept up to date by record()."""
+        if self._totals is None:
+            self._totals = _empty_totals()
+            for segment in self.segments:
+                _add_totals(self._totals, segment["totals"])
+        return self._totals
+
+    # ----- writing -----
+
+    def record(self, timestamp: str, system: str, source: str, amount: int, power: str = ""):
+        """
+        Record one merit credit.
+
+        Args:
+            timestamp: Journal timestamp of the event that credited the merits
+            system: System the merits were credited to
+            source: One of the SOURCE_* constants
+            amount: Merits credited (negative for corrections)
+            power: Pledged power at the time
+        """
+        if not self.enabled or not amount or not timestamp:
+            return
+        with self._lock:
+            segment = self.segments[-1] if self.segments else self._new_segment()
+            if segment["rows"] >= self.segment_rows:
+                self.flush()
+                segment = self._new_segment()
+
+            self._pending.append([timestamp, system, source, amount, power or ""])
+            segment["rows"] += 1
+            segment["first"] = segment["first"] or timestamp
+            segment["last"] = max(segment["last"] or timestamp, timestamp)
+            totals = self.totals
+            for dimension, key in _row_keys(timestamp, system, source, power or "").items():
+                for bucket in (segment["totals"][dimension], totals[dimension]):
+                    bucket[key] = bucket.get(key, 0) + amount
+
+    def flush(self):
+        """Append buffered rows to the current segment file, sync it, then save the index."""
+        with self._lock:
+            if not self._pending or not self.segments:
+                return
+            try:
+                segment = self.segments[-1]
+                buffer = io.StringIO()
+                csv.writer(buffer, lineterminator="\n").writerows(self._pending)
+                with open(self._path(segment["file"]), "a", encoding="utf-8", newline="") as f:
+                    f.write(buffer.getvalue())
+                    f.flush()
+                    if get_durability() != DURABILITY_NONE:
+                        os.fsync(f.fileno())
+                    segment["bytes"] = os.fstat(f.fileno()).st_size
+                self._pending.clear()
+                self._save_index()
+            except Exception as e:
+                logger.error(f"Failed to write merit ledger: {e}")
+
+    # ----- querying -----
+
+    def _segment_rows(self, segment: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        path = self._path(segment["file"])
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                for row in csv.reader(f):
+                    if len(row) == len(FIELDS):
+                        yield {"timestamp": row[0], "system": row[1], "source": row[2],
+                               "amount": int(row[3]), "power": row[4]}
+        if segment is self.segments[-1]:
+            for row in self._pending:
+                yield dict(zip(FIELDS, row))
+
+    def rows(self, start: Optional[str] = None, end: Optional[str] = None,
+             **filters: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate ledger rows with start <= timestamp <= end matching all filters.
+
+        Args:
+            start: Earliest journal timestamp (inclusive)
+            end: Latest journal timestamp (inclusive)
+            **filters: Dimension values to match, e.g. system="Sol", source="data"
+
+        Returns:
+            Iterator over row dicts (timestamp, system, source, amount, power)
+        """
+        for segment in self.segments:
+            if not segment["rows"]:
+                continue
+            if (start and segment["last"] < start) or (end and segment["first"] > end):
+                continue
+            if any(value not in segment["totals"][dimension] for dimension, value in filters.items()):
+                continue
+            for row in self._segment_rows(segment):
+                if (start and row["timestamp"] < start) or (end and row["timestamp"] > end):
+                    continue
+                keys = _row_keys(row["timestamp"], row["system"], row["source"], row["power"])
+                if all(keys[dimension] == value for dimension, value in filters.items()):
+                    yield row
+
+    def totals_by(self, dimension: str, start: Optional[str] = None,
+                  end: Optional[str] = None) -> Dict[str, int]:
+        """
+        Merit totals grouped by one dimension, optionally within a time range.
+
+        Segments entirely inside the range are answered from the index; only
+        the segments straddling start or end are read.
+
+        Args:
+            dimension: One of "system", "day", "cycle", "source", "power"
+            start: Earliest journal timestamp (inclusive)
+            end: Latest journal timestamp (inclusive)
+
+        Returns:
+            Dict of key -> merit total
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown ledger dimension: {dimension}")
+        if start is None and end is None:
+            return dict(self.totals[dimension])
+
+        result: Dict[str, int] = {}
+        for segment in self.segments:
+            if not segment["rows"]:
+                continue
+            if (start and segment["last"] < start) or (end and segment["first"] > end):
+                continue
+            if (not start or segment["first"] >= start) and (not end or segment["last"] <= end):
+                for key, amount in segment["totals"][dimension].items():
+                    result[key] = result.get(key, 0) + amount
+                continue
+            for row in self._segment_rows(segment):
+                if (start and row["timestamp"] < start) or (end and row["timestamp"] > end):
+                    continue
+                key = _row_keys(row["timestamp"], row["system"], row["source"], row["power"])[dimension]
+                result[key] = result.get(key, 0) + row["amount"]
+        return result
+
+    def total(self, **filters: str) -> int:
+        """
+        Total merits matching all filters.
+
+        A single filter (or none) is answered from the index; several filters
+        read only the segments whose index contains every requested value.
+
+        Args:
+            **filters: Dimension values, e.g. system="Sol", cycle="2026-10-15"
+
+        Returns:
+            Merit total
+        """
+        unknown = set(filters) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown ledger dimension: {', '.join(sorted(unknown))}")
+        if not filters:
+            return sum(self.totals["source"].values())
+        if len(filters) == 1:
+            (dimension, value), = filters.items()
+            return self.totals[dimension].get(value, 0)
+        return sum(row["amount"] for row in self.rows(**filters))
+
+
+# Global instance
+merit_ledger = MeritLedger()
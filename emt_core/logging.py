@@ -1,7 +1,11 @@
 # core/logging.py
 import logging
 import os
-from config import appname
+try:
+    from config import appname
+except ImportError:
+    # Standalone tools (python -m emt_core.history) run outside EDMC
+    appname = "EDMarketConnector"
 
 
 class EDMCLogRecordFilter(logging.Filter):
@@ -0,0 +1,63 @@
+# core/schema.py - Versioned schema header and single-pass migration for data files
+from emt_core.logging import logger
+
+# Data files are stored as {"_schema": <version>, "data": <document>}.
+# Files without the header predate versioning and count as version 1.
+SCHEMA_KEY = "_schema"
+DATA_KEY = "data"
+LEGACY_VERSION = 1
+
+_versions = {}    # filename -> current schema version
+_migrations = {}  # filename -> {from_version: migrate(document) -> document}
+
+
+def register_schema(filename: str, version: int):
+    """Declare the current schema version a model writes for a data file"""
+    _versions[filename] = version
+
+
+def register_migration(filename: str, from_version: int):
+    """Decorator registering a function that upgrades a document from from_version to from_version + 1"""
+    def decorator(func):
+        _migrations.setdefault(filename, {})[from_version] = func
+        return func
+    return decorator
+
+
+def current_version(filename: str):
+    """Current schema version for a file, or None if it is not versioned"""
+    return _versions.get(filename)
+
+
+def wrap(filename: str, data):
+    """Add the schema header to a document before it is written"""
+    return {SCHEMA_KEY: _versions[filename], DATA_KEY: data}
+
+
+def unwrap(document):
+    """Split a stored document into (version, data)"""
+    if isinstance(document, dict) and SCHEMA_KEY in document and DATA_KEY in document:
+        return int(document[SCHEMA_KEY]), document[DATA_KEY]
+    return LEGACY_VERSION, document
+
+
+def migrate(filename: str, version: int, data):
+    """Upgrade a document from version to the current version in one pass per step.
+
+    Returns:
+        The migrated document
+
+    Raises:
+        ValueError: if the file is newer than this plugin or a step is missing
+    """
+    target = _versions[filename]
+    if version > target:
+        raise ValueError(f"{filename} has schema version {version}, newer than supported {target}")
+    steps = _migrations.get(filename, {})
+    while version < target:
+        if version not in steps:
+            raise ValueError(f"No migration for {filename} from schema version {version}")
+        data = steps[version](data)
+        version += 1
+    logger.info(f"Migrated {filename} to schema version {target}")
+    return data
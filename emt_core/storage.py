@@ -2,11 +2,31 @@
 import json
 import os
 import shutil
+import threading
+import time
+from contextlib import contextmanager
 from emt_core.logging import logger
+from emt_core.schema import current_version, wrap, unwrap, migrate, LEGACY_VERSION
 
 # Data directory for JSON files
 DATA_DIR = "data"
 
+# Data files older versions kept in the plugin root, moved to data/ once
+LEGACY_DATA_FILES = ("systems.json", "power.json", "backpack.json", "salvage.json")
+LEGACY_MARKER = ".legacy_migration"
+LEGACY_MIGRATION_VERSION = 1
+
+# Durability modes for save_json
+DURABILITY_NONE = "none"                   # rename only; fastest, a crash can lose recent writes
+DURABILITY_FSYNC_FILE = "fsync-file"       # fsync file contents before the rename
+DURABILITY_FSYNC_DIR = "fsync-file-and-dir"  # also fsync the directory so the rename itself is durable
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_FSYNC_FILE, DURABILITY_FSYNC_DIR)
+
+_durability = DURABILITY_FSYNC_FILE
+_local = threading.local()  # .group: {filepath: temp_path} while this thread has a group commit open
+_save_stats = {}
+_data_dirs = {}  # plugin dir -> data dir, created once
+
 
 def get_plugin_dir():
     """Get the plugin directory path (parent of core/)"""
@@ -14,10 +34,13 @@ def get_plugin_dir():
 
 
 def get_data_dir():
-    """Get the data directory path, creating it if needed"""
-    data_path = os.path.join(get_plugin_dir(), DATA_DIR)
-    if not os.path.exists(data_path):
-        os.makedirs(data_path)
+    """Get the data directory path, creating it on first use"""
+    plugin_dir = get_plugin_dir()
+    data_path = _data_dirs.get(plugin_dir)
+    if data_path is None:
+        data_path = os.path.join(plugin_dir, DATA_DIR)
+        os.makedirs(data_path, exist_ok=True)
+        _data_dirs[plugin_dir] = data_path
     return data_path
 
 
@@ -43,16 +66,168 @@ def _migrate_legacy_file(filename: str) -> bool:
     return False
 
 
+def run_legacy_migration(cleanup=None) -> bool:
+    """Move data files from the plugin root into data/ and run cleanup, once per install.
+
+    Completion is recorded in data/.legacy_migration so later starts skip the
+    checks entirely. Bump LEGACY_MIGRATION_VERSION when new legacy paths are
+    added to make it run again.
+
+    Args:
+        cleanup: Optional callable run after the data files are moved (e.g. removing old modules)
+
+    Returns:
+        True if the migration ran, False if it was already done
+    """
+    marker = os.path.join(get_data_dir(), LEGACY_MARKER)
+    try:
+        with open(marker, "r", encoding="utf-8") as f:
+            if int(json.load(f).get("version", 0)) >= LEGACY_MIGRATION_VERSION:
+                return False
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    for filename in LEGACY_DATA_FILES:
+        _migrate_legacy_file(filename)
+    if cleanup is not None:
+        cleanup()
+
+    from datetime import datetime, timezone
+    try:
+        with open(marker, "w", encoding="utf-8") as f:
+            json.dump({"version": LEGACY_MIGRATION_VERSION,
+                       "completed": datetime.now(timezone.utc).isoformat()}, f)
+    except OSError as e:
+        logger.warning(f"Failed to record legacy migration: {e}")
+    logger.info("Legacy file migration complete")
+    return True
+
+
 def get_file_path(filename: str) -> str:
     """Get full path to a JSON file in the data directory.
 
-    Automatically migrates legacy files from plugin root to data/ folder.
+    Legacy files in the plugin root are moved once at startup by
+    run_legacy_migration(), so this is a plain path join.
     """
-    # Check for and migrate legacy files from plugin root
-    _migrate_legacy_file(filename)
     return os.path.join(get_data_dir(), filename)
 
 
+def get_durability() -> str:
+    return _durability
+
+
+def set_durability(mode: str):
+    """Select how hard save_json works to make writes survive a crash or power loss"""
+    global _durability
+    if mode not in DURABILITY_MODES:
+        logger.warning(f"Unknown durability mode {mode}, using {DURABILITY_FSYNC_FILE}")
+        mode = DURABILITY_FSYNC_FILE
+    _durability = mode
+
+
+def _fsync_path(path: str):
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: str):
+    """fsync a directory so renames inside it are durable (not supported on Windows)"""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _record_save(write_ns: int, fsync_ns: int, total_ns: int, files: int = 1, group: bool = False):
+    stats = _save_stats.setdefault(_durability, {"saves": 0, "groups": 0, "write_ns": 0,
+                                                 "fsync_ns": 0, "total_ns": 0, "max_ns": 0})
+    stats["saves"] += files
+    stats["groups"] += 1 if group else 0
+    stats["write_ns"] += write_ns
+    stats["fsync_ns"] += fsync_ns
+    stats["total_ns"] += total_ns
+    stats["max_ns"] = max(stats["max_ns"], total_ns)
+
+
+def get_save_stats() -> dict:
+    """Save timings per durability mode: saves, groups and write/fsync/total/max milliseconds"""
+    return {
+        mode: {
+            "saves": stats["saves"],
+            "groups": stats["groups"],
+            "write_ms": stats["write_ns"] / 1e6,
+            "fsync_ms": stats["fsync_ns"] / 1e6,
+            "total_ms": stats["total_ns"] / 1e6,
+            "max_ms": stats["max_ns"] / 1e6,
+        }
+        for mode, stats in _save_stats.items()
+    }
+
+
+def reset_save_stats():
+    _save_stats.clear()
+
+
+@contextmanager
+def group_commit():
+    """Batch save_json calls so they share one durability barrier.
+
+    Saves inside the block only write their temp files. On exit all temp files
+    are fsynced together, renamed into place, and each directory is fsynced
+    once, so N files cost one directory barrier instead of N.
+
+    The group belongs to the calling thread, so an autosave on another
+    thread is neither deferred into nor committed by it. A file saved twice
+    in one group is written once, with the last data.
+    """
+    if getattr(_local, "group", None) is not None:
+        # Nested: the outer group commits
+        yield
+        return
+    _local.group = {}
+    try:
+        yield
+    finally:
+        group, _local.group = _local.group, None
+        _commit_group([(temp_path, filepath) for filepath, temp_path in group.items()])
+
+
+def _commit_group(pending):
+    if not pending:
+        return
+    start = time.perf_counter_ns()
+    fsync_ns = 0
+    committed = []
+    if _durability != DURABILITY_NONE:
+        for temp_path, filepath in pending:
+            try:
+                _fsync_path(temp_path)
+            except OSError as e:
+                logger.warning(f"Failed to fsync {temp_path}: {e}")
+        fsync_ns = time.perf_counter_ns() - start
+    for temp_path, filepath in pending:
+        try:
+            os.replace(temp_path, filepath)
+            committed.append(filepath)
+        except Exception as e:
+            logger.error(f"Failed to save {os.path.basename(filepath)}: {e}", exc_info=True)
+    if _durability == DURABILITY_FSYNC_DIR:
+        dir_start = time.perf_counter_ns()
+        for directory in {os.path.dirname(path) for path in committed}:
+            try:
+                _fsync_dir(directory)
+            except OSError as e:
+                logger.warning(f"Failed to fsync {directory}: {e}")
+        fsync_ns += time.perf_counter_ns() - dir_start
+    _record_save(0, fsync_ns, time.perf_counter_ns() - start, files=0, group=True)
+
+
 def load_json(filename: str, default=None):
     """Load JSON file with error handling.
 
@@ -89,23 +264,29 @@ def save_json(filename: str, data, encoder=None, indent=4, create_backup=False)
     """Save data to JSON file with atomic write to prevent corruption.
 
     Uses temp file + rename pattern to ensure atomicity. If save fails mid-write,
-    the original file remains intact.
+    the original file remains intact. How much is fsynced depends on the
+    durability mode (see set_durability); inside group_commit() the rename and
+    fsyncs are deferred to the end of the group.
 
     Args:
         filename: Name of the JSON file in plugin directory
         data: Data to save (must be JSON serializable)
         encoder: Optional custom JSON encoder class
         indent: JSON indentation level (default 4)
-        create_backup: If True, creates .backup file before overwriting (default False)
-                      Only used during plugin updates for safety
+        create_backup: If True, snapshots the current file into data/backups/ before
+                      overwriting (default False). Only used during plugin updates for safety
 
     Returns:
         True if save succeeded, False otherwise
     """
     filepath = get_file_path(filename)
-    temp_path = filepath + ".tmp"
-    backup_path = filepath + ".backup"
+    group = getattr(_local, "group", None)
+    # Per-thread temp name: concurrent saves of one file never share it, and a
+    # second save in the same group simply rewrites the pending temp file
+    temp_path = f"{filepath}.{threading.get_ident()}.tmp"
 
+    start = time.perf_counter_ns()
+    fsync_ns = 0
     try:
         # Write to temporary file first
         with open(temp_path, "w", encoding="utf-8") as f:
@@ -113,23 +294,39 @@ def save_json(filename: str, data, encoder=None, indent=4, create_backup=False)
                 json.dump(data, f, cls=encoder, indent=indent)
             else:
                 json.dump(data, f, indent=indent)
+            if _durability != DURABILITY_NONE and group is None:
+                f.flush()
+                fsync_start = time.perf_counter_ns()
+                os.fsync(f.fileno())
+                fsync_ns = time.perf_counter_ns() - fsync_start
+        write_ns = time.perf_counter_ns() - start - fsync_ns
 
-        # Create backup of existing file before overwriting (only if requested)
+        # Snapshot existing file before overwriting (only if requested)
         if create_backup and os.path.exists(filepath):
-            try:
-                shutil.copy2(filepath, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            except Exception as backup_error:
-                logger.warning(f"Failed to create backup of {filename}: {backup_error}")
+            from emt_core.backups import backup_store
+            if backup_store.snapshot(label=filename.replace(".", "-"), filenames=[filename]) is None:
+                logger.warning(f"Failed to create backup of {filename}")
                 # Continue anyway - temp file write succeeded
 
+        if group is not None:
+            group[filepath] = temp_path
+            _record_save(write_ns, 0, time.perf_counter_ns() - start)
+            return True
+
         # Atomic rename (replaces existing file)
         # On Windows, os.replace() is atomic if temp and target are on same drive
         os.replace(temp_path, filepath)
+        if _durability == DURABILITY_FSYNC_DIR:
+            fsync_start = time.perf_counter_ns()
+            _fsync_dir(os.path.dirname(filepath))
+            fsync_ns += time.perf_counter_ns() - fsync_start
+        _record_save(write_ns, fsync_ns, time.perf_counter_ns() - start)
         return True
 
     except Exception as e:
         logger.error(f"Failed to save {filename}: {e}", exc_info=True)
+        if group is not None:
+            group.pop(filepath, None)
         # Clean up temp file if it exists
         try:
             if os.path.exists(temp_path):
@@ -137,3 +334,348 @@ def save_json(filename: str, data, encoder=None, indent=4, create_backup=False)
         except Exception:
             pass
         return False
+
+
+# ============================================================
+# Optional SQLite backend
+# ============================================================
+#
+# Stores the systems, backpack and salvage documents as rows so a save only
+# touches rows that changed. Documents keep the exact shape save_json would
+# write, so JSON files remain the import/export format. The schema version of
+# each document is kept in the meta table ("schema:<filename>").
+
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+SQLITE_FILENAME = "tracker.db"
+
+# Documents the SQLite backend stores as rows; anything else stays JSON
+SQLITE_DOCUMENTS = ("systems.json", "backpack.json", "salvage.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS systems (name TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS bag_items (
+    bag TEXT NOT NULL, item TEXT NOT NULL, system TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (bag, item, system)
+);
+CREATE TABLE IF NOT EXISTS salvage (
+    system TEXT NOT NULL, cargo TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (system, cargo)
+);
+"""
+
+# SQLite equivalent of each save_json durability mode
+_SQLITE_SYNCHRONOUS = {
+    DURABILITY_NONE: "OFF",
+    DURABILITY_FSYNC_FILE: "NORMAL",
+    DURABILITY_FSYNC_DIR: "FULL",
+}
+
+# Per document: table, key columns, value column
+_TABLES = {
+    "systems.json": ("systems", ("name",), "data"),
+    "backpack.json": ("bag_items", ("bag", "item", "system"), "count"),
+    "salvage.json": ("salvage", ("system", "cargo"), "count"),
+}
+
+
+def _document_to_rows(filename: str, data, encoder=None) -> dict:
+    """Flatten a JSON document into {key_tuple: value} rows."""
+    rows = {}
+    if filename == "systems.json":
+        for name, system in data.items():
+            rows[(name,)] = json.dumps(system, cls=encoder, separators=(',', ':'))
+    elif filename == "backpack.json":
+        for bag, items in data.items():
+            for item, systems in items.items():
+                for system, count in systems.items():
+                    rows[(bag, item, system)] = count
+    elif filename == "salvage.json":
+        for system, salvage in data.items():
+            for cargo, entry in salvage.get("inventory", {}).items():
+                rows[(system, cargo)] = entry.get("count", 0)
+    return rows
+
+
+def _rows_to_document(filename: str, rows: dict):
+    """Rebuild a JSON document from {key_tuple: value} rows."""
+    data = {}
+    if filename == "systems.json":
+        for (name,), system in rows.items():
+            data[name] = json.loads(system)
+    elif filename == "backpack.json":
+        data = {"umbag": {}, "reinfbag": {}, "acqbag": {}}
+        for (bag, item, system), count in rows.items():
+            data.setdefault(bag, {}).setdefault(item, {})[system] = count
+    elif filename == "salvage.json":
+        for (system, cargo), count in rows.items():
+            salvage = data.setdefault(system, {"system_name": system, "inventory": {}})
+            salvage["inventory"][cargo] = {"name": cargo, "count": count}
+    return data
+
+
+class SQLiteStore:
+    """Row-level SQLite storage for the systems, backpack and salvage documents.
+
+    Keeps the last saved rows per document in memory and only upserts changed
+    rows and deletes removed ones, all inside a single transaction per save.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.path.join(get_data_dir(), SQLITE_FILENAME)
+        self._conn = None
+        self._saved = {}  # filename -> {key_tuple: value} as last written
+        # The connection and _saved are shared by the main thread and the autosave timer
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self):
+        with self._lock:
+            if self._conn is None:
+                import sqlite3
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(f"PRAGMA synchronous={_SQLITE_SYNCHRONOUS[_durability]}")
+                self._conn.executescript(_SCHEMA)
+            return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_meta(self, key: str, default=None):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                              "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def _load_rows(self, filename: str) -> dict:
+        table, keys, value = _TABLES[filename]
+        with self._lock:
+            cursor = self.conn.execute(f"SELECT {', '.join(keys)}, {value} FROM {table}")
+            n = len(keys)
+            return {tuple(row[:n]): row[n] for row in cursor}
+
+    def load_document(self, filename: str):
+        """Load a document in the same shape load_json would return."""
+        with self._lock:
+            rows = self._load_rows(filename)
+            self._saved[filename] = rows
+        return _rows_to_document(filename, rows)
+
+    def save_document(self, filename: str, data, encoder=None) -> int:
+        """Save a document, writing only rows that changed.
+
+        Returns:
+            Number of rows upserted or deleted
+        """
+        table, keys, value = _TABLES[filename]
+        new_rows = _document_to_rows(filename, data, encoder)
+        # Diff and write under one lock so a concurrent save can't interleave with _saved
+        with self._lock:
+            old_rows = self._saved.get(filename)
+            if old_rows is None:
+                old_rows = self._load_rows(filename)
+
+            changed = [key + (val,) for key, val in new_rows.items() if old_rows.get(key) != val]
+            removed = [key for key in old_rows if key not in new_rows]
+
+            if changed or removed:
+                columns = ", ".join(keys + (value,))
+                placeholders = ", ".join("?" * (len(keys) + 1))
+                where = " AND ".join(f"{k} = ?" for k in keys)
+                with self.conn:
+                    if changed:
+                        self.conn.executemany(
+                            f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) "
+                            f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET {value} = excluded.{value}",
+                            changed)
+                    if removed:
+                        self.conn.executemany(f"DELETE FROM {table} WHERE {where}", removed)
+            self._saved[filename] = new_rows
+        return len(changed) + len(removed)
+
+    def backup(self) -> bool:
+        """Copy the database to a .backup file using SQLite's online backup."""
+        import sqlite3
+        try:
+            target = sqlite3.connect(self.path + ".backup")
+            with self._lock, target:
+                self.conn.backup(target)
+            target.close()
+            logger.info(f"Created backup: {self.path}.backup")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to create backup of {SQLITE_FILENAME}: {e}")
+            return False
+
+    def import_json(self) -> int:
+        """Import the JSON documents from data/ into the database.
+
+        Returns:
+            Number of documents imported
+        """
+        imported = 0
+        for filename in SQLITE_DOCUMENTS:
+            data, _ = _read_json_document(filename)
+            if data:
+                self.save_document(filename, data)
+                imported += 1
+            if current_version(filename) is not None:
+                self.set_meta(f"schema:{filename}", str(current_version(filename)))
+        from datetime import datetime, timezone
+        self.set_meta("imported_json", datetime.now(timezone.utc).isoformat())
+        logger.info(f"Imported {imported} JSON documents into {SQLITE_FILENAME}")
+        return imported
+
+    def export_json(self) -> int:
+        """Export the database documents to their JSON files in data/.
+
+        Returns:
+            Number of documents exported
+        """
+        exported = 0
+        for filename in SQLITE_DOCUMENTS:
+            if save_json(filename, _wrap_document(filename, self.load_document(filename)), indent=None):
+                exported += 1
+        logger.info(f"Exported {exported} documents from {SQLITE_FILENAME} to JSON")
+        return exported
+
+
+_backend = STORAGE_BACKEND_JSON
+_sqlite_store = None
+
+
+def get_sqlite_store() -> SQLiteStore:
+    """Get the shared SQLite store, opening it on first use"""
+    global _sqlite_store
+    if _sqlite_store is None:
+        _sqlite_store = SQLiteStore()
+    return _sqlite_store
+
+
+def get_storage_backend() -> str:
+    return _backend
+
+
+def set_storage_backend(backend: str):
+    """Select the storage backend, migrating data when switching.
+
+    Switching to SQLite imports the JSON files on first use. Switching back to
+    JSON exports the database to the JSON files and renames it to .old so the
+    export only happens once.
+    """
+    global _backend, _sqlite_store
+    db_path = os.path.join(get_data_dir(), SQLITE_FILENAME)
+
+    if backend == STORAGE_BACKEND_SQLITE:
+        store = get_sqlite_store()
+        if store.get_meta("imported_json") is None:
+            store.import_json()
+        _backend = STORAGE_BACKEND_SQLITE
+        return
+
+    if os.path.exists(db_path):
+        try:
+            store = get_sqlite_store()
+            store.export_json()
+            store.close()
+            os.replace(db_path, db_path + ".old")
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+        except Exception as e:
+            logger.error(f"Failed to export {SQLITE_FILENAME} to JSON: {e}")
+        _sqlite_store = None
+    _backend = STORAGE_BACKEND_JSON
+
+
+def close_storage():
+    """Close the SQLite connection if one is open"""
+    if _sqlite_store is not None:
+        _sqlite_store.close()
+
+
+# ----- schema versions -----
+
+def _wrap_document(filename: str, data):
+    """Add the schema header if the file is versioned"""
+    return wrap(filename, data) if current_version(filename) is not None else data
+
+
+def _read_json_document(filename: str, default=None):
+    """Load a JSON data file, stripping its schema header and migrating old versions.
+
+    Returns:
+        (data, migrated) - migrated is True if the file needs rewriting
+    """
+    document = load_json(filename, default)
+    version = current_version(filename)
+    if version is None:
+        return document, False
+    stored_version, data = unwrap(document)
+    if not data or stored_version == version:
+        return data, False
+    return migrate(filename, stored_version, data), True
+
+
+def _load_sqlite_document(filename: str):
+    """Load a document from SQLite, migrating it once if the database predates its schema version"""
+    store = get_sqlite_store()
+    data = store.load_document(filename)
+    version = current_version(filename)
+    if version is None:
+        return data
+    stored_version = int(store.get_meta(f"schema:{filename}", LEGACY_VERSION))
+    if stored_version != version:
+        if data:
+            data = migrate(filename, stored_version, data)
+            store.save_document(filename, data)
+        store.set_meta(f"schema:{filename}", str(version))
+    return data
+
+
+def load_document(filename: str, default=None):
+    """Load a model document from the active backend (SQLite or JSON file)
+
+    Documents written by an older schema version are migrated in one pass and
+    written back, so later loads read the current format directly.
+    """
+    if _backend == STORAGE_BACKEND_SQLITE and filename in SQLITE_DOCUMENTS:
+        try:
+            data = _load_sqlite_document(filename)
+            return data if data else (default if default is not None else {})
+        except Exception as e:
+            logger.error(f"Failed to load {filename} from {SQLITE_FILENAME}: {e}", exc_info=True)
+            return default if default is not None else {}
+    try:
+        data, migrated = _read_json_document(filename, default)
+    except Exception as e:
+        logger.error(f"Failed to migrate {filename}: {e}", exc_info=True)
+        return default if default is not None else {}
+    if migrated:
+        save_json(filename, _wrap_document(filename, data), create_backup=True)
+    return data
+
+
+def save_document(filename: str, data, encoder=None, indent=4, create_backup=False) -> bool:
+    """Save a model document to the active backend (SQLite or JSON file)"""
+    if _backend == STORAGE_BACKEND_SQLITE and filename in SQLITE_DOCUMENTS:
+        try:
+            store = get_sqlite_store()
+            if create_backup:
+                store.backup()
+            store.save_document(filename, data, encoder)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save {filename} to {SQLITE_FILENAME}: {e}", exc_info=True)
+            return False
+    return save_json(filename, _wrap_document(filename, data), encoder=encoder, indent=indent,
+                     create_backup=create_backup)
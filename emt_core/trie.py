@@ -0,0 +1,109 @@
+# core/trie.py - Case-insensitive prefix search over names
+
+
+class _Node:
+    __slots__ = ("edges", "values")
+
+    def __init__(self):
+        self.edges = {}      # first character -> (label, child)
+        self.values = set()  # values whose key ends here
+
+
+class PrefixTrie:
+    """Radix trie mapping lower-cased keys to values, for type-ahead search.
+
+    Edges carry whole substrings rather than single characters, so the trie
+    has at most two nodes per key. A prefix lookup walks len(prefix)
+    characters and then visits only the matching subtree.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def insert(self, key: str, value):
+        """Add value under key (keys compare case-insensitively)"""
+        key = key.lower()
+        node, i = self._root, 0
+        while i < len(key):
+            edge = node.edges.get(key[i])
+            if edge is None:
+                leaf = _Node()
+                node.edges[key[i]] = (key[i:], leaf)
+                node = leaf
+                break
+            label, child = edge
+            common = 0
+            limit = min(len(label), len(key) - i)
+            while common < limit and label[common] == key[i + common]:
+                common += 1
+            if common < len(label):
+                # Split the edge at the first differing character
+                middle = _Node()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[key[i]] = (label[:common], middle)
+                child = middle
+            node, i = child, i + common
+        if value not in node.values:
+            node.values.add(value)
+            self._count += 1
+
+    def remove(self, key: str, value):
+        """Remove value from key, pruning nodes left empty"""
+        key = key.lower()
+        path = []  # (parent, first character) for each edge taken
+        node, i = self._root, 0
+        while i < len(key):
+            edge = node.edges.get(key[i])
+            if edge is None or not key.startswith(edge[0], i):
+                return
+            path.append((node, key[i]))
+            node, i = edge[1], i + len(edge[0])
+        if value not in node.values:
+            return
+        node.values.discard(value)
+        self._count -= 1
+
+        # Drop empty leaves, then merge a value-less node with its only child
+        while path and not node.values and not node.edges:
+            parent, first = path.pop()
+            del parent.edges[first]
+            node = parent
+        if path and not node.values and len(node.edges) == 1:
+            parent, first = path[-1]
+            label = parent.edges[first][0]
+            child_label, child = next(iter(node.edges.values()))
+            parent.edges[first] = (label + child_label, child)
+
+    def search(self, prefix: str, limit=None) -> list:
+        """Values whose key starts with prefix, ordered by key
+
+        Args:
+            prefix: Case-insensitive prefix ("" matches everything)
+            limit: Stop after this many values (None = all)
+        """
+        prefix = prefix.lower()
+        node, i = self._root, 0
+        while i < len(prefix):
+            edge = node.edges.get(prefix[i])
+            if edge is None:
+                return []
+            label, child = edge
+            rest = prefix[i:]
+            if not (label.startswith(rest) or rest.startswith(label)):
+                return []
+            node, i = child, i + len(label)
+
+        results = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            results.extend(sorted(node.values, key=str))
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+            # Push in reverse so the smallest edge is visited first
+            stack.extend(node.edges[first][1] for first in sorted(node.edges, reverse=True))
+        return results
@@ -4,3 +4,7 @@ from .power import pledgedPower
 from .backpack import playerBackpack, save_backpack, load_backpack
 from .salvage import Salvage, salvageInventory, save_salvage, load_salvage, VALID_POWERPLAY_SALVAGE_TYPES
 from .ppcargo import Cargo
+from .registry import SystemRegistry
+from .table import SystemTable, system_table
+from .expiry import expire_stale_items, save_expiry, load_expiry
+from .reconcile import reconcile_backpack, save_reconciliation_log, load_reconciliation_log
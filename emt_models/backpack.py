@@ -1,20 +1,115 @@
 # models/backpack.py - Player Backpack for tracking PowerPlay data collection
+from bisect import bisect_left, insort
 from emt_core.logging import logger
-from emt_core.storage import load_json, save_json
-from emt_ppdata.undermining import is_valid_um_data, get_um_display_name
-from emt_ppdata.reinforcement import is_valid_reinf_data, get_reinf_display_name
-from emt_ppdata.acquisition import is_valid_acq_data, get_acq_display_name
+from emt_core.state import state
+from emt_core.expiry import ExpiryQueue
+from emt_core.storage import load_document, save_document
+from emt_core.schema import register_schema, register_migration
+from emt_ppdata.classifier import classify_pp_data, PP_DATA_TYPES, PP_UM, PP_REINF, PP_ACQ
+
+
+# Order in which remove_item consumes an item's source systems
+REMOVAL_ALPHABETICAL = "alphabetical"  # By system name
+REMOVAL_FIFO = "fifo"                  # By first collection time of the system
+REMOVAL_ORDERS = (REMOVAL_ALPHABETICAL, REMOVAL_FIFO)
 
 
 class Bag:
-    """Generic bag for storing items per system - tracks item_type -> system -> count"""
-    def __init__(self, name: str):
+    """Generic bag for storing items per system - tracks item_type -> system -> count
+
+    Each item's systems are kept in removal order so remove_item only visits the
+    systems it takes from: a sorted key list (maintained on insert) for the
+    alphabetical policy, or the dict's own insertion order for FIFO.
+
+    Per-item totals, per-system totals and the grand total are kept as running
+    counters, so the get_* methods never walk the nested dicts. All changes must
+    go through add_item/remove_item/set_count/from_dict/clear to keep them in
+    sync; verify_totals() recounts and compares.
+
+    Each item/system entry carries its last collection timestamp in an
+    ExpiryQueue. expire() moves entries older than a cutoff into `stale`, which
+    is kept for display but never used for merit attribution.
+    """
+    def __init__(self, name: str, removal_order: str = REMOVAL_ALPHABETICAL):
         self.name = name
-        # Structure: {item_name: {system_name: count}}
+        # Structure: {item_name: {system_name: count}}, systems in collection order
         self.items = {}
+        # Alphabetical policy only: {item_name: sorted [system_name]}
+        self._sorted = {}
+        # Running totals: {item_name: count}, {system_name: count}, overall count
+        self._item_totals = {}
+        self._system_totals = {}
+        self._total = 0
+        # Last collection timestamp per (item_name, system_name); entries loaded or
+        # added without one are stamped on the next expire()
+        self._collected = ExpiryQueue()
+        self._unstamped = set()
+        # Expired entries: {item_name: {system_name: count}}
+        self.stale = {}
+        self.removal_order = REMOVAL_ALPHABETICAL
+        self.set_removal_order(removal_order)
+
+    def set_removal_order(self, removal_order: str):
+        """Switch between REMOVAL_ALPHABETICAL and REMOVAL_FIFO"""
+        if removal_order not in REMOVAL_ORDERS:
+            logger.warning(f"Unknown removal order {removal_order}, using {REMOVAL_ALPHABETICAL}")
+            removal_order = REMOVAL_ALPHABETICAL
+        self.removal_order = removal_order
+        self._sorted = {}
+        if removal_order == REMOVAL_ALPHABETICAL:
+            for name_lower, systems_data in self.items.items():
+                self._sorted[name_lower] = sorted(systems_data)
+
+    def _add_system(self, name_lower: str, system_key: str):
+        """Register a new system for an item in the removal-order structure"""
+        if self.removal_order == REMOVAL_ALPHABETICAL:
+            insort(self._sorted.setdefault(name_lower, []), system_key)
+
+    def _count_changed(self, name_lower: str, system_key: str, delta: int):
+        """Apply a count change for one item/system to the running totals"""
+        item_total = self._item_totals.get(name_lower, 0) + delta
+        if item_total:
+            self._item_totals[name_lower] = item_total
+        else:
+            self._item_totals.pop(name_lower, None)
+        system_total = self._system_totals.get(system_key, 0) + delta
+        if system_total:
+            self._system_totals[system_key] = system_total
+        else:
+            self._system_totals.pop(system_key, None)
+        self._total += delta
+
+    def _count_totals(self):
+        """Totals recounted from the nested dicts: (per item, per system, overall)"""
+        item_totals = {}
+        system_totals = {}
+        for name_lower, systems_data in self.items.items():
+            item_totals[name_lower] = sum(systems_data.values())
+            for system, count in systems_data.items():
+                system_totals[system] = system_totals.get(system, 0) + count
+        return item_totals, system_totals, sum(item_totals.values())
+
+    def _stamp(self, name_lower: str, system_key: str, timestamp: str = None):
+        key = (name_lower, system_key)
+        if timestamp:
+            self._collected.touch(key, timestamp)
+            self._unstamped.discard(key)
+        elif key not in self._collected:
+            self._unstamped.add(key)
+
+    def _forget(self, name_lower: str, system_key: str):
+        key = (name_lower, system_key)
+        self._collected.discard(key)
+        self._unstamped.discard(key)
+
+    def _drop_item_if_empty(self, name_lower: str):
+        if not self.items.get(name_lower, True):
+            del self.items[name_lower]
+            self._sorted.pop(name_lower, None)
 
-    def add_item(self, name: str, count: int, system: str = None, controlling_power: str = None):
-        """Add item to bag, tracking per system"""
+    def add_item(self, name: str, count: int, system: str = None, controlling_power: str = None,
+                 timestamp: str = None):
+        """Add item to bag, tracking per system and collection time"""
         if count <= 0:
             return
         name_lower = name.lower()
@@ -22,53 +117,78 @@ class Bag:
 
         if name_lower not in self.items:
             self.items[name_lower] = {}
-        if system_key not in self.items[name_lower]:
-            self.items[name_lower][system_key] = 0
-        self.items[name_lower][system_key] += count
+        systems_data = self.items[name_lower]
+        if system_key not in systems_data:
+            systems_data[system_key] = 0
+            self._add_system(name_lower, system_key)
+        systems_data[system_key] += count
+        self._count_changed(name_lower, system_key, count)
+        self._stamp(name_lower, system_key, timestamp)
+
+    def set_count(self, name: str, system: str, count: int):
+        """Set an item's count for one system (manual correction); 0 removes it"""
+        name_lower = name.lower()
+        systems_data = self.items.get(name_lower, {})
+        if count > 0:
+            if system in systems_data:
+                self._count_changed(name_lower, system, count - systems_data[system])
+                systems_data[system] = count
+            else:
+                self.add_item(name_lower, count, system)
+            return
+        if system in systems_data:
+            self._count_changed(name_lower, system, -systems_data.pop(system))
+            self._forget(name_lower, system)
+            if name_lower in self._sorted:
+                keys = self._sorted[name_lower]
+                del keys[bisect_left(keys, system)]
+            self._drop_item_if_empty(name_lower)
+
+    def _removal_candidates(self, name_lower: str):
+        """Systems of an item in removal order, lazily"""
+        if self.removal_order == REMOVAL_ALPHABETICAL:
+            return iter(self._sorted[name_lower])
+        return iter(self.items[name_lower])
 
     def remove_item(self, name: str, count: int) -> dict:
-        """Remove item from bag, alphabetically by system.
+        """Remove item from bag, by system in the bag's removal order.
         Returns dict of {system: removed_count} for merit distribution."""
         name_lower = name.lower()
-        if name_lower not in self.items:
-            return {}
-
-        systems_data = self.items[name_lower]
+        systems_data = self.items.get(name_lower)
         if not systems_data:
             return {}
 
         removed_per_system = {}
+        emptied = []
         remaining = count
 
-        # Sort systems alphabetically and remove in order
-        for system in sorted(systems_data.keys()):
+        # Every visited system is emptied except possibly the last one
+        for system in self._removal_candidates(name_lower):
             if remaining <= 0:
                 break
-            available = systems_data[system]
-            if available <= 0:
-                continue
-
-            to_remove = min(available, remaining)
+            to_remove = min(systems_data[system], remaining)
             systems_data[system] -= to_remove
+            self._count_changed(name_lower, system, -to_remove)
             removed_per_system[system] = to_remove
             remaining -= to_remove
-
-            # Clean up empty system
             if systems_data[system] <= 0:
-                del systems_data[system]
+                emptied.append(system)
+
+        # Clean up empty systems: they form a prefix of the removal order
+        for system in emptied:
+            del systems_data[system]
+            self._forget(name_lower, system)
+        if emptied and self.removal_order == REMOVAL_ALPHABETICAL:
+            del self._sorted[name_lower][:len(emptied)]
 
         # Clean up empty item
-        if not systems_data:
-            del self.items[name_lower]
+        self._drop_item_if_empty(name_lower)
 
         return removed_per_system
 
     def get_count(self, name: str) -> int:
         """Get total count of specific item across all systems"""
-        name_lower = name.lower()
-        if name_lower not in self.items:
-            return 0
-        return sum(self.items[name_lower].values())
+        return self._item_totals.get(name.lower(), 0)
 
     def get_count_by_system(self, name: str) -> dict:
         """Get count of specific item per system"""
@@ -77,49 +197,125 @@ class Bag:
 
     def get_total(self) -> int:
         """Get total count of all items across all systems"""
-        total = 0
-        for systems in self.items.values():
-            total += sum(systems.values())
-        return total
+        return self._total
 
     def get_systems_summary(self) -> dict:
         """Get summary of items per system: {system: total_count}"""
-        summary = {}
-        for item_systems in self.items.values():
-            for system, count in item_systems.items():
-                summary[system] = summary.get(system, 0) + count
-        return summary
+        return dict(self._system_totals)
+
+    def verify_totals(self) -> bool:
+        """Recount the totals and compare with the running counters (debug self-check).
+        Mismatches are logged and the counters are replaced by the recount."""
+        item_totals, system_totals, total = self._count_totals()
+        if (item_totals, system_totals, total) == (self._item_totals, self._system_totals, self._total):
+            return True
+        logger.warning(f"Bag {self.name}: running totals out of sync (total {self._total}, recounted {total})")
+        self._item_totals, self._system_totals, self._total = item_totals, system_totals, total
+        return False
 
     def clear(self):
         """Clear all items"""
         self.items.clear()
+        self._sorted.clear()
+        self._item_totals.clear()
+        self._system_totals.clear()
+        self._total = 0
+        self._collected.clear()
+        self._unstamped.clear()
+        self.stale.clear()
+
+    def expire(self, cutoff: str, now: str) -> dict:
+        """Move entries last collected before cutoff into the stale bucket
+
+        Args:
+            cutoff: Journal timestamp; entries collected earlier expire
+            now: Journal timestamp given to entries that have no collection time yet
+
+        Returns:
+            {item_name: {system_name: count}} moved to stale
+        """
+        for key in self._unstamped:
+            self._collected.touch(key, now)
+        self._unstamped.clear()
+
+        moved = {}
+        for name_lower, system in self._collected.pop_expired(cutoff):
+            count = self.items[name_lower][system]
+            self.set_count(name_lower, system, 0)
+            stale_systems = self.stale.setdefault(name_lower, {})
+            stale_systems[system] = stale_systems.get(system, 0) + count
+            moved.setdefault(name_lower, {})[system] = count
+        return moved
+
+    def remove_stale(self, name: str, count: int) -> int:
+        """Remove up to count of an item from the stale bucket, oldest system entries first.
+        Returns the number removed; stale items carry no merit attribution."""
+        name_lower = name.lower()
+        stale_systems = self.stale.get(name_lower)
+        removed = 0
+        while stale_systems and removed < count:
+            system = next(iter(stale_systems))
+            taken = min(stale_systems[system], count - removed)
+            removed += taken
+            stale_systems[system] -= taken
+            if stale_systems[system] <= 0:
+                del stale_systems[system]
+        if name_lower in self.stale and not stale_systems:
+            del self.stale[name_lower]
+        return removed
+
+    def adjust_stale(self, name: str, system: str, delta: int):
+        """Change a stale entry by delta, dropping it at 0"""
+        name_lower = name.lower()
+        stale_systems = self.stale.setdefault(name_lower, {})
+        count = stale_systems.get(system, 0) + delta
+        if count > 0:
+            stale_systems[system] = count
+        else:
+            stale_systems.pop(system, None)
+            if not stale_systems:
+                del self.stale[name_lower]
+
+    def entries_by_age(self, name: str) -> list:
+        """(timestamp, system, count) of an item's live entries, oldest first; unstamped count as oldest"""
+        name_lower = name.lower()
+        return sorted((self._collected.get((name_lower, system), ""), system, count)
+                      for system, count in self.items.get(name_lower, {}).items())
+
+    def get_stale_total(self) -> int:
+        """Total count in the stale bucket"""
+        return sum(sum(systems_data.values()) for systems_data in self.stale.values())
+
+    def collected_to_dict(self) -> dict:
+        """Collection timestamps for JSON storage: {item: {system: timestamp}}"""
+        collected = {}
+        for (name_lower, system), timestamp in self._collected.items():
+            collected.setdefault(name_lower, {})[system] = timestamp
+        return collected
+
+    def load_collected(self, collected: dict, stale: dict = None):
+        """Restore collection timestamps and the stale bucket after from_dict"""
+        for name_lower, systems_data in collected.items():
+            for system, timestamp in systems_data.items():
+                if system in self.items.get(name_lower, {}):
+                    self._stamp(name_lower, system, timestamp)
+        self.stale = {name: dict(systems_data) for name, systems_data in (stale or {}).items() if systems_data}
 
     def to_dict(self) -> dict:
         """Serialize to dict for JSON storage"""
         return dict(self.items)
 
     def from_dict(self, data: dict):
-        """Deserialize from dict"""
+        """Deserialize from dict in the current backpack.json schema: {item: {system: count}}"""
         self.items.clear()
-
-        # Handle both old and new formats
-        if isinstance(data, dict):
-            if "items" in data:
-                # New format (ignore cp_values if present)
-                for name, systems_data in data.get("items", {}).items():
-                    if isinstance(systems_data, dict):
-                        self.items[name] = dict(systems_data)
-            else:
-                # Old format: {item: {system: count}}
-                for name, systems_data in data.items():
-                    if isinstance(systems_data, dict):
-                        self.items[name] = dict(systems_data)
-                    else:
-                        # Legacy format: {item: BackpackItem.to_dict()}
-                        legacy_system = systems_data.get("system", "unknown")
-                        legacy_count = systems_data.get("count", 0)
-                        if legacy_count > 0:
-                            self.items[name] = {legacy_system: legacy_count}
+        for name, systems_data in data.items():
+            systems_data = {system: count for system, count in systems_data.items() if count > 0}
+            if systems_data:
+                self.items[name] = systems_data
+        self._item_totals, self._system_totals, self._total = self._count_totals()
+        self._collected.clear()
+        self._unstamped = {(name, system) for name, systems_data in self.items.items() for system in systems_data}
+        self.set_removal_order(self.removal_order)
 
 
 class Backpack:
@@ -129,10 +325,22 @@ class Backpack:
         self.reinfbag = Bag("reinforcement")  # Reinforcement data
         self.acqbag = Bag("acquisition")      # Acquisition data
 
-    def add_item(self, name: str, count: int, system: str = None, controlling_power: str = None, pledged_power: str = None):
+    def set_removal_order(self, removal_order: str):
+        """Set the removal order (REMOVAL_ALPHABETICAL or REMOVAL_FIFO) of every bag"""
+        for bag in (self.umbag, self.reinfbag, self.acqbag):
+            bag.set_removal_order(removal_order)
+
+    def _bags(self):
+        """(category bit, bag, log label) for each bag"""
+        return ((PP_UM, self.umbag, "UM"), (PP_REINF, self.reinfbag, "Reinf"), (PP_ACQ, self.acqbag, "Acq"))
+
+    def add_item(self, name: str, count: int, system: str = None, controlling_power: str = None, pledged_power: str = None,
+                 timestamp: str = None):
         """Add PowerPlay data to appropriate bag based on controlling vs pledged power"""
         name_lower = name.lower()
-        added_to = []
+        mask, display_name = classify_pp_data(name_lower)
+        if not mask:
+            return
 
         # Determine territory type (check neutral first to avoid false enemy detection)
         is_neutral = not controlling_power or controlling_power == "no power" or controlling_power == ""
@@ -140,95 +348,159 @@ class Backpack:
         is_enemy_power = not is_neutral and pledged_power and controlling_power != pledged_power
 
         # UM: Valid if collected in enemy territory (controlling_power != pledged_power and has a power)
-        if is_valid_um_data(name_lower) and is_enemy_power:
-            self.umbag.add_item(name_lower, count, system, controlling_power)
-            added_to.append("UM")
-
         # Reinf: Valid only if collected in own power territory (controlling_power == pledged_power)
-        if is_valid_reinf_data(name_lower) and is_own_power:
-            self.reinfbag.add_item(name_lower, count, system, controlling_power)
-            added_to.append("Reinf")
-
         # Acq: Valid if collected in neutral territory (no controlling power)
-        if is_valid_acq_data(name_lower) and is_neutral:
-            self.acqbag.add_item(name_lower, count, system, controlling_power)
-            added_to.append("Acq")
+        territory = (PP_UM if is_enemy_power else 0) | (PP_REINF if is_own_power else 0) | (PP_ACQ if is_neutral else 0)
+
+        added_to = []
+        for bit, bag, label in self._bags():
+            if mask & territory & bit:
+                bag.add_item(name_lower, count, system, controlling_power, timestamp)
+                added_to.append(label)
 
         if added_to:
-            display_name = get_um_display_name(name_lower) if is_valid_um_data(name_lower) else get_acq_display_name(name_lower)
             logger.info(f"Backpack [{'/'.join(added_to)}]: +{count} {display_name} from {system} ({controlling_power})")
 
     def remove_item(self, name: str, count: int) -> dict:
         """Remove PowerPlay data from appropriate bag(s).
         Returns dict of {system: removed_count} for merit distribution."""
         name_lower = name.lower()
+        mask, display_name = classify_pp_data(name_lower)
+        if not mask:
+            return {}
         total_removed = 0
         removed_from = []
         all_systems_removed = {}  # Aggregated {system: count} across all bags
 
         # Try to remove from each bag, tracking actual removed amounts per system
-        if is_valid_um_data(name_lower):
-            systems_removed = self.umbag.remove_item(name_lower, count)
-            if systems_removed:
-                bag_total = sum(systems_removed.values())
-                total_removed += bag_total
-                removed_from.append(f"UM:{bag_total}")
-                for system, cnt in systems_removed.items():
-                    all_systems_removed[system] = all_systems_removed.get(system, 0) + cnt
-
-        if is_valid_reinf_data(name_lower):
-            systems_removed = self.reinfbag.remove_item(name_lower, count)
-            if systems_removed:
-                bag_total = sum(systems_removed.values())
-                total_removed += bag_total
-                removed_from.append(f"Reinf:{bag_total}")
-                for system, cnt in systems_removed.items():
-                    all_systems_removed[system] = all_systems_removed.get(system, 0) + cnt
-
-        if is_valid_acq_data(name_lower):
-            systems_removed = self.acqbag.remove_item(name_lower, count)
+        for bit, bag, label in self._bags():
+            if not mask & bit:
+                continue
+            systems_removed = bag.remove_item(name_lower, count)
             if systems_removed:
                 bag_total = sum(systems_removed.values())
                 total_removed += bag_total
-                removed_from.append(f"Acq:{bag_total}")
+                removed_from.append(f"{label}:{bag_total}")
                 for system, cnt in systems_removed.items():
                     all_systems_removed[system] = all_systems_removed.get(system, 0) + cnt
 
         if total_removed > 0:
-            display_name = get_um_display_name(name_lower) if is_valid_um_data(name_lower) else get_acq_display_name(name_lower)
             systems_str = ", ".join(f"{s}:{c}" for s, c in all_systems_removed.items())
             logger.info(f"Backpack [{'/'.join(removed_from)}]: -{total_removed} {display_name} from [{systems_str}]")
 
+        # Anything not covered by live entries may be stale data: drop it without attribution
+        if total_removed < count:
+            stale_removed = 0
+            for bit, bag, label in self._bags():
+                if mask & bit:
+                    stale_removed += bag.remove_stale(name_lower, count - total_removed - stale_removed)
+            if stale_removed:
+                logger.info(f"Backpack: -{stale_removed} stale {display_name} (no merit attribution)")
+                total_removed += stale_removed
+
         # Warn if requested count exceeds what we had tracked
         if total_removed < count:
             logger.warning(f"Backpack: Requested removal of {count} {name_lower} but only had {total_removed} tracked")
 
         return all_systems_removed
 
-    def sync_from_shiplocker(self, data_items: list):
-        """Cross-check backpack counts against ShipLocker event Data section.
+    def sync_from_shiplocker(self, data_items: list) -> list:
+        """Reconcile backpack counts with the ShipLocker event Data section.
         ShipLocker shows actual game state - we can only compare totals,
-        not per-bag distribution (game tracks internally with OwnerID etc.)"""
+        not per-bag distribution (game tracks internally with OwnerID etc.)
+
+        Returns:
+            The adjustments applied (see plan_reconciliation)
+        """
         # Aggregate PP data from ShipLocker (multiple entries possible for same item)
         game_counts = {}
         for item in data_items:
             name = item.get('Name', '').lower()
-            count = item.get('Count', 0)
-            if is_valid_um_data(name) or is_valid_reinf_data(name) or is_valid_acq_data(name):
-                game_counts[name] = game_counts.get(name, 0) + count
-
-        # Compare tracked totals vs game state
-        for name, game_count in game_counts.items():
-            tracked_total = (
-                self.umbag.get_count(name) +
-                self.reinfbag.get_count(name) +
-                self.acqbag.get_count(name)
-            )
-            if tracked_total != game_count:
-                logger.warning(f"Backpack sync mismatch: {name} tracked={tracked_total} game={game_count}")
+            if name in PP_DATA_TYPES:
+                game_counts[name] = game_counts.get(name, 0) + item.get('Count', 0)
+
+        if state.debug:
+            for bag in (self.umbag, self.reinfbag, self.acqbag):
+                bag.verify_totals()
+
+        adjustments = self.plan_reconciliation(game_counts)
+        self.apply_adjustments(adjustments)
 
         if game_counts:
             logger.info(f"ShipLocker sync: {len(game_counts)} PP data types, totals: {dict(game_counts)}")
+        return adjustments
+
+    def _bag_keys(self):
+        """(document key, category bit, bag) for each bag"""
+        return (("umbag", PP_UM, self.umbag), ("reinfbag", PP_REINF, self.reinfbag), ("acqbag", PP_ACQ, self.acqbag))
+
+    def plan_reconciliation(self, game_counts: dict) -> list:
+        """Smallest per-bag, per-system changes that make tracked totals (live + stale) match the game
+
+        Surplus is trimmed from stale entries first, then from the oldest live
+        entries across bags. A shortfall has no known source system, so it is
+        added as stale "unknown" entries, which are never attributed.
+
+        Args:
+            game_counts: {item name: count} from ShipLocker; PP data not listed counts as 0
+
+        Returns:
+            List of {"bag", "item", "system", "delta", "stale"} dicts
+        """
+        tracked_names = set(game_counts)
+        for _, _, bag in self._bag_keys():
+            tracked_names.update(bag.items)
+            tracked_names.update(bag.stale)
+
+        adjustments = []
+        for name in sorted(tracked_names):
+            mask = classify_pp_data(name)[0]
+            if not mask:
+                continue
+            bags = [(key, bag) for key, bit, bag in self._bag_keys() if mask & bit]
+            stale = [(key, system, count) for key, bag in bags for system, count in bag.stale.get(name, {}).items()]
+            live = sorted((timestamp, key, system, count)
+                          for key, bag in bags for timestamp, system, count in bag.entries_by_age(name))
+            tracked = sum(entry[-1] for entry in stale) + sum(entry[-1] for entry in live)
+            difference = game_counts.get(name, 0) - tracked
+            if difference > 0:
+                # Every PP data type is valid acquisition data; prefer that bag for unknown sources
+                key = "acqbag" if mask & PP_ACQ else bags[0][0]
+                adjustments.append({"bag": key, "item": name, "system": "unknown", "delta": difference, "stale": True})
+                continue
+
+            surplus = -difference
+            candidates = [(key, system, count, True) for key, system, count in stale]
+            candidates += [(key, system, count, False) for _, key, system, count in live]
+            for key, system, count, is_stale in candidates:
+                if surplus <= 0:
+                    break
+                trimmed = min(count, surplus)
+                surplus -= trimmed
+                adjustments.append({"bag": key, "item": name, "system": system, "delta": -trimmed, "stale": is_stale})
+        return adjustments
+
+    def apply_adjustments(self, adjustments: list):
+        """Apply plan_reconciliation() output in one batch"""
+        bags = {key: bag for key, _, bag in self._bag_keys()}
+        for adjustment in adjustments:
+            bag = bags[adjustment["bag"]]
+            name, system, delta = adjustment["item"], adjustment["system"], adjustment["delta"]
+            if adjustment["stale"]:
+                bag.adjust_stale(name, system, delta)
+            else:
+                bag.set_count(name, system, bag.items.get(name, {}).get(system, 0) + delta)
+            logger.info(f"Backpack reconcile [{bag.name}]: {delta:+d} {name} from {system}"
+                        f"{' (stale)' if adjustment['stale'] else ''}")
+
+    def expire(self, cutoff: str, now: str) -> dict:
+        """Move entries collected before cutoff to each bag's stale bucket; returns {bag name: moved}"""
+        moved = {}
+        for _, bag, _ in self._bags():
+            bag_moved = bag.expire(cutoff, now)
+            if bag_moved:
+                moved[bag.name] = bag_moved
+        return moved
 
     def to_dict(self) -> dict:
         return {
@@ -246,6 +518,37 @@ class Backpack:
             self.acqbag.from_dict(data["acqbag"])
 
 
+BACKPACK_SCHEMA_VERSION = 2
+register_schema("backpack.json", BACKPACK_SCHEMA_VERSION)
+
+
+def _migrate_bag_v1(data) -> dict:
+    """Convert any of the v1 bag layouts to {item: {system: count}}"""
+    if not isinstance(data, dict):
+        return {}
+    if "items" in data:
+        # {"items": {item: {system: count}}, "cp_values": ...}
+        data = data.get("items", {})
+    items = {}
+    for name, systems_data in data.items():
+        if not isinstance(systems_data, dict):
+            continue
+        if "system" in systems_data or "count" in systems_data:
+            # BackpackItem.to_dict(): {"system": ..., "count": ...}
+            count = systems_data.get("count", 0)
+            if count > 0:
+                items[name] = {systems_data.get("system", "unknown"): count}
+        else:
+            items[name] = dict(systems_data)
+    return items
+
+
+@register_migration("backpack.json", 1)
+def _migrate_backpack_v1(data):
+    """v1 -> v2: normalise every bag to {item: {system: count}}"""
+    return {bag: _migrate_bag_v1(data.get(bag, {})) for bag in ("umbag", "reinfbag", "acqbag")}
+
+
 # Singleton backpack instance
 playerBackpack = Backpack()
 
@@ -256,12 +559,12 @@ def save_backpack(create_backup=False):
     Args:
         create_backup: If True, creates .backup file (only during updates)
     """
-    save_json("backpack.json", playerBackpack.to_dict(), create_backup=create_backup)
+    save_document("backpack.json", playerBackpack.to_dict(), create_backup=create_backup)
 
 
 def load_backpack():
     """Load backpack from JSON file"""
-    data = load_json("backpack.json")
+    data = load_document("backpack.json")
     if data:
         playerBackpack.from_dict(data)
         logger.info(f"Loaded backpack - UM: {len(playerBackpack.umbag.items)}, Reinf: {len(playerBackpack.reinfbag.items)}, Acq: {len(playerBackpack.acqbag.items)}")
@@ -0,0 +1,71 @@
+# models/expiry.py - Ageing of backpack and salvage entries into stale buckets
+from emt_core.logging import logger
+from emt_core.storage import load_document, save_document
+from emt_core.schema import register_schema
+from emt_core.expiry import stale_cutoff
+from .backpack import playerBackpack
+from .salvage import salvageInventory
+
+# Collection timestamps and stale buckets live in their own document so
+# backpack.json, salvage.json and their SQLite rows keep their shape
+EXPIRY_SCHEMA_VERSION = 1
+register_schema("expiry.json", EXPIRY_SCHEMA_VERSION)
+
+
+def _bags():
+    return {"umbag": playerBackpack.umbag, "reinfbag": playerBackpack.reinfbag, "acqbag": playerBackpack.acqbag}
+
+
+def expire_stale_items(timestamp: str, max_age_hours: float) -> int:
+    """Move backpack and salvage entries not collected within max_age_hours into their stale buckets
+
+    Stale entries stay visible in the backpack window but are never used for
+    merit attribution.
+
+    Args:
+        timestamp: Current journal timestamp
+        max_age_hours: Maximum age; 0 disables expiry
+
+    Returns:
+        Number of items moved
+    """
+    if not timestamp or not max_age_hours or max_age_hours <= 0:
+        return 0
+    cutoff = stale_cutoff(timestamp, max_age_hours)
+    backpack_moved = playerBackpack.expire(cutoff, timestamp)
+    salvage_moved = salvageInventory.expire(cutoff, timestamp)
+
+    moved = sum(count for items in backpack_moved.values() for systems in items.values() for count in systems.values())
+    moved += sum(count for cargo in salvage_moved.values() for count in cargo.values())
+    if moved:
+        logger.info(f"Moved {moved} items collected before {cutoff} to stale "
+                    f"(backpack: {backpack_moved}, salvage: {salvage_moved})")
+    return moved
+
+
+def save_expiry(create_backup=False):
+    """Save collection timestamps and stale buckets to JSON file
+
+    Args:
+        create_backup: If True, creates .backup file (only during updates)
+    """
+    data = {
+        "backpack": {key: {"collected": bag.collected_to_dict(), "stale": bag.stale} for key, bag in _bags().items()},
+        "salvage": {
+            "collected": salvageInventory.collected_to_dict(),
+            "stale": {name: salvage.stale for name, salvage in salvageInventory.items() if salvage.stale},
+        },
+    }
+    save_document("expiry.json", data, create_backup=create_backup)
+
+
+def load_expiry():
+    """Load collection timestamps and stale buckets; call after load_backpack() and load_salvage()"""
+    data = load_document("expiry.json")
+    if not data:
+        return
+    for key, bag in _bags().items():
+        entry = data.get("backpack", {}).get(key, {})
+        bag.load_collected(entry.get("collected", {}), entry.get("stale", {}))
+    salvage = data.get("salvage", {})
+    salvageInventory.load_collected(salvage.get("collected", {}), salvage.get("stale", {}))
@@ -1,8 +1,13 @@
 import json
 from emt_core.logging import logger
-from emt_core.storage import load_json, save_json
+from emt_core.storage import load_document, save_document
+from emt_core.schema import register_schema, register_migration
 
 class PledgedPower:
+    # Fields written to power.json, in order
+    _FIELDS = ("Power", "Commander", "Merits", "MeritsSession", "Rank", "TimePledged", "TimePledgedStr")
+    __slots__ = _FIELDS
+
     def __init__(self, eventEntry: dict = {}, commander: str = ""):
         self.Power = str(eventEntry.get("Power", ""))
         self.Merits = int(eventEntry.get("Merits", 0))
@@ -22,7 +27,7 @@ class PledgedPower:
 
     def from_dict(self, data: dict = {}):
         """Load power data from dictionary"""
-        self.Power = str(data.get("Power") or data.get("PowerName", ""))
+        self.Power = str(data.get("Power", ""))
         self.Merits = int(data.get("Merits", 0))
         self.Rank = str(data.get("Rank", ""))
         self.TimePledged = int(data.get("TimePledged", 0))
@@ -35,11 +40,11 @@ class PledgedPower:
         Args:
             create_backup: If True, creates .backup file (only during updates)
         """
-        save_json("power.json", self, encoder=PowerEncoder, create_backup=create_backup)
+        save_document("power.json", self, encoder=PowerEncoder, create_backup=create_backup)
 
     def loadPower(self):
         """Load power data from JSON file"""
-        data = load_json("power.json")
+        data = load_document("power.json")
         if data:
             self.from_dict(data)
         else:
@@ -50,15 +55,21 @@ class PledgedPower:
 class PowerEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, PledgedPower):
-            return {
-                "Power": o.Power,
-                "Commander": o.Commander,
-                "Merits": o.Merits,
-                "MeritsSession": o.MeritsSession,
-                "Rank": o.Rank,
-                "TimePledged": o.TimePledged,
-                "TimePledgedStr": o.TimePledgedStr,
-            }
+            return {field: getattr(o, field) for field in PledgedPower._FIELDS}
         return super().default(o)
 
+POWER_SCHEMA_VERSION = 2
+register_schema("power.json", POWER_SCHEMA_VERSION)
+
+
+@register_migration("power.json", 1)
+def _migrate_power_v1(data):
+    """v1 -> v2: older files stored the power as PowerName"""
+    data = dict(data)
+    if not data.get("Power"):
+        data["Power"] = data.get("PowerName", "")
+    data.pop("PowerName", None)
+    return data
+
+
 pledgedPower = PledgedPower()
\ No newline at end of file
@@ -1,6 +1,8 @@
 from emt_core.logging import logger
 
 class Cargo:
+    __slots__ = ("name", "count")
+
     def __init__(self, name: str, count: int = 1):
         self.name = name
         self.count = count
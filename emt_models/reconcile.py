@@ -0,0 +1,48 @@
+# models/reconcile.py - Automatic backpack reconciliation against ShipLocker, with an audit log
+from emt_core.logging import logger
+from emt_core.storage import load_document, save_document
+from emt_core.schema import register_schema
+from .backpack import playerBackpack
+
+RECONCILE_SCHEMA_VERSION = 1
+register_schema("reconciliation.json", RECONCILE_SCHEMA_VERSION)
+
+# Most recent correction records kept in reconciliation.json
+MAX_AUDIT_RECORDS = 500
+
+# Audit records, oldest first: {"timestamp", "adjustments": [...]}
+reconciliation_log = []
+
+
+def reconcile_backpack(data_items: list, timestamp: str = None) -> list:
+    """Bring the backpack in line with a ShipLocker Data section and record the corrections
+
+    Args:
+        data_items: ShipLocker "Data" list
+        timestamp: Journal timestamp of the ShipLocker event
+
+    Returns:
+        The adjustments applied; empty when the backpack already matched
+    """
+    adjustments = playerBackpack.sync_from_shiplocker(data_items)
+    if adjustments:
+        reconciliation_log.append({"timestamp": timestamp, "adjustments": adjustments})
+        del reconciliation_log[:-MAX_AUDIT_RECORDS]
+        logger.info(f"Backpack reconciled with ShipLocker: {len(adjustments)} adjustments")
+    return adjustments
+
+
+def save_reconciliation_log(create_backup=False):
+    """Save the reconciliation audit log to JSON file
+
+    Args:
+        create_backup: If True, creates .backup file (only during updates)
+    """
+    save_document("reconciliation.json", reconciliation_log, create_backup=create_backup)
+
+
+def load_reconciliation_log():
+    """Load the reconciliation audit log from JSON file"""
+    data = load_document("reconciliation.json")
+    if data:
+        reconciliation_log[:] = data[-MAX_AUDIT_RECORDS:]
@@ -0,0 +1,325 @@
+# models/registry.py - Bounded in-memory registry for StarSystem objects
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from emt_core.logging import logger
+from emt_core.storage import get_data_dir
+
+# Spill cache for evicted systems, relative to the data directory
+SPILL_DIR = os.path.join("cache", "systems")
+
+
+class SystemRegistry(MutableMapping):
+    """Dict-like registry of systems with an optional cap on resident objects.
+
+    When more than max_resident systems are in memory, the least recently used
+    ones that can be evicted (see `evictable`) are written to a spill cache on
+    disk and reloaded transparently on the next access. Without a cap it
+    behaves like a plain dict.
+
+    items()/values() yield the tracked object of every system, loading lazy and
+    spilled entries one at a time and re-applying the cap each time the walk
+    moves on, so a full walk keeps memory bounded. The current system is never
+    spilled while the caller works on it, so changes made to it are kept; once
+    the walk moves past it, it may be spilled, so don't hold on to it across
+    steps. Read-only walks should use peek_items(), which never loads or evicts.
+
+    Systems loaded from disk with load_raw() are kept as parsed dicts and only
+    materialised on first access; serialized_items() and select() work on the
+    dicts directly so saving and startup lookups never build objects.
+    """
+
+    def __init__(self, materialize, serialize, evictable, max_resident=None, spill_dir=None):
+        """
+        Args:
+            materialize: Build an object from its serialized dict
+            serialize: Turn an object into a JSON-serializable dict
+            evictable: Return True if an object may be spilled to disk
+            max_resident: Cap on objects kept in memory (None = unbounded)
+            spill_dir: Directory for the spill cache (default: data/cache/systems)
+        """
+        self._materialize = materialize
+        self._serialize = serialize
+        self._evictable = evictable
+        self.max_resident = max_resident
+        self._spill_dir = spill_dir
+        self._resident = OrderedDict()
+        self._raw = {}  # name -> parsed dict not yet materialised
+        self._spilled = set()
+        self._held = set()  # systems handed out by a walk that hasn't moved on yet
+        self._listeners = []
+
+        # Metrics
+        self.evictions = 0
+        self.reloads = 0
+        self.reload_total_ns = 0
+        self.reload_max_ns = 0
+        self.materialized = 0
+
+    def configure(self, max_resident=None, spill_dir=None):
+        """Set the resident cap and spill directory, clearing stale spill files"""
+        self.max_resident = max_resident
+        if spill_dir is not None:
+            self._spill_dir = spill_dir
+        if not self._spilled and os.path.isdir(self.spill_dir):
+            for name in os.listdir(self.spill_dir):
+                try:
+                    os.remove(os.path.join(self.spill_dir, name))
+                except OSError:
+                    pass
+        self._evict()
+
+    @property
+    def spill_dir(self):
+        if self._spill_dir is None:
+            self._spill_dir = os.path.join(get_data_dir(), SPILL_DIR)
+        return self._spill_dir
+
+    def _spill_path(self, name):
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()
+        return os.path.join(self.spill_dir, f"{digest}.json")
+
+    # ----- change notification -----
+
+    def add_listener(self, callback):
+        """Call callback(name) when a system is added, changed or removed; name is None when everything changed"""
+        self._listeners.append(callback)
+
+    def notify(self, name):
+        """Report that a system's fields changed (called by the model's mutators)"""
+        for callback in self._listeners:
+            callback(name)
+
+    # ----- spill cache -----
+
+    def _read_spilled(self, name):
+        with open(self._spill_path(name), "r", encoding="utf-8") as f:
+            return self._materialize(json.load(f))
+
+    def _drop_spilled(self, name):
+        self._spilled.discard(name)
+        try:
+            os.remove(self._spill_path(name))
+        except OSError:
+            pass
+
+    def _reload(self, name):
+        start = time.perf_counter_ns()
+        obj = self._read_spilled(name)
+        self._drop_spilled(name)
+        elapsed = time.perf_counter_ns() - start
+        self.reloads += 1
+        self.reload_total_ns += elapsed
+        self.reload_max_ns = max(self.reload_max_ns, elapsed)
+        return obj
+
+    def _evict(self, keep=None):
+        """Spill least recently used evictable systems until under the cap"""
+        if self.max_resident is None:
+            return
+        excess = len(self._resident) - self.max_resident
+        if excess <= 0:
+            return
+        victims = []
+        pinned = []
+        for name, obj in self._resident.items():
+            if name == keep or name in self._held:
+                continue
+            if self._evictable(obj):
+                victims.append(name)
+                if len(victims) >= excess:
+                    break
+            else:
+                pinned.append(name)
+        # Move systems that can't be spilled out of the way so the next scan doesn't repeat them
+        for name in pinned:
+            self._resident.move_to_end(name)
+        if not victims:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        for name in victims:
+            try:
+                with open(self._spill_path(name), "w", encoding="utf-8") as f:
+                    json.dump(self._serialize(self._resident[name]), f)
+            except Exception as e:
+                logger.error(f"Failed to spill system {name}: {e}")
+                continue
+            del self._resident[name]
+            self._spilled.add(name)
+            self.evictions += 1
+
+    # ----- lazy loading -----
+
+    def load_raw(self, data):
+        """Register parsed system dicts without building objects"""
+        for name, raw in data.items():
+            if name not in self._resident and name not in self._spilled:
+                self._raw[name] = raw
+        self.notify(None)
+
+    def _materialize_raw(self, name):
+        obj = self._materialize(self._raw.pop(name))
+        self.materialized += 1
+        self._resident[name] = obj
+        return obj
+
+    def select(self, obj_predicate, raw_predicate):
+        """Yield (name, system) matching the predicates, materialising only matching dicts
+
+        As in items(), the system just yielded stays resident until the walk moves on.
+        """
+        for name, obj in list(self._resident.items()):
+            if obj_predicate(obj):
+                yield from self._hold(name, obj)
+        for name in [name for name, raw in self._raw.items() if raw_predicate(raw)]:
+            if name in self._raw:
+                yield from self._hold(name, self._materialize_raw(name))
+
+    def owns(self, name, obj):
+        """True if obj is the object resident under name (not a copy or an untracked system)"""
+        return self._resident.get(name) is obj
+
+    def peek(self, name):
+        """Return the resident system, or its dict if it is lazy or spilled, without promoting it"""
+        if name in self._resident:
+            return self._resident[name]
+        if name in self._raw:
+            return self._raw[name]
+        if name in self._spilled:
+            with open(self._spill_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        return None
+
+    def peek_items(self):
+        """(name, system or dict) pairs for every entry without materialising or promoting any"""
+        pairs = list(self._resident.items())
+        pairs.extend(self._raw.items())
+        for name in list(self._spilled):
+            with open(self._spill_path(name), "r", encoding="utf-8") as f:
+                pairs.append((name, json.load(f)))
+        return pairs
+
+    def serialized_items(self):
+        """(name, dict) pairs for every system without materialising lazy entries"""
+        pairs = [(name, self._serialize(obj)) for name, obj in self._resident.items()]
+        pairs.extend(self._raw.items())
+        for name in list(self._spilled):
+            with open(self._spill_path(name), "r", encoding="utf-8") as f:
+                pairs.append((name, json.load(f)))
+        return pairs
+
+    # ----- mapping interface -----
+
+    def __getitem__(self, name):
+        if name in self._resident:
+            self._resident.move_to_end(name)
+            return self._resident[name]
+        if name in self._raw:
+            obj = self._materialize_raw(name)
+            self._evict(keep=name)
+            return obj
+        if name in self._spilled:
+            obj = self._reload(name)
+            self._resident[name] = obj
+            self._evict(keep=name)
+            return obj
+        raise KeyError(name)
+
+    def __setitem__(self, name, obj):
+        self._raw.pop(name, None)
+        if name in self._spilled:
+            self._drop_spilled(name)
+        self._resident[name] = obj
+        self._resident.move_to_end(name)
+        self._evict(keep=name)
+        self.notify(name)
+
+    def __delitem__(self, name):
+        if name in self._resident:
+            del self._resident[name]
+        elif name in self._raw:
+            del self._raw[name]
+        elif name in self._spilled:
+            self._drop_spilled(name)
+        else:
+            raise KeyError(name)
+        self.notify(name)
+
+    def __contains__(self, name):
+        return name in self._resident or name in self._raw or name in self._spilled
+
+    def __iter__(self):
+        return iter(list(self._resident) + list(self._raw) + list(self._spilled))
+
+    def __len__(self):
+        return len(self._resident) + len(self._raw) + len(self._spilled)
+
+    def items(self):
+        """Yield (name, system) for every entry, always the tracked object
+
+        Resident systems are not promoted; lazy and spilled ones are loaded as
+        the walk reaches them. The system just yielded is never spilled, even
+        by lookups made in the loop body; the cap is re-applied once the caller
+        asks for the next entry, so it is spilled with its changes afterwards.
+        """
+        for name in list(self):
+            obj = self._resident.get(name)
+            if obj is None:
+                if name in self._raw:
+                    obj = self._materialize_raw(name)
+                elif name in self._spilled:
+                    obj = self._reload(name)
+                    self._resident[name] = obj
+                else:
+                    continue  # removed during the walk
+            yield from self._hold(name, obj)
+
+    def _hold(self, name, obj):
+        """Yield one walk entry, keeping it resident until the caller moves on"""
+        self._held.add(name)
+        try:
+            yield name, obj
+        finally:
+            self._held.discard(name)
+        self._evict()
+
+    def values(self):
+        for _, obj in self.items():
+            yield obj
+
+    def clear(self):
+        self._resident.clear()
+        self._raw.clear()
+        for name in list(self._spilled):
+            self._drop_spilled(name)
+        self.notify(None)
+
+    # ----- metrics -----
+
+    @property
+    def resident_count(self):
+        return len(self._resident)
+
+    @property
+    def spilled_count(self):
+        return len(self._spilled)
+
+    @property
+    def lazy_count(self):
+        return len(self._raw)
+
+    def stats(self):
+        """Registry metrics: resident/spilled counts, evictions, reloads and reload latency"""
+        return {
+            "resident": self.resident_count,
+            "spilled": self.spilled_count,
+            "lazy": self.lazy_count,
+            "materialized": self.materialized,
+            "evictions": self.evictions,
+            "reloads": self.reloads,
+            "reload_avg_ms": self.reload_total_ns / self.reloads / 1e6 if self.reloads else 0.0,
+            "reload_max_ms": self.reload_max_ns / 1e6,
+        }
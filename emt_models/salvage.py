@@ -1,5 +1,7 @@
 from emt_core.logging import logger
-from emt_core.storage import load_json, save_json
+from emt_core.storage import load_document, save_document
+from emt_core.schema import register_schema
+from emt_core.expiry import ExpiryQueue
 from .system import StarSystem
 from .ppcargo import Cargo
 
@@ -26,21 +28,26 @@ VALID_POWERPLAY_SALVAGE_TYPES = {
 }
 
 class Salvage:
+    __slots__ = ("system_name", "inventory", "stale")
+
     def __init__(self, system_name: str):
         self.system_name = system_name
         self.inventory = {}  # Dict[str, Cargo]
+        self.stale = {}      # Dict[str, int] expired cargo, shown but never attributed
 
-    def add_cargo(self, cargo_name: str, count: int = 1):
+    def add_cargo(self, cargo_name: str, count: int = 1, timestamp: str = None):
         cargo_name_lower = cargo_name.lower()
         if cargo_name_lower not in VALID_POWERPLAY_SALVAGE_TYPES:
             logger.error(f"Invalid salvage type: {cargo_name}")
             return
+        previous = self.inventory[cargo_name_lower].count if cargo_name_lower in self.inventory else 0
         if cargo_name_lower not in self.inventory:
             self.inventory[cargo_name_lower] = Cargo(cargo_name_lower)
         self.inventory[cargo_name_lower].add(count)
-        
-        # Log significant cargo collections
         total_count = self.inventory[cargo_name_lower].count
+        self._index_changed(cargo_name_lower, total_count - previous, timestamp)
+
+        # Log significant cargo collections
         if total_count >= 50:
             logger.info(f"Large salvage collection in {self.system_name}: {total_count}x {cargo_name}")
     
@@ -56,10 +63,39 @@ class Salvage:
         if cargo_name_lower in self.inventory:
             actual_count = min(count, self.inventory[cargo_name_lower].count)
             self.inventory[cargo_name_lower].remove(actual_count)
+            self._index_changed(cargo_name_lower, -actual_count)
             if self.inventory[cargo_name_lower].count <= 0:
                 del self.inventory[cargo_name_lower]
             return actual_count
         return 0
+
+    def set_count(self, cargo_name: str, count: int):
+        """Set a cargo count directly (manual correction); 0 removes it"""
+        cargo_name_lower = cargo_name.lower()
+        cargo = self.inventory.get(cargo_name_lower)
+        previous = cargo.count if cargo else 0
+        if count > 0:
+            if cargo is None:
+                cargo = self.inventory[cargo_name_lower] = Cargo(cargo_name_lower, 0)
+            cargo.count = count
+        elif cargo is not None:
+            del self.inventory[cargo_name_lower]
+        self._index_changed(cargo_name_lower, max(count, 0) - previous)
+
+    def remove_stale(self, cargo_name: str, count: int) -> int:
+        """Remove up to count of a cargo type from the stale bucket; returns the number removed"""
+        cargo_name_lower = cargo_name.lower()
+        removed = min(count, self.stale.get(cargo_name_lower, 0))
+        if removed:
+            self.stale[cargo_name_lower] -= removed
+            if self.stale[cargo_name_lower] <= 0:
+                del self.stale[cargo_name_lower]
+        return removed
+
+    def _index_changed(self, cargo_name_lower: str, delta: int, timestamp: str = None):
+        """Report a count change to the reverse index if this is the inventory's entry for the system"""
+        if delta and salvageInventory.get(self.system_name) is self:
+            salvageInventory._count_changed(self.system_name, cargo_name_lower, delta, timestamp)
     
     def to_dict(self):
         return {
@@ -87,9 +123,154 @@ class Salvage:
         if system_name not in salvageInventory:
             salvageInventory[system_name] = Salvage(system_name)
             
-        salvageInventory[system_name].add_cargo(cargo_type, cargo_count)
+        salvageInventory[system_name].add_cargo(cargo_type, cargo_count, event_entry.get("timestamp"))
         logger.debug(f"Added {cargo_count} {cargo_type} to {system_name}")
 
+class SalvageInventory(dict):
+    """Salvage per system ({system_name: Salvage}) with a reverse index by cargo type.
+
+    The index ({cargo_type: {system_name: count}}) and per-type totals are kept in
+    step by the dict operations and by Salvage.add_cargo/remove_cargo/set_count
+    on the Salvage stored under its own system name, so "where did this cargo
+    come from" is a single lookup instead of a walk over every system.
+
+    The last collection timestamp of each (system, cargo type) is kept in an
+    ExpiryQueue; expire() moves entries older than a cutoff to Salvage.stale.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._by_type = {}      # cargo type -> {system name: count}
+        self._type_totals = {}  # cargo type -> count across systems
+        # Last collection timestamp per (system name, cargo type); entries without
+        # one are stamped on the next expire()
+        self._collected = ExpiryQueue()
+        self._unstamped = set()
+
+    def _count_changed(self, system_name: str, cargo_type: str, delta: int, timestamp: str = None):
+        systems_for_type = self._by_type.setdefault(cargo_type, {})
+        count = systems_for_type.get(system_name, 0) + delta
+        key = (system_name, cargo_type)
+        if count > 0:
+            systems_for_type[system_name] = count
+            if timestamp:
+                self._collected.touch(key, timestamp)
+                self._unstamped.discard(key)
+            elif delta > 0 and key not in self._collected:
+                self._unstamped.add(key)
+        else:
+            systems_for_type.pop(system_name, None)
+            if not systems_for_type:
+                del self._by_type[cargo_type]
+            self._collected.discard(key)
+            self._unstamped.discard(key)
+        total = self._type_totals.get(cargo_type, 0) + delta
+        if total > 0:
+            self._type_totals[cargo_type] = total
+        else:
+            self._type_totals.pop(cargo_type, None)
+
+    def _index(self, system_name: str, salvage: Salvage, sign: int):
+        for cargo_type, cargo in salvage.inventory.items():
+            if cargo.count > 0:
+                self._count_changed(system_name, cargo_type, sign * cargo.count)
+
+    def __setitem__(self, system_name, salvage):
+        if system_name in self:
+            self._index(system_name, dict.__getitem__(self, system_name), -1)
+        super().__setitem__(system_name, salvage)
+        self._index(system_name, salvage, 1)
+
+    def __delitem__(self, system_name):
+        self._index(system_name, dict.__getitem__(self, system_name), -1)
+        super().__delitem__(system_name)
+
+    def pop(self, system_name, *default):
+        if system_name in self:
+            self._index(system_name, dict.__getitem__(self, system_name), -1)
+        return super().pop(system_name, *default)
+
+    def setdefault(self, system_name, salvage=None):
+        if system_name not in self:
+            self[system_name] = salvage
+        return dict.__getitem__(self, system_name)
+
+    def update(self, *args, **kwargs):
+        for system_name, salvage in dict(*args, **kwargs).items():
+            self[system_name] = salvage
+
+    def clear(self):
+        super().clear()
+        self._by_type.clear()
+        self._type_totals.clear()
+        self._collected.clear()
+        self._unstamped.clear()
+
+    def expire(self, cutoff: str, now: str) -> dict:
+        """Move cargo last collected before cutoff into each system's stale bucket
+
+        Args:
+            cutoff: Journal timestamp; cargo collected earlier expires
+            now: Journal timestamp given to cargo that has no collection time yet
+
+        Returns:
+            {system_name: {cargo_type: count}} moved to stale
+        """
+        for key in self._unstamped:
+            self._collected.touch(key, now)
+        self._unstamped.clear()
+
+        moved = {}
+        for system_name, cargo_type in self._collected.pop_expired(cutoff):
+            salvage = dict.__getitem__(self, system_name)
+            count = salvage.inventory.pop(cargo_type).count
+            self._count_changed(system_name, cargo_type, -count)
+            salvage.stale[cargo_type] = salvage.stale.get(cargo_type, 0) + count
+            moved.setdefault(system_name, {})[cargo_type] = count
+        return moved
+
+    def collected_to_dict(self) -> dict:
+        """Collection timestamps for JSON storage: {system: {cargo_type: timestamp}}"""
+        collected = {}
+        for (system_name, cargo_type), timestamp in self._collected.items():
+            collected.setdefault(system_name, {})[cargo_type] = timestamp
+        return collected
+
+    def load_collected(self, collected: dict, stale: dict = None):
+        """Restore collection timestamps and stale buckets after loading the inventory"""
+        for system_name, cargo_types in collected.items():
+            for cargo_type, timestamp in cargo_types.items():
+                if cargo_type in self._by_type and system_name in self._by_type[cargo_type]:
+                    key = (system_name, cargo_type)
+                    self._collected.touch(key, timestamp)
+                    self._unstamped.discard(key)
+        for system_name, cargo_types in (stale or {}).items():
+            if system_name not in self:
+                self[system_name] = Salvage(system_name)
+            dict.__getitem__(self, system_name).stale = dict(cargo_types)
+
+    def stale_total(self) -> int:
+        """Count of stale salvage across all systems"""
+        return sum(sum(salvage.stale.values()) for salvage in self.values())
+
+    def systems_for(self, cargo_type: str) -> dict:
+        """Systems holding a cargo type: {system_name: count}"""
+        return dict(self._by_type.get(cargo_type.lower(), {}))
+
+    def type_total(self, cargo_type: str) -> int:
+        """Count of a cargo type across all systems"""
+        return self._type_totals.get(cargo_type.lower(), 0)
+
+    def total(self) -> int:
+        """Count of all salvage across all systems"""
+        return sum(self._type_totals.values())
+
+
+# salvage.json has had one layout since it was introduced
+SALVAGE_SCHEMA_VERSION = 1
+register_schema("salvage.json", SALVAGE_SCHEMA_VERSION)
+
+
 def save_salvage(create_backup=False):
     """Save salvage inventory to JSON file
 
@@ -97,15 +278,15 @@ def save_salvage(create_backup=False):
         create_backup: If True, creates .backup file (only during updates)
     """
     data = {name: salvage.to_dict() for name, salvage in salvageInventory.items()}
-    save_json("salvage.json", data, create_backup=create_backup)
+    save_document("salvage.json", data, create_backup=create_backup)
 
 
 def load_salvage():
     """Load salvage inventory from JSON file"""
-    data = load_json("salvage.json")
+    data = load_document("salvage.json")
     if data:
         for system_name, salvage_data in data.items():
             salvageInventory[system_name] = Salvage.from_dict(salvage_data)
 
 # Global inventory of all salvage by system
-salvageInventory = {}
+salvageInventory = SalvageInventory()
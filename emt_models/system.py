@@ -1,6 +1,14 @@
+import functools
 import json
 from emt_core.logging import logger
-from emt_core.storage import load_json, save_json, get_file_path
+from emt_core.storage import load_document, save_document, get_file_path
+from emt_core.schema import register_schema, register_migration
+from .registry import SystemRegistry
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; EDMC's bundled Python does not ship it
+    np = None
 
 # PowerPlay CP thresholds for calculating progress percentages
 STRONGHOLD_CP_THRESHOLD = 120000
@@ -41,8 +49,109 @@ def _calc_real_undermining(raw_um: int, raw_reinf: int, progress_pct: float, sys
     decay_amount = _calc_decay_amount(last_cycle_pct, system_type)
     return max(0, int(raw_um - decay_amount))
 
+def _coefficient_arrays(states):
+    """Per-element (coef_a, coef_b, max_cp, known) NumPy arrays for a sequence of states"""
+    names = list(_DECAY_COEFFICIENTS)
+    index = {state: i for i, state in enumerate(names)}
+    codes = np.fromiter((index.get(state, -1) for state in states), dtype=np.int64, count=len(states))
+    known = codes >= 0
+    # Unknown states get (0, 0, 1) so the arithmetic stays finite; their results are masked out
+    table = np.array([_DECAY_COEFFICIENTS[name] for name in names] + [(0.0, 0.0, 1.0)], dtype=np.float64)
+    coeffs = table[codes]  # code -1 selects the trailing placeholder row
+    return coeffs[:, 0], coeffs[:, 1], coeffs[:, 2], known
+
+
+def _decay_from_pct(coef_a, coef_b, max_cp, known, progress_pct):
+    p = progress_pct / 100.0
+    decay = np.maximum(np.trunc(max_cp * (coef_a * p - coef_b)), 0)
+    return np.where(known & (progress_pct > 25.0), decay, 0).astype(np.int64)
+
+
+def _calc_decay_amounts(states, progress_pcts) -> list:
+    """Batch _calc_decay_amount over parallel sequences of system types and progress percentages."""
+    if len(states) != len(progress_pcts):
+        raise ValueError("states and progress_pcts must have the same length")
+    if np is None or not len(states):
+        return [_calc_decay_amount(progress, state) for state, progress in zip(states, progress_pcts)]
+    coef_a, coef_b, max_cp, known = _coefficient_arrays(states)
+    progress = np.asarray(progress_pcts, dtype=np.float64)
+    return _decay_from_pct(coef_a, coef_b, max_cp, known, progress).tolist()
+
+
+def _calc_real_undermining_batch(states, progress_pcts, reinforcements, underminings) -> list:
+    """Batch _calc_real_undermining over parallel sequences; results match the scalar function exactly.
+
+    Uses NumPy when it is installed and the scalar function otherwise.
+    """
+    n = len(states)
+    if not (len(progress_pcts) == len(reinforcements) == len(underminings) == n):
+        raise ValueError("all input sequences must have the same length")
+    if np is None or not n:
+        return [_calc_real_undermining(um, reinf, progress, state)
+                for state, progress, reinf, um in zip(states, progress_pcts, reinforcements, underminings)]
+    coef_a, coef_b, max_cp, known = _coefficient_arrays(states)
+    progress = np.asarray(progress_pcts, dtype=np.float64)
+    raw_reinf = np.asarray(reinforcements, dtype=np.int64)
+    raw_um = np.asarray(underminings, dtype=np.int64)
+
+    current_cp = max_cp * (progress / 100.0)
+    last_cycle_cp = current_cp + raw_um - raw_reinf
+    last_cycle_pct = (last_cycle_cp / max_cp) * 100.0
+    decay = _decay_from_pct(coef_a, coef_b, max_cp, known, last_cycle_pct)
+    real_um = np.maximum(raw_um - decay, 0)
+    return np.where(known & (raw_um != 0), real_um, raw_um).tolist()
+
+
+_CP_THRESHOLDS = {
+    'Stronghold': STRONGHOLD_CP_THRESHOLD,
+    'Fortified': FORTIFIED_CP_THRESHOLD,
+    'Exploited': EXPLOITED_CP_THRESHOLD,
+}
+
+
+def _progress_percent(state, control_progress, top_conflict_progress=None):
+    """Return system progress as a percentage from its state, control progress and leading conflict progress"""
+    threshold = _CP_THRESHOLDS.get(state)
+    if threshold:
+        # If value is already a decimal percentage (0 < x <= 1), convert to percentage
+        if -10 < control_progress <= 10:
+            return control_progress * 100
+        return (control_progress / threshold) * 100
+
+    if top_conflict_progress is not None:
+        # Conflict progress is provided as decimal (0.0-1.0), convert to percentage
+        return top_conflict_progress * 100
+    return 0
+
+
+def _cached_getter(func):
+    """Cache a StarSystem getter's result until the system's fields change (see _invalidate)"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        elif name in cache:
+            return cache[name]
+        value = cache[name] = func(self)
+        return value
+    return wrapper
+
+
 class StarSystem:
+    # Fields always written by to_dict, in order
+    _FIELDS = ("StarSystem", "Merits", "Active", "PowerplayState", "ControllingPower", "Powers", "Opposition",
+               "PowerplayConflictProgress", "PowerplayStateControlProgress", "PowerplayStateReinforcement",
+               "PowerplayStateUndermining", "RealUndermining", "reported")
+    # Fields only written when set
+    _OPTIONAL_FIELDS = ("PrimaryEconomy", "SecondaryEconomy", "SystemSecurity", "SystemAllegiance",
+                        "SystemGovernment", "Population")
+    __slots__ = _FIELDS + _OPTIONAL_FIELDS + ("idSystem", "_cache")
+
     def __init__(self, eventEntry=None, commander: str = ""):
+        self._cache = None
         if eventEntry is None:
             self._init_defaults()
             return
@@ -80,8 +189,19 @@ class StarSystem:
         for key, value in defaults.items():
             setattr(self, key, value)
 
+    def _invalidate(self):
+        """Drop cached derived values and tell the registry; call after fields change
+
+        Only the object the registry tracks under this name notifies, so
+        temporary copies (migration, from_dict, read-only walks) stay silent.
+        """
+        self._cache = None
+        if systems.owns(self.StarSystem, self):
+            systems.notify(self.StarSystem)
+
     def _update_from_entry(self, eventEntry):
         """Update system data from event entry"""
+        self._cache = None  # RealUndermining below reads the cached progress
         self.PowerplayState = str(eventEntry.get("PowerplayState", "no PP connection"))
         self.ControllingPower = str(eventEntry.get("ControllingPower", "no power"))
         self.Powers = self._safe_list(eventEntry.get("Powers", []))
@@ -118,6 +238,7 @@ class StarSystem:
         self.SystemAllegiance = eventEntry.get("SystemAllegiance")
         self.SystemGovernment = eventEntry.get("SystemGovernment_Localised")
         self.Population = eventEntry.get("Population")
+        self._invalidate()
 
     def _parse_security_level(self, security_string):
         """Parse security level from game formats like '$SYSTEM_SECURITY_low;' or '$galaxy_map_info_state_anarchy;'"""
@@ -163,82 +284,77 @@ class StarSystem:
     def addMerits(self, gained=0):
         """Add merits to current total"""
         self.Merits += int(gained)
+        self._invalidate()
+
+    def setMerits(self, value=0):
+        """Set merit total (e.g. reset to 0 after reporting)"""
+        self.Merits = int(value)
+        self._invalidate()
 
     def setReported(self, value=False):
         """Set reported status"""
         self.reported = bool(value)
+        self._invalidate()
 
+    @_cached_getter
     def getSystemProgressNumber(self):
         """Get system progress as percentage"""
-        if self.PowerplayState == 'Stronghold':
-            # If value is already a decimal percentage (0 < x <= 1), convert to percentage
-            if -10 < self.PowerplayStateControlProgress <= 10:
-                return self.PowerplayStateControlProgress * 100
-            return (self.PowerplayStateControlProgress / STRONGHOLD_CP_THRESHOLD) * 100
-        elif self.PowerplayState == 'Fortified':
-            # If value is already a decimal percentage (0 < x <= 1), convert to percentage
-            if -10 < self.PowerplayStateControlProgress <= 10:
-                return self.PowerplayStateControlProgress * 100
-            return (self.PowerplayStateControlProgress / FORTIFIED_CP_THRESHOLD) * 100
-        elif self.PowerplayState == 'Exploited':
-            # If value is already a decimal percentage (0 < x <= 1), convert to percentage
-            if -10 < self.PowerplayStateControlProgress <= 10:
-                return self.PowerplayStateControlProgress * 100
-            return (self.PowerplayStateControlProgress / EXPLOITED_CP_THRESHOLD) * 100
-
-        if self.PowerplayConflictProgress:
-            # Conflict progress is provided as decimal (0.0-1.0), convert to percentage
-            return self.PowerplayConflictProgress[0].progress * 100
-        return 0
+        top_conflict = self.PowerplayConflictProgress[0].progress if self.PowerplayConflictProgress else None
+        return _progress_percent(self.PowerplayState, self.PowerplayStateControlProgress, top_conflict)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
-        result = {
-            "StarSystem": self.StarSystem,
-            "Merits": self.Merits,
-            "Active": self.Active,
-            "PowerplayState": self.PowerplayState,
-            "ControllingPower": self.ControllingPower,
-            "Powers": self.Powers,
-            "Opposition": self.Opposition,
-            "PowerplayConflictProgress": [vars(p) for p in self.PowerplayConflictProgress],
-            "PowerplayStateControlProgress": self.PowerplayStateControlProgress,
-            "PowerplayStateReinforcement": self.PowerplayStateReinforcement,
-            "PowerplayStateUndermining": self.PowerplayStateUndermining,
-            "RealUndermining": self.RealUndermining,
-            "reported": self.reported
-        }
+        result = {field: getattr(self, field) for field in self._FIELDS}
+        result["PowerplayConflictProgress"] = [p.to_dict() for p in self.PowerplayConflictProgress]
         # Include economy, security, allegiance, government, and population if they exist
-        if hasattr(self, 'PrimaryEconomy') and self.PrimaryEconomy:
-            result["PrimaryEconomy"] = self.PrimaryEconomy
-        if hasattr(self, 'SecondaryEconomy') and self.SecondaryEconomy:
-            result["SecondaryEconomy"] = self.SecondaryEconomy
-        if hasattr(self, 'SystemSecurity') and self.SystemSecurity:
-            result["SystemSecurity"] = self.SystemSecurity
-        if hasattr(self, 'SystemAllegiance') and self.SystemAllegiance:
-            result["SystemAllegiance"] = self.SystemAllegiance
-        if hasattr(self, 'SystemGovernment') and self.SystemGovernment:
-            result["SystemGovernment"] = self.SystemGovernment
-        if hasattr(self, 'Population') and self.Population:
-            result["Population"] = self.Population
+        for field in self._OPTIONAL_FIELDS:
+            value = getattr(self, field, None)
+            if value:
+                result[field] = value
         return result
 
     def from_dict(self, data: dict = {}):
-        """Load from dictionary"""
+        """Load from a dictionary in the current systems.json schema (see to_dict)"""
         self.StarSystem = str(data.get("StarSystem", "unknown system"))
         self.Merits = int(data.get("Merits", 0))
         self.Active = bool(data.get("Active", False))
         self.reported = bool(data.get("reported", False))
-        self._update_from_entry(data)
-        self.Opposition = self._safe_list(data.get("Opposition", []))
-        # Load economy, security, allegiance, government, and population if they were saved
+        self.PowerplayState = data.get("PowerplayState", "no PP connection")
+        self.ControllingPower = data.get("ControllingPower", "no power")
+        self.Powers = data.get("Powers", [])
+        self.Opposition = data.get("Opposition", [])
+        self.PowerplayConflictProgress = [PowerConflictEntry(p["power"], p["progress"])
+                                          for p in data.get("PowerplayConflictProgress", [])]
+        self.PowerplayStateControlProgress = float(data.get("PowerplayStateControlProgress", 0.0))
+        self.PowerplayStateReinforcement = int(data.get("PowerplayStateReinforcement", 0))
+        self.PowerplayStateUndermining = int(data.get("PowerplayStateUndermining", 0))
+        self.RealUndermining = int(data.get("RealUndermining", 0))
         self.PrimaryEconomy = data.get("PrimaryEconomy", None)
         self.SecondaryEconomy = data.get("SecondaryEconomy", None)
         self.SystemSecurity = data.get("SystemSecurity", None)
         self.SystemAllegiance = data.get("SystemAllegiance", None)
         self.SystemGovernment = data.get("SystemGovernment", None)
         self.Population = data.get("Population", None)
+        self._invalidate()
+
+    def _from_legacy_dict(self, data: dict):
+        """Load from a schema v1 dictionary, re-deriving fields the way journal events are processed"""
+        self.StarSystem = str(data.get("StarSystem", "unknown system"))
+        self.Merits = int(data.get("Merits", 0))
+        self.Active = bool(data.get("Active", False))
+        self.reported = bool(data.get("reported", False))
+        self._update_from_entry(data)
+        if "Opposition" in data:
+            self.Opposition = self._safe_list(data["Opposition"])
+        self.PrimaryEconomy = data.get("PrimaryEconomy", None)
+        self.SecondaryEconomy = data.get("SecondaryEconomy", None)
+        self.SystemSecurity = self._parse_security_level(data.get("SystemSecurity", None))
+        self.SystemAllegiance = data.get("SystemAllegiance", None)
+        self.SystemGovernment = data.get("SystemGovernment", None)
+        self.Population = data.get("Population", None)
+        self._invalidate()
 
+    @_cached_getter
     def getPowerPlayCycleNetStatusText(self):
         """Get formatted status text showing real undermining vs reinforcement"""
         reinf = self.PowerplayStateReinforcement
@@ -249,6 +365,7 @@ class StarSystem:
         decay_str = f" ({decay:,} decay)" if decay > 0 else ""
         return f"UM: {real_um:,}{decay_str} | Reinf: {reinf:,}"
 
+    @_cached_getter
     def getSystemStateText(self):
         """Get readable system state"""
         if not self.PowerplayState:
@@ -273,6 +390,7 @@ class StarSystem:
 
         return self.PowerplayState
 
+    @_cached_getter
     def getSystemStatusShort(self):
         """Get short abbreviation for system status (for @SystemStatus variable)"""
         state = self.getSystemStateText()
@@ -315,10 +433,15 @@ class StarSystem:
 
 
 class PowerConflictEntry:
+    __slots__ = ("power", "progress")
+
     def __init__(self, power, progress):
         self.power = str(power)
         self.progress = float(progress)
 
+    def to_dict(self):
+        return {"power": self.power, "progress": self.progress}
+
 
 class PowerConflict:
     def __init__(self, data):
@@ -337,10 +460,27 @@ class PowerConflict:
 class SystemEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, (StarSystem, PowerConflictEntry)):
-            return o.__dict__
+            return o.to_dict()
         return super().default(o)
 
 
+SYSTEMS_SCHEMA_VERSION = 2
+register_schema("systems.json", SYSTEMS_SCHEMA_VERSION)
+
+
+@register_migration("systems.json", 1)
+def _migrate_systems_v1(data):
+    """v1 -> v2: normalise conflict entries, security and derived fields so from_dict can trust them"""
+    migrated = {}
+    for name, system_data in data.items():
+        if not isinstance(system_data, dict):
+            continue
+        system = StarSystem()
+        system._from_legacy_dict(system_data)
+        migrated[name] = system.to_dict()
+    return migrated
+
+
 def dumpSystems(create_backup=False):
     """Save systems to JSON file
 
@@ -348,22 +488,47 @@ def dumpSystems(create_backup=False):
         create_backup: If True, creates .backup file (only during updates)
     """
     filtered_systems = {
-        name: data.to_dict()
-        for name, data in systems.items()
-        if (not data.reported and data.Merits > 0) or data.Active
+        name: data
+        for name, data in systems.serialized_items()
+        if (not data.get("reported") and data.get("Merits", 0) > 0) or data.get("Active")
     }
-    save_json("systems.json", filtered_systems, encoder=SystemEncoder, create_backup=create_backup)
+    save_document("systems.json", filtered_systems, encoder=SystemEncoder, create_backup=create_backup)
 
 
 def loadSystems():
-    """Load systems from JSON file"""
-    data = load_json("systems.json")
+    """Load systems from JSON file
+
+    Entries are kept as parsed dicts; StarSystem objects are built on first access.
+    """
+    data = load_document("systems.json")
     if data:
-        for name, system_data in data.items():
-            if isinstance(system_data, dict):
-                system = StarSystem()
-                system.from_dict(system_data)
-                systems[name] = system
+        systems.load_raw({name: system_data for name, system_data in data.items() if isinstance(system_data, dict)})
+
+
+def active_systems():
+    """Systems flagged Active, without materialising lazily loaded entries that are not"""
+    return [system for _, system in systems.select(lambda s: s.Active, lambda d: bool(d.get("Active")))]
+
+
+def peek_systems():
+    """(name, StarSystem) for every system without loading or evicting registry entries
+
+    Lazy and spilled entries are returned as throwaway copies, so this is for
+    read-only walks such as exports; changes to those copies are not kept.
+    """
+    for name, entry in systems.peek_items():
+        yield name, entry if isinstance(entry, StarSystem) else _system_from_dict(entry)
+
+
+def _system_from_dict(data):
+    system = StarSystem()
+    system.from_dict(data)
+    return system
+
+
+def _system_evictable(system):
+    """Only inactive systems without merits may be spilled out of memory"""
+    return not system.Active and system.Merits == 0
 
 
-systems = {} 
\ No newline at end of file
+systems = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable) 
\ No newline at end of file
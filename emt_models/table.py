@@ -0,0 +1,362 @@
+# models/table.py - Column-oriented view of the systems registry
+from array import array
+from emt_core.trie import PrefixTrie
+from .system import systems, _progress_percent, _calc_real_undermining_batch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; EDMC's bundled Python does not ship it
+    np = None
+
+# Numeric columns and their array typecodes
+NUMERIC_COLUMNS = {
+    "progress": "d",
+    "reinforcement": "q",
+    "undermining": "q",
+    "real_undermining": "q",
+    "merits": "q",
+}
+# String columns, stored dictionary-encoded as int codes
+CATEGORY_COLUMNS = ("state", "power")
+
+AGGREGATES = ("sum", "count", "min", "max", "mean")
+
+
+def _row_values(entry):
+    """Column values for a StarSystem or its serialized dict, in NUMERIC_COLUMNS + CATEGORY_COLUMNS order"""
+    if isinstance(entry, dict):
+        state = entry.get("PowerplayState", "no PP connection")
+        conflict = entry.get("PowerplayConflictProgress") or []
+        progress = _progress_percent(state, float(entry.get("PowerplayStateControlProgress", 0.0)),
+                                     conflict[0]["progress"] if conflict else None)
+        return (progress,
+                int(entry.get("PowerplayStateReinforcement", 0)),
+                int(entry.get("PowerplayStateUndermining", 0)),
+                int(entry.get("RealUndermining", 0)),
+                int(entry.get("Merits", 0)),
+                state,
+                entry.get("ControllingPower", "no power"))
+    return (entry.getSystemProgressNumber(),
+            entry.PowerplayStateReinforcement,
+            entry.PowerplayStateUndermining,
+            entry.RealUndermining,
+            entry.Merits,
+            entry.PowerplayState,
+            entry.ControllingPower)
+
+
+class SystemTable:
+    """Columnar companion to the systems registry for sorting, filtering and grouping.
+
+    Numeric fields are held in `array` columns and state/controlling power are
+    dictionary-encoded, one row per system. The registry reports changes (see
+    SystemRegistry.add_listener), which are applied on the next query, so
+    journal processing only pays for adding a name to a set.
+
+    Queries run over whole columns: with NumPy installed they use vectorised
+    argsort/masks/bincount on zero-copy views of the arrays, otherwise the
+    equivalent C-level builtins (sorted with __getitem__ keys, comprehensions).
+    Lazy and spilled systems are read from their dicts, never materialised.
+
+    State and controlling power also have inverted indexes (value -> names)
+    and system names a prefix trie, so filter() and search() cost time in
+    proportion to the matches rather than the table size.
+    """
+
+    def __init__(self, registry, use_numpy=True):
+        """
+        Args:
+            registry: SystemRegistry to mirror
+            use_numpy: Use NumPy for queries when it is installed
+        """
+        self._registry = registry
+        self.use_numpy = use_numpy and np is not None
+        self._dirty = set()
+        self._stale = True
+        self._reset()
+        registry.add_listener(self._on_change)
+
+    def _reset(self):
+        self._names = []  # row -> system name
+        self._rows = {}   # system name -> row
+        self._columns = {column: array(code) for column, code in NUMERIC_COLUMNS.items()}
+        self._codes = {column: array("i") for column in CATEGORY_COLUMNS}
+        self._categories = {column: [] for column in CATEGORY_COLUMNS}  # code -> value
+        self._lookup = {column: {} for column in CATEGORY_COLUMNS}      # value -> code
+        self._members = {column: {} for column in CATEGORY_COLUMNS}     # code -> set of names
+        self._trie = PrefixTrie()                                       # lower-cased name -> name
+
+    # ----- synchronisation -----
+
+    def _on_change(self, name):
+        if name is None:
+            self._stale = True
+            self._dirty.clear()
+        elif not self._stale:
+            self._dirty.add(name)
+
+    def _refresh(self):
+        if self._stale:
+            self._reset()
+            for name, entry in self._registry.peek_items():
+                self._upsert(name, entry)
+            self._stale = False
+            self._dirty.clear()
+        elif self._dirty:
+            for name in self._dirty:
+                entry = self._registry.peek(name)
+                if entry is None:
+                    self._remove(name)
+                else:
+                    self._upsert(name, entry)
+            self._dirty.clear()
+
+    def _encode(self, column, value):
+        lookup = self._lookup[column]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._categories[column])
+            self._categories[column].append(value)
+        return code
+
+    def _upsert(self, name, entry):
+        values = _row_values(entry)
+        row = self._rows.get(name)
+        if row is None:
+            self._rows[name] = len(self._names)
+            self._names.append(name)
+            self._trie.insert(name, name)
+            for column, value in zip(NUMERIC_COLUMNS, values):
+                self._columns[column].append(value)
+            for column, value in zip(CATEGORY_COLUMNS, values[len(NUMERIC_COLUMNS):]):
+                code = self._encode(column, value)
+                self._codes[column].append(code)
+                self._members[column].setdefault(code, set()).add(name)
+        else:
+            for column, value in zip(NUMERIC_COLUMNS, values):
+                self._columns[column][row] = value
+            for column, value in zip(CATEGORY_COLUMNS, values[len(NUMERIC_COLUMNS):]):
+                code = self._encode(column, value)
+                old = self._codes[column][row]
+                if code != old:
+                    self._members[column][old].discard(name)
+                    self._members[column].setdefault(code, set()).add(name)
+                    self._codes[column][row] = code
+
+    def _remove(self, name):
+        """Drop a row by moving the last row into its place"""
+        row = self._rows.pop(name, None)
+        if row is None:
+            return
+        self._trie.remove(name, name)
+        for column in CATEGORY_COLUMNS:
+            self._members[column][self._codes[column][row]].discard(name)
+        last = len(self._names) - 1
+        if row != last:
+            moved = self._names[last]
+            self._names[row] = moved
+            self._rows[moved] = row
+            for col in list(self._columns.values()) + list(self._codes.values()):
+                col[row] = col[last]
+        self._names.pop()
+        for col in list(self._columns.values()) + list(self._codes.values()):
+            col.pop()
+
+    # ----- column access -----
+
+    def __len__(self):
+        self._refresh()
+        return len(self._names)
+
+    def names(self):
+        """System names in row order"""
+        self._refresh()
+        return list(self._names)
+
+    def column(self, column):
+        """Values of a column in row order (numbers, or strings for state/power)"""
+        self._refresh()
+        if column in CATEGORY_COLUMNS:
+            values = self._categories[column]
+            return [values[code] for code in self._codes[column]]
+        return self._columns[column].tolist()
+
+    def categories(self, column):
+        """Sorted distinct non-empty values currently present in a state/power column"""
+        self._refresh()
+        values = self._categories[column]
+        return sorted(values[code] for code, names in self._members[column].items() if names and values[code])
+
+    def members(self, column, value):
+        """Names with this state/power value (a read-only view of the inverted index)"""
+        self._refresh()
+        code = self._lookup[column].get(value)
+        return frozenset(self._members[column].get(code, ())) if code is not None else frozenset()
+
+    def search(self, prefix, limit=None):
+        """System names starting with prefix (case-insensitive), in alphabetical order
+
+        Args:
+            prefix: Typed text; "" lists every system
+            limit: Return at most this many names
+        """
+        self._refresh()
+        return self._trie.search(prefix, limit)
+
+    def _sort_keys(self, column):
+        """Array whose order matches the column's: numbers as-is, categories by their sorted value rank"""
+        if column in CATEGORY_COLUMNS:
+            values = self._categories[column]
+            rank = [0] * len(values)
+            for position, code in enumerate(sorted(range(len(values)), key=lambda c: str(values[c]).lower())):
+                rank[code] = position
+            return array("i", [rank[code] for code in self._codes[column]])
+        return self._columns[column]
+
+    def _view(self, col):
+        return np.frombuffer(col, dtype=np.dtype(col.typecode))
+
+    # ----- queries -----
+
+    def sort(self, column, reverse=False, names=None):
+        """System names ordered by a column; ties keep their given order in both directions
+
+        Args:
+            column: Numeric or state/power column
+            reverse: Descending order
+            names: Only sort these names (e.g. the result of filter()); default all rows
+        """
+        self._refresh()
+        keys = self._sort_keys(column)
+        rows = range(len(self._names)) if names is None else [self._rows[name] for name in names]
+        if self.use_numpy and len(rows):
+            rows = np.asarray(rows)
+            view = self._view(keys)[rows]
+            order = rows[np.argsort(-view if reverse else view, kind="stable")]
+            return [self._names[row] for row in order.tolist()]
+        order = sorted(rows, key=keys.__getitem__, reverse=reverse)
+        return [self._names[row] for row in order]
+
+    def _matching_rows(self, state=None, power=None, min_merits=None):
+        """Row numbers matching every given criterion"""
+        criteria = []
+        for column, value in (("state", state), ("power", power)):
+            if value is not None:
+                code = self._lookup[column].get(value)
+                if code is None:
+                    return []
+                criteria.append((self._codes[column], code))
+
+        if self.use_numpy and self._names:
+            mask = np.ones(len(self._names), dtype=bool)
+            for col, code in criteria:
+                mask &= self._view(col) == code
+            if min_merits is not None:
+                mask &= self._view(self._columns["merits"]) >= min_merits
+            return np.nonzero(mask)[0].tolist()
+
+        rows = range(len(self._names))
+        for col, code in criteria:
+            rows = [row for row in rows if col[row] == code]
+        if min_merits is not None:
+            merits = self._columns["merits"]
+            rows = [row for row in rows if merits[row] >= min_merits]
+        return list(rows)
+
+    def filter(self, state=None, power=None, min_merits=None, prefix=None):
+        """System names matching every given criterion, in row order
+
+        With a state, power or prefix the candidates come from the inverted
+        indexes and the trie, starting from the smallest set, so the cost
+        follows the number of matches.
+
+        Args:
+            state: Exact PowerplayState
+            power: Exact ControllingPower
+            min_merits: Minimum merit count
+            prefix: Case-insensitive system name prefix
+        """
+        self._refresh()
+        if state is None and power is None and not prefix:
+            return [self._names[row] for row in self._matching_rows(state, power, min_merits)]
+
+        candidates = []
+        for column, value in (("state", state), ("power", power)):
+            if value is not None:
+                code = self._lookup[column].get(value)
+                if code is None:
+                    return []
+                candidates.append(self._members[column].get(code, set()))
+        if prefix:
+            candidates.append(self._trie.search(prefix))
+        candidates.sort(key=len)
+        names = candidates[0]
+        if len(candidates) > 1:
+            names = set(names).intersection(*candidates[1:])
+        rows = [self._rows[name] for name in names]
+        if min_merits is not None:
+            merits = self._columns["merits"]
+            rows = [row for row in rows if merits[row] >= min_merits]
+        rows.sort()
+        return [self._names[row] for row in rows]
+
+    def group_by(self, category, column, agg="sum"):
+        """Aggregate a numeric column per state/power value
+
+        Args:
+            category: "state" or "power"
+            column: Numeric column to aggregate (ignored for "count")
+            agg: One of AGGREGATES
+
+        Returns:
+            {category value: aggregate}
+        """
+        if agg not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {agg}")
+        self._refresh()
+        codes = self._codes[category]
+        values = self._columns[column]
+        labels = self._categories[category]
+
+        if self.use_numpy and agg in ("sum", "count", "mean") and len(codes):
+            code_view = self._view(codes)
+            counts = np.bincount(code_view, minlength=len(labels))
+            sums = np.bincount(code_view, weights=self._view(values), minlength=len(labels))
+            present = np.nonzero(counts)[0].tolist()
+            if agg == "count":
+                return {labels[c]: int(counts[c]) for c in present}
+            if agg == "mean":
+                return {labels[c]: float(sums[c] / counts[c]) for c in present}
+            cast = float if values.typecode == "d" else int
+            return {labels[c]: cast(sums[c]) for c in present}
+
+        groups = {}
+        for code, value in zip(codes, values):
+            groups.setdefault(code, []).append(value)
+        reduce = {"sum": sum, "count": len, "min": min, "max": max,
+                  "mean": lambda v: sum(v) / len(v)}[agg]
+        return {labels[code]: reduce(group) for code, group in groups.items()}
+
+    def recalculate_real_undermining(self):
+        """Recompute the real undermining column from the decay model in one batch
+
+        Use after a change to the decay formula or coefficients.
+
+        Returns:
+            {name: new value} for rows whose value changed
+        """
+        self._refresh()
+        states = self.column("state")
+        recalculated = _calc_real_undermining_batch(states, self._columns["progress"],
+                                                    self._columns["reinforcement"], self._columns["undermining"])
+        column = self._columns["real_undermining"]
+        changed = {}
+        for row, value in enumerate(recalculated):
+            if column[row] != value:
+                column[row] = value
+                changed[self._names[row]] = value
+        return changed
+
+
+# Global instance mirroring `systems`
+system_table = SystemTable(systems)
@@ -2,3 +2,4 @@
 from .undermining import is_valid_um_data
 from .reinforcement import is_valid_reinf_data
 from .acquisition import is_valid_acq_data
+from .classifier import classify_pp_data, PP_DATA_TYPES, PP_UM, PP_REINF, PP_ACQ
@@ -0,0 +1,28 @@
+# classifier.py - Single-lookup classification of PowerPlay data types
+from .undermining import VALID_UNDERMINING_DATA_TYPES
+from .reinforcement import VALID_REINFORCEMENT_DATA_TYPES
+from .acquisition import VALID_ACQUISITION_DATA_TYPES
+
+# Category bits
+PP_UM = 1
+PP_REINF = 2
+PP_ACQ = 4
+
+# Lowercase name -> (category mask, display name), built once from the per-category tables
+PP_DATA_TYPES = {}
+for _mask, _types in ((PP_UM, VALID_UNDERMINING_DATA_TYPES),
+                      (PP_REINF, VALID_REINFORCEMENT_DATA_TYPES),
+                      (PP_ACQ, VALID_ACQUISITION_DATA_TYPES)):
+    for _name, _display in _types.items():
+        _current_mask, _current_display = PP_DATA_TYPES.get(_name, (0, _display))
+        PP_DATA_TYPES[_name] = (_current_mask | _mask, _current_display)
+del _mask, _types, _name, _display, _current_mask, _current_display
+
+
+def classify_pp_data(name: str) -> tuple:
+    """Category mask and display name of a data type, (0, name) if it is not PowerPlay data
+
+    Args:
+        name: Data type name, already lowercase
+    """
+    return PP_DATA_TYPES.get(name, (0, name))
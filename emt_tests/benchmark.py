@@ -0,0 +1,718 @@
+"""
+Benchmark helpers for EliteMeritTracker
+
+Shared timing utilities plus the end-to-end journal throughput benchmark.
+Run directly for larger streams than the test suite uses:
+
+    python -m emt_tests.benchmark --events 1000000 --seed 42
+"""
+import sys
+import time
+import tempfile
+import tracemalloc
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Allow running as a script from the plugin directory
+plugin_dir = Path(__file__).parent.parent
+if str(plugin_dir) not in sys.path:
+    sys.path.insert(0, str(plugin_dir))
+
+import emt_tests.mocks  # noqa: F401  (installs EDMC mocks before plugin imports)
+from emt_tests.journal_generator import JournalGenerator
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of an already sorted list (nearest-rank).
+
+    Args:
+        sorted_values: Values sorted ascending
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def timed(func, *args, repeat: int = 1, **kwargs) -> float:
+    """Return the best wall time in seconds of `repeat` calls to func."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextmanager
+def scratch_data_dir():
+    """
+    Point the plugin's data directory at a temporary one for the duration.
+
+    journal_entry saves the backpack, expiry and reconciliation files as it
+    goes; benchmarks must never overwrite the data/ of the checkout or install.
+
+    Yields:
+        Path of the temporary data directory
+    """
+    import emt_core.storage as storage
+
+    saved = storage.get_data_dir, storage.get_plugin_dir
+    with tempfile.TemporaryDirectory(prefix="emt-bench-") as data_dir:
+        storage.get_data_dir = storage.get_plugin_dir = lambda: data_dir
+        try:
+            yield data_dir
+        finally:
+            storage.get_data_dir, storage.get_plugin_dir = saved
+
+
+def reset_plugin_state():
+    """Reset all module-level plugin state touched by journal_entry."""
+    from unittest.mock import MagicMock
+    import load
+    from emt_models.system import systems
+    from emt_models.salvage import salvageInventory
+    from emt_models.backpack import playerBackpack
+    from emt_models.power import pledgedPower
+    from emt_core.state import state
+    from emt_core.duplicate import reset_duplicate_tracking
+
+    systems.clear()
+    salvageInventory.clear()
+    playerBackpack.umbag.clear()
+    playerBackpack.reinfbag.clear()
+    playerBackpack.acqbag.clear()
+    pledgedPower.__init__()
+    state.__init__()
+    reset_duplicate_tracking()
+    load.trackerFrame = MagicMock()
+
+
+def run_journal_benchmark(events: int = 100_000, seed: int = 0, system_count: int = 500,
+                          measure_memory: bool = True) -> Dict[str, Any]:
+    """
+    Push a synthetic journal stream through load.journal_entry and measure it.
+
+    Events are generated up front so generator cost is excluded from timings.
+    Memory is measured in a second pass under tracemalloc because tracing
+    distorts per-event latency.
+
+    Args:
+        events: Number of journal events to process
+        seed: Generator seed
+        system_count: Number of distinct systems in the stream
+        measure_memory: If True, also report peak traced memory
+
+    Returns:
+        Dict with events, seconds, events_per_sec, p50_us, p99_us, max_us,
+        peak_memory_kb (None if not measured) and systems (tracked at the end)
+    """
+    generator = JournalGenerator(seed=seed, system_count=system_count, pledged_power="Felicia Winters")
+    stream = list(generator.events(events))
+    with scratch_data_dir():
+        return _journal_benchmark(stream, generator.pledged_power, measure_memory)
+
+
+def _journal_benchmark(stream, pledged_power, measure_memory):
+    import load
+    from emt_models.system import systems
+
+    journal_entry = load.journal_entry
+    clock = time.perf_counter_ns
+
+    reset_plugin_state()
+    load.pledgedPower.Power = pledged_power
+    latencies = []
+    append = latencies.append
+    start = clock()
+    for entry in stream:
+        t0 = clock()
+        journal_entry("BenchCMDR", False, None, None, entry, None)
+        append(clock() - t0)
+    elapsed = (clock() - start) / 1e9
+    tracked = len(systems)
+
+    peak_kb: Optional[float] = None
+    if measure_memory:
+        reset_plugin_state()
+        load.pledgedPower.Power = pledged_power
+        tracemalloc.start()
+        for entry in stream:
+            journal_entry("BenchCMDR", False, None, None, entry, None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kb = peak / 1024
+
+    latencies.sort()
+    return {
+        "events": len(stream),
+        "seconds": elapsed,
+        "events_per_sec": len(stream) / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 50) / 1000,
+        "p99_us": percentile(latencies, 99) / 1000,
+        "max_us": latencies[-1] / 1000 if latencies else 0.0,
+        "peak_memory_kb": peak_kb,
+        "systems": tracked,
+    }
+
+
+def run_storage_benchmark(system_count: int = 10_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare systems.json save/load latency on the JSON and SQLite backends.
+
+    Systems come from the journal generator's pool so their dicts have the
+    same shape as real saves. The SQLite store uses a fresh database in the
+    current data directory; callers should point storage at a scratch dir.
+
+    Args:
+        system_count: Number of systems to save and load
+        seed: Generator seed
+
+    Returns:
+        Dict with systems, json_save_ms, json_load_ms, sqlite_save_all_ms,
+        sqlite_save_one_ms (one system changed), sqlite_load_ms
+    """
+    import random
+    import emt_core.storage as storage
+    from emt_models.system import StarSystem
+
+    generator = JournalGenerator(seed=seed, system_count=system_count)
+    pool = generator._build_systems(random.Random(seed))
+    documents = {entry["StarSystem"]: StarSystem(entry).to_dict() for entry in pool}
+    for merits, name in enumerate(documents):
+        documents[name]["Merits"] = merits
+
+    json_save = timed(storage.save_json, "systems.json", documents, repeat=3)
+    json_load = timed(storage.load_json, "systems.json", repeat=3)
+
+    store = storage.SQLiteStore()
+    sqlite_save_all = timed(store.save_document, "systems.json", documents)
+    changed = next(iter(documents))
+
+    def save_one():
+        documents[changed]["Merits"] += 1
+        store.save_document("systems.json", documents)
+
+    sqlite_save_one = timed(save_one, repeat=3)
+    sqlite_load = timed(store.load_document, "systems.json", repeat=3)
+    store.close()
+
+    return {
+        "systems": system_count,
+        "json_save_ms": json_save * 1000,
+        "json_load_ms": json_load * 1000,
+        "sqlite_save_all_ms": sqlite_save_all * 1000,
+        "sqlite_save_one_ms": sqlite_save_one * 1000,
+        "sqlite_load_ms": sqlite_load * 1000,
+    }
+
+
+def run_startup_benchmark(system_count: int = 10_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare loading systems.json eagerly (one StarSystem per entry) with the
+    registry's lazy loading, which keeps parsed dicts until first access.
+
+    Writes systems.json to the current data directory; callers should point
+    storage at a scratch dir.
+
+    Args:
+        system_count: Number of systems in the file
+        seed: Generator seed
+
+    Returns:
+        Dict with systems, parse_ms (json load only), eager_ms, lazy_ms and speedup
+    """
+    import random
+    import emt_core.storage as storage
+    from emt_models.system import StarSystem, systems, loadSystems
+
+    generator = JournalGenerator(seed=seed, system_count=system_count)
+    pool = generator._build_systems(random.Random(seed))
+    documents = {entry["StarSystem"]: dict(StarSystem(entry).to_dict(), Merits=1) for entry in pool}
+    storage.save_json("systems.json", documents)
+
+    def eager():
+        for name, data in storage.load_json("systems.json").items():
+            system = StarSystem()
+            system.from_dict(data)
+
+    def lazy():
+        systems.clear()
+        loadSystems()
+
+    previous = dict(systems)
+    try:
+        parse = timed(storage.load_json, "systems.json", repeat=3)
+        eager_time = timed(eager, repeat=3)
+        lazy_time = timed(lazy, repeat=3)
+        loaded = len(systems)
+    finally:
+        systems.clear()
+        systems.update(previous)
+
+    return {
+        "systems": loaded,
+        "parse_ms": parse * 1000,
+        "eager_ms": eager_time * 1000,
+        "lazy_ms": lazy_time * 1000,
+        "speedup": eager_time / lazy_time if lazy_time else 0.0,
+    }
+
+
+def run_durability_benchmark(rounds: int = 10, system_count: int = 2_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time an update_json_file-sized save (systems, backpack, salvage, power) in
+    every durability mode, once as separate saves and once as a group commit.
+
+    Writes to the current data directory; callers should point storage at a
+    scratch dir.
+
+    Args:
+        rounds: Saves per mode; the median round is reported
+        system_count: Number of systems in systems.json
+        seed: Generator seed
+
+    Returns:
+        Dict with "<mode>_ms" and "<mode>_group_ms" median milliseconds per round
+    """
+    import random
+    import emt_core.storage as storage
+    from emt_models.system import StarSystem
+
+    generator = JournalGenerator(seed=seed, system_count=system_count)
+    pool = generator._build_systems(random.Random(seed))
+    documents = {
+        "systems.json": {entry["StarSystem"]: StarSystem(entry).to_dict() for entry in pool},
+        "backpack.json": {"umbag": {"powerspyware": {"Sol": 3}}, "reinfbag": {}, "acqbag": {}},
+        "salvage.json": {"Sol": {"system_name": "Sol", "inventory": {}}},
+        "power.json": {"Power": generator.pledged_power, "Merits": 1000},
+    }
+
+    def save_all():
+        for filename, data in documents.items():
+            storage.save_json(filename, data)
+
+    def save_grouped():
+        with storage.group_commit():
+            save_all()
+
+    previous = storage.get_durability()
+    results: Dict[str, Any] = {"files": len(documents), "systems": system_count}
+    try:
+        for mode in storage.DURABILITY_MODES:
+            storage.set_durability(mode)
+            for label, func in ((mode, save_all), (f"{mode}_group", save_grouped)):
+                samples = sorted(timed(func) for _ in range(rounds))
+                results[f"{label}_ms"] = percentile(samples, 50) * 1000
+    finally:
+        storage.set_durability(previous)
+    return results
+
+
+class _DictObject:
+    """Attribute holder with a per-instance __dict__, as the models were before __slots__."""
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+
+def run_memory_benchmark(system_count: int = 100_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare tracemalloc memory for slotted StarSystem objects with __dict__-based ones.
+
+    Both variants are built from the same to_dict() documents, so the field
+    values themselves are shared and the difference is the per-object overhead.
+
+    Args:
+        system_count: Number of systems to build
+        seed: Generator seed
+
+    Returns:
+        Dict with systems, dict_mb, slots_mb, bytes per system for each and the saving
+    """
+    import random
+    from emt_models.system import StarSystem
+
+    generator = JournalGenerator(seed=seed, system_count=min(system_count, 5_000))
+    pool = generator._build_systems(random.Random(seed))
+    templates = [StarSystem(entry).to_dict() for entry in pool]
+    documents = [dict(templates[i % len(templates)], StarSystem=f"System {i}") for i in range(system_count)]
+
+    def build_dict():
+        return [_DictObject(**dict(doc, PowerplayConflictProgress=[
+            _DictObject(**p) for p in doc["PowerplayConflictProgress"]])) for doc in documents]
+
+    def build_slots():
+        built = []
+        for doc in documents:
+            system = StarSystem()
+            system.from_dict(doc)
+            built.append(system)
+        return built
+
+    def measure(build):
+        tracemalloc.start()
+        try:
+            built = build()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del built
+        return current
+
+    dict_bytes = measure(build_dict)
+    slots_bytes = measure(build_slots)
+    return {
+        "systems": system_count,
+        "dict_mb": dict_bytes / 1e6,
+        "slots_mb": slots_bytes / 1e6,
+        "dict_bytes_per_system": dict_bytes / system_count,
+        "slots_bytes_per_system": slots_bytes / system_count,
+        "saving_pct": (1 - slots_bytes / dict_bytes) * 100 if dict_bytes else 0.0,
+    }
+
+
+def run_table_benchmark(system_count: int = 20_000, seed: int = 0, rounds: int = 5) -> Dict[str, Any]:
+    """
+    Time a typical detail-view query (filter by state, sort by progress) two ways.
+
+    The loop variant walks StarSystem objects and calls their getters as the
+    views used to; the table variant queries SystemTable columns.
+
+    Args:
+        system_count: Number of systems in the registry
+        seed: Generator seed
+        rounds: Query repetitions; the median is reported
+
+    Returns:
+        Dict with systems, backend (numpy/python), loop_ms, table_ms and speedup
+    """
+    import random
+    from emt_models.system import StarSystem, _system_from_dict, _system_evictable
+    from emt_models.registry import SystemRegistry
+    from emt_models.table import SystemTable
+
+    generator = JournalGenerator(seed=seed, system_count=min(system_count, 5_000))
+    pool = generator._build_systems(random.Random(seed))
+    registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+    table = SystemTable(registry)
+    for i in range(system_count):
+        system = StarSystem(dict(pool[i % len(pool)], StarSystem=f"System {i}"))
+        registry[system.StarSystem] = system
+    state = pool[0].get("PowerplayState", "Fortified")
+
+    def loop():
+        matches = [(name, s) for name, s in registry.items() if s.PowerplayState == state]
+        matches.sort(key=lambda pair: pair[1].getSystemProgressNumber(), reverse=True)
+        return [name for name, _ in matches]
+
+    def query():
+        return table.sort("progress", reverse=True, names=table.filter(state=state))
+
+    len(table)  # initial build, as done once when the view first opens
+    loop_ms = percentile(sorted(timed(loop) for _ in range(rounds)), 50) * 1000
+    table_ms = percentile(sorted(timed(query) for _ in range(rounds)), 50) * 1000
+    return {
+        "systems": system_count,
+        "backend": "numpy" if table.use_numpy else "python",
+        "loop_ms": loop_ms,
+        "table_ms": table_ms,
+        "speedup": loop_ms / table_ms if table_ms else 0.0,
+    }
+
+
+def run_classifier_benchmark(item_count: int = 200_000, seed: int = 0, rounds: int = 5) -> Dict[str, Any]:
+    """
+    Time the PowerPlay filtering of a large ShipLocker Data payload two ways.
+
+    The legacy variant calls the three is_valid_* checks per item, as the
+    ingest paths used to; the classifier variant does one PP_DATA_TYPES lookup.
+
+    Args:
+        item_count: Number of entries in the Data payload
+        seed: Generator seed
+        rounds: Repetitions; the median is reported
+
+    Returns:
+        Dict with items, pp_items, legacy_ms, classifier_ms and speedup
+    """
+    import random
+    from emt_ppdata import is_valid_um_data, is_valid_reinf_data, is_valid_acq_data, PP_DATA_TYPES
+
+    rng = random.Random(seed)
+    names = list(PP_DATA_TYPES) + ["settlementdefenceplans", "surveillancelogs", "chemicalpatents",
+                                   "medicalrecords", "securityexpenses", "networkaccesshistory"]
+    payload = [{"Name": rng.choice(names), "OwnerID": rng.randint(0, 1_000_000), "Count": rng.randint(1, 5)}
+               for _ in range(item_count)]
+
+    def legacy():
+        counts = {}
+        for item in payload:
+            name = item.get('Name', '').lower()
+            if is_valid_um_data(name) or is_valid_reinf_data(name) or is_valid_acq_data(name):
+                counts[name] = counts.get(name, 0) + item.get('Count', 0)
+        return counts
+
+    def classifier():
+        counts = {}
+        for item in payload:
+            name = item.get('Name', '').lower()
+            if name in PP_DATA_TYPES:
+                counts[name] = counts.get(name, 0) + item.get('Count', 0)
+        return counts
+
+    assert legacy() == classifier()
+    legacy_ms = percentile(sorted(timed(legacy) for _ in range(rounds)), 50) * 1000
+    classifier_ms = percentile(sorted(timed(classifier) for _ in range(rounds)), 50) * 1000
+    return {
+        "items": item_count,
+        "pp_items": sum(classifier().values()),
+        "legacy_ms": legacy_ms,
+        "classifier_ms": classifier_ms,
+        "speedup": legacy_ms / classifier_ms if classifier_ms else 0.0,
+    }
+
+
+def run_treeview_benchmark(system_count: int = 50_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Measure opening the detailed view on a large registry two ways.
+
+    The eager variant formats and inserts one Treeview row per system, as
+    populate_treeview used to; the virtual variant fills a VirtualTreeview from
+    the row model. Both run against MockTreeview, so the times cover the
+    plugin's own work plus the number of Tk calls it would make.
+
+    Args:
+        system_count: Number of systems shown
+        seed: Generator seed
+
+    Returns:
+        Dict with systems, eager/virtual rows inserted, first-paint times,
+        tracemalloc peaks, a full scroll-through time and the speedup
+    """
+    import random
+    from emt_models.system import StarSystem
+    from emt_ui.rows import SystemRowModel, VirtualTreeview, format_system_row
+    from emt_tests.mocks import MockTreeview, MockScrollbar
+
+    generator = JournalGenerator(seed=seed, system_count=min(system_count, 5_000))
+    pool = generator._build_systems(random.Random(seed))
+    source = {}
+    for i in range(system_count):
+        system = StarSystem(dict(pool[i % len(pool)], StarSystem=f"System {i}"))
+        source[system.StarSystem] = system
+
+    def virtual():
+        view = VirtualTreeview(MockTreeview(), MockScrollbar(), SystemRowModel(source))
+        view.model.set_names(source.keys())
+        view.refresh()
+        return view
+
+    def eager():
+        tree = MockTreeview()
+        for index, name in enumerate(source):
+            values, tag = format_system_row(name, source[name])
+            tree.insert("", "end", values=values, tags=(tag if index % 2 == 0 else f"{tag}_alt",))
+        return tree
+
+    def measure(func):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, elapsed * 1000, peak / 1024
+
+    view, virtual_ms, virtual_kb = measure(virtual)
+    tree, eager_ms, eager_kb = measure(eager)
+
+    # Scroll the whole list a page at a time
+    pages = 0
+    start = time.perf_counter()
+    while view.first + view.visible_rows() < system_count:
+        view.yview("scroll", 1, "pages")
+        pages += 1
+    scroll_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "systems": system_count,
+        "eager_rows": len(tree.children),
+        "virtual_rows": len(view.tree.children),
+        "eager_paint_ms": eager_ms,
+        "virtual_paint_ms": virtual_ms,
+        "eager_peak_kb": eager_kb,
+        "virtual_peak_kb": virtual_kb,
+        "scroll_pages": pages,
+        "scroll_page_ms": scroll_ms / pages if pages else 0.0,
+        "speedup": eager_ms / virtual_ms if virtual_ms else 0.0,
+    }
+
+
+def run_sort_benchmark(row_count: int = 10_000, seed: int = 0, column: str = "Reinf") -> Dict[str, Any]:
+    """
+    Time sorting the detailed view by a column two ways.
+
+    The legacy variant reads every cell back with tree.set(), parses the
+    display string in the sort key (falling back to a string sort) and moves
+    every row, as sort_treeview used to. The typed variant sorts the row
+    model on its cached typed keys and pushes the order to the virtual view.
+    Tk's own cost per move is not simulated; the move counts are reported.
+
+    Args:
+        row_count: Number of rows
+        seed: Generator seed
+        column: Column to sort by
+
+    Returns:
+        Dict with rows, legacy_ms, typed_cold_ms (keys built on the first sort),
+        typed_ms (keys cached), the Tk calls of each variant and the speedup
+    """
+    import random
+    from emt_models.system import StarSystem
+    from emt_ui.rows import COLUMNS, SystemRowModel, VirtualTreeview, format_system_row
+    from emt_tests.mocks import MockTreeview, MockScrollbar
+
+    generator = JournalGenerator(seed=seed, system_count=min(row_count, 5_000))
+    pool = generator._build_systems(random.Random(seed))
+    source = {}
+    for i in range(row_count):
+        system = StarSystem(dict(pool[i % len(pool)], StarSystem=f"System {i}"))
+        source[system.StarSystem] = system
+
+    class CountingTreeview(MockTreeview):
+        def move(self, iid, parent, index):
+            self._count("move")
+
+    tree = CountingTreeview(columns=COLUMNS)
+    for name, system in source.items():
+        values, tag = format_system_row(name, system)
+        tree.insert("", "end", values=values, tags=(tag,))
+
+    def legacy(reverse):
+        data = [(tree.set(child, column), child) for child in tree.get_children('')]
+        try:
+            data.sort(key=lambda t: float(t[0].replace(',', '').replace('%', '').split('(')[-1].split(')')[0]) if t[0] else 0, reverse=reverse)
+        except (ValueError, IndexError, AttributeError):
+            data.sort(key=lambda t: t[0].lower() if t[0] else '', reverse=reverse)
+        for index, (val, child) in enumerate(data):
+            tree.move(child, '', index)
+
+    view = VirtualTreeview(MockTreeview(), MockScrollbar(), SystemRowModel(source))
+    view.model.set_names(source)
+    view.refresh()
+
+    def typed(reverse):
+        view.model.sort(column, reverse)
+        view.first = 0
+        view.refresh()
+
+    tree.calls.clear()
+    legacy_ms = timed(legacy, True) * 1000
+    legacy_calls = sum(tree.calls.values())
+    view.tree.calls.clear()
+    typed_cold_ms = timed(typed, True) * 1000
+    typed_calls = sum(view.tree.calls.values())
+    typed_ms = timed(typed, False) * 1000
+    return {
+        "rows": row_count,
+        "column": column,
+        "legacy_ms": legacy_ms,
+        "typed_cold_ms": typed_cold_ms,
+        "typed_ms": typed_ms,
+        "legacy_tk_calls": legacy_calls,
+        "typed_tk_calls": typed_calls,
+        "speedup": legacy_ms / typed_ms if typed_ms else 0.0,
+    }
+
+
+def run_index_benchmark(system_count: int = 50_000, seed: int = 0, rounds: int = 5) -> Dict[str, Any]:
+    """
+    Time detail-view filter changes with a few matches on a large table two ways.
+
+    The scan variant tests every row, as SystemTable.filter did before the
+    indexes (and the old system-name filter did over all names); the indexed
+    variant answers from the inverted indexes and the name trie.
+
+    Args:
+        system_count: Number of systems in the registry
+        seed: Generator seed
+        rounds: Query repetitions; the median is reported
+
+    Returns:
+        Dict with systems, matches, scan_ms, indexed_ms and speedup
+    """
+    import random
+    from emt_models.system import StarSystem, _system_from_dict, _system_evictable
+    from emt_models.registry import SystemRegistry
+    from emt_models.table import SystemTable
+
+    generator = JournalGenerator(seed=seed, system_count=min(system_count, 5_000))
+    pool = generator._build_systems(random.Random(seed))
+    registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+    table = SystemTable(registry, use_numpy=False)
+    for i in range(system_count):
+        system = StarSystem(dict(pool[i % len(pool)], StarSystem=f"System {i}"))
+        registry[system.StarSystem] = system
+    # A handful of systems held by a rare power, and a name prefix with few matches
+    for i in range(0, system_count, max(1, system_count // 20)):
+        registry[f"System {i}"].ControllingPower = "Rare Power"
+        registry.notify(f"System {i}")
+    prefix = "system 1234"
+
+    def scan():
+        rows = table._matching_rows(None, "Rare Power")
+        by_power = [table._names[row] for row in rows]
+        by_name = [name for name in table._names if name.lower().startswith(prefix)]
+        return by_power, by_name
+
+    def indexed():
+        return table.filter(power="Rare Power"), table.filter(prefix=prefix)
+
+    len(table)  # initial build, as done once when the view first opens
+    assert scan() == indexed()
+    scan_ms = percentile(sorted(timed(scan) for _ in range(rounds)), 50) * 1000
+    indexed_ms = percentile(sorted(timed(indexed) for _ in range(rounds)), 50) * 1000
+    return {
+        "systems": system_count,
+        "matches": sum(len(names) for names in indexed()),
+        "scan_ms": scan_ms,
+        "indexed_ms": indexed_ms,
+        "speedup": scan_ms / indexed_ms if indexed_ms else 0.0,
+    }
+
+
+def format_results(title: str, results: Dict[str, Any]) -> str:
+    """Format a results dict as aligned `key: value` lines under a title."""
+    lines = [title]
+    for key, value in results.items():
+        if isinstance(value, float):
+            lines.append(f"  {key:<28} {value:,.2f}")
+        else:
+            lines.append(f"  {key:<28} {value}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EliteMeritTracker journal throughput benchmark")
+    parser.add_argument("--events", type=int, default=100_000, help="number of journal events")
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument("--systems", type=int, default=500, help="number of distinct systems")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args(argv)
+
+    results = run_journal_benchmark(args.events, args.seed, args.systems, not args.no_memory)
+    print(format_results(f"journal_entry throughput ({args.events:,} events, seed {args.seed})", results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
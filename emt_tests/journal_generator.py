@@ -0,0 +1,210 @@
+"""
+Synthetic Journal Generator
+
+Produces deterministic, realistic Elite Dangerous journal event streams for
+benchmarks and stress tests. The same seed always yields the same stream, so
+results are comparable between runs and machines.
+
+Streams are generated lazily and can be millions of events long without
+holding them in memory.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, List, Optional
+
+from emt_ppdata.undermining import VALID_UNDERMINING_DATA_TYPES
+from emt_models.salvage import VALID_POWERPLAY_SALVAGE_TYPES
+
+POWERS = [
+    "Felicia Winters",
+    "Arissa Lavigny-Duval",
+    "Zemina Torval",
+    "Edmund Mahon",
+    "Aisling Duval",
+    "Denton Patreus",
+]
+
+DATA_TYPES = sorted(VALID_UNDERMINING_DATA_TYPES.keys())
+SALVAGE_TYPES = sorted(VALID_POWERPLAY_SALVAGE_TYPES.keys())
+
+NOISE_EVENTS = [
+    "Music", "ReceiveText", "FSSSignalDiscovered", "Scan", "FuelScoop",
+    "ShipTargeted", "Bounty", "SupercruiseEntry", "SupercruiseExit", "Cargo",
+]
+
+# Relative weights of each scenario chosen after a jump
+SCENARIO_WEIGHTS = {
+    "combat": 30,
+    "data": 20,
+    "salvage": 15,
+    "shiplocker": 5,
+    "dock": 10,
+    "noise": 20,
+}
+
+
+class JournalGenerator:
+    """
+    Deterministic journal event stream generator.
+
+    Simulates a commander pledged to one power flying between a fixed pool of
+    systems. After each FSDJump/Location a scenario is played out (combat merit
+    bursts, data collection and hand-in, salvage and Search and Rescue, ShipLocker
+    syncs, docking or plain noise), interleaved with noise events.
+    """
+
+    def __init__(self, seed: int = 0, system_count: int = 500, pledged_power: str = "Felicia Winters",
+                 start: Optional[datetime] = None, noise_ratio: float = 0.3):
+        """
+        Initialize generator.
+
+        Args:
+            seed: Random seed; equal seeds produce equal streams
+            system_count: Size of the pool of star systems visited
+            pledged_power: Power the simulated commander is pledged to
+            start: Timestamp of the first event (default: 2026-01-01T00:00:00Z)
+            noise_ratio: Probability of a noise event between scenario events
+        """
+        self.seed = seed
+        self.system_count = system_count
+        self.pledged_power = pledged_power
+        self.start = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.noise_ratio = noise_ratio
+
+    def _build_systems(self, rng: random.Random) -> List[Dict[str, Any]]:
+        """Build the pool of systems with their PowerPlay fields."""
+        pool = []
+        for i in range(self.system_count):
+            name = f"Synthetic Sector {chr(65 + i % 26)}{chr(65 + (i // 26) % 26)}-{i % 7} d{i}"
+            roll = rng.random()
+            base = {
+                "StarSystem": name,
+                "SystemAddress": 10_000_000 + i,
+                "SystemAllegiance": rng.choice(["Federation", "Empire", "Alliance", "Independent"]),
+                "SystemEconomy_Localised": rng.choice(["Industrial", "High Tech", "Extraction", "Military"]),
+                "SystemSecondEconomy_Localised": rng.choice(["Refinery", "Agriculture", "None"]),
+                "SystemGovernment_Localised": rng.choice(["Democracy", "Corporate", "Dictatorship"]),
+                "SystemSecurity": rng.choice(["$SYSTEM_SECURITY_low;", "$SYSTEM_SECURITY_medium;",
+                                              "$SYSTEM_SECURITY_high;"]),
+                "Population": rng.randint(0, 5_000_000_000),
+            }
+            if roll < 0.6:
+                state = rng.choice(["Stronghold", "Fortified", "Exploited"])
+                controlling = rng.choice(POWERS)
+                powers = [controlling] + rng.sample([p for p in POWERS if p != controlling], rng.randint(0, 2))
+                base.update({
+                    "PowerplayState": state,
+                    "ControllingPower": controlling,
+                    "Powers": powers,
+                    "PowerplayStateControlProgress": round(rng.uniform(0.0, 1.2), 6),
+                    "PowerplayStateReinforcement": rng.randint(0, 60_000),
+                    "PowerplayStateUndermining": rng.randint(0, 60_000),
+                })
+            elif roll < 0.85:
+                contenders = rng.sample(POWERS, rng.randint(1, 3))
+                base.update({
+                    "PowerplayState": "Unoccupied",
+                    "Powers": contenders,
+                    "PowerplayConflictProgress": [
+                        {"Power": p, "ConflictProgress": round(rng.uniform(0.0, 1.1), 6)} for p in contenders
+                    ],
+                })
+            pool.append(base)
+        return pool
+
+    def events(self, count: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield exactly `count` journal events.
+
+        Args:
+            count: Number of events to generate
+
+        Returns:
+            Iterator over journal event dicts
+        """
+        rng = random.Random(self.seed)
+        pool = self._build_systems(rng)
+        clock = self.start
+        total_merits = rng.randint(10_000, 500_000)
+        backpack: Dict[str, int] = {}
+        cargo: Dict[str, int] = {}
+        produced = 0
+        first = True
+
+        def stamp(event):
+            # Timestamps are assigned at yield time so noise interleaves in order
+            nonlocal clock
+            clock += timedelta(seconds=rng.randint(1, 30))
+            event["timestamp"] = clock.strftime("%Y-%m-%dT%H:%M:%SZ")
+            return event
+
+        def merits(gained):
+            nonlocal total_merits
+            total_merits += gained
+            return {"event": "PowerplayMerits", "Power": self.pledged_power,
+                    "MeritsGained": gained, "TotalMerits": total_merits}
+
+        def noise():
+            return {"event": rng.choice(NOISE_EVENTS)}
+
+        while produced < count:
+            system = rng.choice(pool)
+            entry = dict(system)
+            entry["event"] = "Location" if first else "FSDJump"
+            first = False
+            scenario_events = [entry]
+
+            scenario = rng.choices(list(SCENARIO_WEIGHTS), weights=list(SCENARIO_WEIGHTS.values()))[0]
+            if scenario == "combat":
+                for _ in range(rng.randint(3, 40)):
+                    scenario_events.append(merits(rng.choice([12, 25, 56, 80, 120, 240])))
+            elif scenario == "data":
+                added = []
+                for name in rng.sample(DATA_TYPES, rng.randint(1, 3)):
+                    n = rng.randint(1, 8)
+                    backpack[name] = backpack.get(name, 0) + n
+                    added.append({"Name": name, "Name_Localised": VALID_UNDERMINING_DATA_TYPES[name],
+                                  "Count": n, "Type": "Data"})
+                scenario_events.append({"event": "BackpackChange", "Added": added})
+                if rng.random() < 0.4 and backpack:
+                    delivered = [{"Name": name, "Category": "Data", "Count": n}
+                                 for name, n in sorted(backpack.items())]
+                    total = sum(backpack.values())
+                    backpack.clear()
+                    scenario_events.append({"event": "DeliverPowerMicroResources",
+                                            "TotalCount": total, "MicroResources": delivered,
+                                            "MarketID": 3228496384})
+                    scenario_events.append(merits(total * rng.randint(40, 330)))
+            elif scenario == "salvage":
+                for _ in range(rng.randint(1, 6)):
+                    name = rng.choice(SALVAGE_TYPES)
+                    cargo[name] = cargo.get(name, 0) + 1
+                    scenario_events.append({"event": "CollectCargo",
+                                            "Type": name, "Count": 1, "Stolen": False})
+                if rng.random() < 0.5 and cargo:
+                    name = rng.choice(sorted(cargo))
+                    n = cargo.pop(name)
+                    scenario_events.append({"event": "SearchAndRescue",
+                                            "Name": name, "Count": n, "Reward": n * 8000})
+                    scenario_events.append(merits(n * rng.randint(20, 90)))
+            elif scenario == "shiplocker":
+                scenario_events.append({"event": "ShipLocker",
+                                        "Data": [{"Name": name, "OwnerID": 0, "Count": n}
+                                                 for name, n in sorted(backpack.items())]})
+            elif scenario == "dock":
+                scenario_events.append({"event": "Docked",
+                                        "StarSystem": system["StarSystem"], "StationName": "Synthetic Port"})
+
+            for event in scenario_events:
+                if produced >= count:
+                    return
+                yield stamp(event)
+                produced += 1
+                if produced < count and rng.random() < self.noise_ratio:
+                    yield stamp(noise())
+                    produced += 1
+
+
+def generate_journal(count: int, seed: int = 0, **kwargs) -> Iterator[Dict[str, Any]]:
+    """Convenience wrapper: yield `count` events from a JournalGenerator."""
+    return JournalGenerator(seed=seed, **kwargs).events(count)
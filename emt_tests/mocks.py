@@ -64,6 +64,98 @@ class MockIntVar:
         self._value = value
 
 
+class MockTreeview:
+    """Flat ttk.Treeview stand-in that keeps its rows and counts the Tk calls made"""
+    def __init__(self, height=28 * 31, columns=()):
+        self.height = height
+        self.columns = tuple(columns)
+        self.rows = {}       # iid -> {"values": tuple, "tags": tuple}
+        self.children = []   # attached iids in display order
+        self.calls = {}
+        self.yview_first = 0.0
+        self._next_id = 0
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def configure(self, **kwargs):
+        pass
+
+    def bind(self, sequence, func):
+        pass
+
+    def heading(self, column, **kwargs):
+        pass
+
+    def winfo_height(self):
+        return self.height
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self._count("insert")
+        if iid is None:
+            self._next_id += 1
+            iid = f"I{self._next_id:03X}"
+        self.rows[iid] = {"values": tuple(values), "tags": tuple(tags)}
+        self.children.insert(len(self.children) if index == "end" else index, iid)
+        return iid
+
+    def delete(self, *items):
+        self._count("delete")
+        for iid in items:
+            del self.rows[iid]
+            if iid in self.children:
+                self.children.remove(iid)
+
+    def item(self, iid, values=None, tags=None):
+        self._count("item")
+        if values is not None:
+            self.rows[iid]["values"] = tuple(values)
+        if tags is not None:
+            self.rows[iid]["tags"] = tuple(tags)
+
+    def set(self, iid, column):
+        """Cell text, as Tk returns it"""
+        self._count("set")
+        return str(self.rows[iid]["values"][self.columns.index(column)])
+
+    def move(self, iid, parent, index):
+        self._count("move")
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def detach(self, *items):
+        self._count("detach")
+        for iid in items:
+            self.children.remove(iid)
+
+    def after_idle(self, func):
+        func()
+
+    def get_children(self, item=""):
+        return tuple(self.children)
+
+    def yview_moveto(self, fraction):
+        self.yview_first = fraction
+
+    def shown(self):
+        """Values of the attached rows in display order"""
+        return [self.rows[iid]["values"] for iid in self.children]
+
+
+class MockScrollbar:
+    """ttk.Scrollbar stand-in remembering its command and last set() position"""
+    def __init__(self):
+        self.command = None
+        self.position = (0.0, 1.0)
+
+    def configure(self, command=None, **kwargs):
+        self.command = command
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
 tkinter_module = SimpleNamespace()
 tkinter_module.StringVar = MockStringVar
 tkinter_module.BooleanVar = MockBooleanVar
@@ -94,10 +186,23 @@ tkinter_module.END = "end"
 tkinter_module.NORMAL = "normal"
 tkinter_module.DISABLED = "disabled"
 
+tkinter_module.ttk = MagicMock()
+tkinter_module.filedialog = MagicMock()
+tkinter_module.messagebox = MagicMock()
+
 # Install mocks before imports
 sys.modules['tkinter'] = tkinter_module
-sys.modules['tkinter.ttk'] = MagicMock()
+sys.modules['tkinter.ttk'] = tkinter_module.ttk
+sys.modules['tkinter.filedialog'] = tkinter_module.filedialog
+sys.modules['tkinter.messagebox'] = tkinter_module.messagebox
 sys.modules['config'] = config_module
 sys.modules['EDMCLogging'] = MagicMock()
 sys.modules['theme'] = MagicMock()
 sys.modules['ttkHyperlinkLabel'] = MagicMock()
+sys.modules['myNotebook'] = MagicMock()
+
+# Pillow ships with EDMC; only mock it when running outside that environment
+try:
+    import PIL  # noqa: F401
+except ImportError:
+    sys.modules['PIL'] = MagicMock()
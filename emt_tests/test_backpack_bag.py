@@ -0,0 +1,125 @@
+"""
+Test Suite for Backpack Bags (emt_models/backpack.py)
+"""
+import random
+import pytest
+from emt_models.backpack import Bag, Backpack, REMOVAL_ALPHABETICAL, REMOVAL_FIFO
+
+
+def filled_bag(removal_order, systems=("Delta", "Alpha", "Charlie", "Bravo"), count=2):
+    bag = Bag("test", removal_order)
+    for system in systems:
+        bag.add_item("PowerSpyware", count, system)
+    return bag
+
+
+class TestRemovalOrder:
+    """Test remove_item consumes systems in the bag's removal order"""
+
+    def test_alphabetical(self):
+        bag = filled_bag(REMOVAL_ALPHABETICAL)
+        assert bag.remove_item("powerspyware", 5) == {"Alpha": 2, "Bravo": 2, "Charlie": 1}
+        assert bag.items["powerspyware"] == {"Delta": 2, "Charlie": 1}
+
+        bag.add_item("powerspyware", 1, "Aardvark")
+        assert bag.remove_item("powerspyware", 2) == {"Aardvark": 1, "Charlie": 1}
+
+    def test_fifo(self):
+        bag = filled_bag(REMOVAL_FIFO)
+        assert bag.remove_item("powerspyware", 5) == {"Delta": 2, "Alpha": 2, "Charlie": 1}
+
+        # A system collected again later keeps its first-collection place
+        bag.add_item("powerspyware", 3, "Charlie")
+        bag.add_item("powerspyware", 1, "Echo")
+        assert bag.remove_item("powerspyware", 10) == {"Charlie": 4, "Bravo": 2, "Echo": 1}
+        assert bag.items == {}
+
+    @pytest.mark.parametrize("removal_order", [REMOVAL_ALPHABETICAL, REMOVAL_FIFO])
+    def test_over_removal_and_unknown_item(self, removal_order):
+        bag = filled_bag(removal_order, count=1)
+        assert sum(bag.remove_item("powerspyware", 100).values()) == 4
+        assert "powerspyware" not in bag.items
+        assert bag.remove_item("powerspyware", 1) == {}
+        assert bag.remove_item("powerresearchdata", 1) == {}
+
+    def test_switching_order_keeps_contents(self):
+        bag = filled_bag(REMOVAL_FIFO)
+        bag.set_removal_order(REMOVAL_ALPHABETICAL)
+        assert bag.remove_item("powerspyware", 1) == {"Alpha": 1}
+
+        bag.set_removal_order("random")
+        assert bag.removal_order == REMOVAL_ALPHABETICAL
+
+    def test_backpack_sets_every_bag(self):
+        backpack = Backpack()
+        backpack.set_removal_order(REMOVAL_FIFO)
+        assert {bag.removal_order for bag in (backpack.umbag, backpack.reinfbag, backpack.acqbag)} == {REMOVAL_FIFO}
+
+
+class TestBagEdits:
+    """Test manual edits and loading keep the removal order consistent"""
+
+    @pytest.mark.parametrize("removal_order", [REMOVAL_ALPHABETICAL, REMOVAL_FIFO])
+    def test_set_count(self, removal_order):
+        bag = filled_bag(removal_order)
+        bag.set_count("powerspyware", "Alpha", 0)
+        bag.set_count("powerspyware", "Bravo", 5)
+        bag.set_count("powerspyware", "Echo", 1)
+        assert bag.items["powerspyware"] == {"Delta": 2, "Bravo": 5, "Charlie": 2, "Echo": 1}
+
+        removed = bag.remove_item("powerspyware", 10)
+        if removal_order == REMOVAL_ALPHABETICAL:
+            assert removed == {"Bravo": 5, "Charlie": 2, "Delta": 2, "Echo": 1}
+        else:
+            assert removed == {"Delta": 2, "Bravo": 5, "Charlie": 2, "Echo": 1}
+
+    def test_from_dict_keeps_collection_order_and_drops_empty(self):
+        bag = Bag("test", REMOVAL_FIFO)
+        bag.from_dict({"powerspyware": {"Zeta": 1, "Empty": 0, "Alpha": 1}, "powerresearchdata": {"Sol": 0}})
+        assert bag.to_dict() == {"powerspyware": {"Zeta": 1, "Alpha": 1}}
+        assert list(bag.remove_item("powerspyware", 2)) == ["Zeta", "Alpha"]
+
+        bag = Bag("test")
+        bag.from_dict({"powerspyware": {"Zeta": 1, "Alpha": 1}})
+        assert list(bag.remove_item("powerspyware", 2)) == ["Alpha", "Zeta"]
+
+
+class TestRunningTotals:
+    """Test the running totals always match a recount of the bag"""
+
+    @pytest.mark.parametrize("removal_order", [REMOVAL_ALPHABETICAL, REMOVAL_FIFO])
+    def test_random_operations(self, removal_order):
+        rng = random.Random(0)
+        bag = Bag("test", removal_order)
+        items = ["powerspyware", "powerresearchdata", "powerclassifieddata"]
+        systems = [f"System {i}" for i in range(8)]
+        for _ in range(2_000):
+            op = rng.random()
+            if op < 0.5:
+                bag.add_item(rng.choice(items), rng.randint(1, 5), rng.choice(systems))
+            elif op < 0.8:
+                bag.remove_item(rng.choice(items), rng.randint(1, 10))
+            else:
+                bag.set_count(rng.choice(items), rng.choice(systems), rng.randint(0, 3))
+            assert bag._count_totals() == (bag._item_totals, bag._system_totals, bag._total)
+
+        assert bag.verify_totals()
+
+    def test_read_apis(self):
+        bag = filled_bag(REMOVAL_ALPHABETICAL)
+        bag.add_item("PowerResearchData", 3, "Alpha")
+        assert bag.get_count("POWERSPYWARE") == 8
+        assert bag.get_total() == 11
+        assert bag.get_systems_summary() == {"Delta": 2, "Alpha": 5, "Charlie": 2, "Bravo": 2}
+
+        bag.from_dict({"powerspyware": {"Sol": 4}})
+        assert (bag.get_total(), bag.get_count("powerresearchdata"), bag.get_systems_summary()) == (4, 0, {"Sol": 4})
+        bag.clear()
+        assert (bag.get_total(), bag.get_systems_summary()) == (0, {})
+
+    def test_verify_repairs_direct_edits(self):
+        bag = filled_bag(REMOVAL_ALPHABETICAL)
+        bag.items["powerspyware"]["Alpha"] = 10
+        assert not bag.verify_totals()
+        assert bag.get_total() == 16
+        assert bag.verify_totals()
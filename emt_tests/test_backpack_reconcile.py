@@ -0,0 +1,84 @@
+"""
+Test Suite for Backpack Reconciliation against ShipLocker (emt_models/backpack.py, emt_models/reconcile.py)
+"""
+import emt_core.storage as storage
+from emt_models.backpack import Backpack
+
+PLEDGED = "Felicia Winters"
+DAY1 = "2026-10-01T12:00:00Z"
+DAY2 = "2026-10-02T12:00:00Z"
+DAY3 = "2026-10-03T12:00:00Z"
+
+
+def shiplocker(**counts):
+    return [{"Name": name, "OwnerID": 0, "Count": count} for name, count in counts.items()]
+
+
+def tracked(backpack, name):
+    return sum(bag.get_count(name) + sum(bag.stale.get(name, {}).values())
+               for bag in (backpack.umbag, backpack.reinfbag, backpack.acqbag))
+
+
+class TestPlanReconciliation:
+    """Test the planned adjustments are minimal and oldest-first"""
+
+    def make_backpack(self):
+        backpack = Backpack()
+        backpack.add_item("powerresearchdata", 2, "Old", "Zemina Torval", PLEDGED, DAY1)   # UM
+        backpack.add_item("powerresearchdata", 3, "Mid", "no power", PLEDGED, DAY2)        # Acq
+        backpack.add_item("powerresearchdata", 4, "New", "Zemina Torval", PLEDGED, DAY3)   # UM
+        return backpack
+
+    def test_matching_counts_need_nothing(self):
+        backpack = self.make_backpack()
+        assert backpack.sync_from_shiplocker(shiplocker(powerresearchdata=9, settlementdefenceplans=5)) == []
+
+    def test_surplus_trimmed_oldest_first_across_bags(self):
+        backpack = self.make_backpack()
+        adjustments = backpack.plan_reconciliation({"powerresearchdata": 5})
+        assert adjustments == [
+            {"bag": "umbag", "item": "powerresearchdata", "system": "Old", "delta": -2, "stale": False},
+            {"bag": "acqbag", "item": "powerresearchdata", "system": "Mid", "delta": -2, "stale": False},
+        ]
+
+        backpack.apply_adjustments(adjustments)
+        assert backpack.umbag.items == {"powerresearchdata": {"New": 4}}
+        assert backpack.acqbag.items == {"powerresearchdata": {"Mid": 1}}
+        assert backpack.umbag.verify_totals() and backpack.acqbag.verify_totals()
+
+    def test_stale_trimmed_before_live(self):
+        backpack = self.make_backpack()
+        backpack.expire(DAY2, DAY3)  # "Old" becomes stale
+        backpack.sync_from_shiplocker(shiplocker(powerresearchdata=6))
+        assert backpack.umbag.stale == {}
+        assert backpack.acqbag.items == {"powerresearchdata": {"Mid": 2}}
+        assert tracked(backpack, "powerresearchdata") == 6
+
+    def test_missing_items_removed_and_shortfall_added_as_stale(self):
+        backpack = self.make_backpack()
+        backpack.sync_from_shiplocker(shiplocker(powerclassifieddata=3))
+        assert tracked(backpack, "powerresearchdata") == 0
+        assert backpack.acqbag.stale == {"powerclassifieddata": {"unknown": 3}}
+        assert backpack.remove_item("powerclassifieddata", 3) == {}  # never attributed
+
+
+class TestReconciliationAudit:
+    """Test every applied correction is kept in the audit log"""
+
+    def test_audit_log_round_trip(self, tmp_path, monkeypatch):
+        from emt_models import reconcile
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        backpack = Backpack()
+        monkeypatch.setattr(reconcile, "playerBackpack", backpack)
+        monkeypatch.setattr(reconcile, "reconciliation_log", [])
+        backpack.add_item("powerresearchdata", 2, "Sol", "no power", PLEDGED, DAY1)
+
+        assert reconcile.reconcile_backpack(shiplocker(powerresearchdata=2), DAY2) == []
+        adjustments = reconcile.reconcile_backpack(shiplocker(powerresearchdata=1), DAY3)
+        assert reconcile.reconciliation_log == [{"timestamp": DAY3, "adjustments": adjustments}]
+
+        reconcile.save_reconciliation_log()
+        reconcile.reconciliation_log.clear()
+        reconcile.load_reconciliation_log()
+        assert reconcile.reconciliation_log == [{"timestamp": DAY3, "adjustments": adjustments}]
@@ -0,0 +1,121 @@
+"""
+Test Suite for Content-addressed Backup Snapshots (emt_core/backups.py)
+"""
+import json
+import os
+from pathlib import Path
+import pytest
+import emt_core.storage as storage
+from emt_core.backups import BackupStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "systems.json").write_text(json.dumps({"Sol": {"Merits": 1}}))
+    (data / "power.json").write_text(json.dumps({"Power": "Felicia Winters"}))
+    return BackupStore(backup_dir=str(tmp_path / "backups"), data_dir=str(data), max_snapshots=3)
+
+
+def data_file(store, name):
+    return Path(store.data_dir) / name
+
+
+def object_count(store):
+    return sum(len(names) for _, _, names in os.walk(os.path.join(store.backup_dir, "objects")))
+
+
+class TestBackupStore:
+    """Test snapshot, dedup, retention and restore"""
+
+    def test_snapshot_lists_files(self, store):
+        snapshot_id = store.snapshot(label="update")
+        snapshots = store.list_snapshots()
+        assert [s["id"] for s in snapshots] == [snapshot_id]
+        assert snapshot_id.endswith("-update")
+        assert set(snapshots[0]["files"]) == {"systems.json", "power.json"}
+        assert json.loads(store.read_file(snapshot_id, "power.json")) == {"Power": "Felicia Winters"}
+
+    def test_unchanged_data_is_free(self, store):
+        first = store.snapshot()
+        assert store.snapshot() == first
+        assert len(store.list_snapshots()) == 1
+        assert object_count(store) == 2
+
+    def test_alternating_content_reuses_snapshots(self, store):
+        first = store.snapshot()
+        data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": 2}}))
+        second = store.snapshot()
+        data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": 1}}))
+        third = store.snapshot()
+        assert [s["id"] for s in store.list_snapshots()] == [second, third]
+        assert json.loads(store.read_file(third, "systems.json")) == {"Sol": {"Merits": 1}}
+        assert first not in [s["id"] for s in store.list_snapshots()]
+
+    def test_current_content_survives_retention(self, store):
+        # A -> B -> C -> A with room for three snapshots: A's content is on disk, so it must be kept
+        for merits in (1, 2, 3, 1):
+            data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": merits}}))
+            current = store.snapshot()
+        store.snapshot(label="power", filenames=["power.json"])
+
+        assert current in [s["id"] for s in store.list_snapshots()]
+        assert json.loads(store.read_file(current, "systems.json")) == {"Sol": {"Merits": 1}}
+
+    def test_default_dirs_follow_data_dir(self, tmp_path, monkeypatch):
+        default = BackupStore()
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        (tmp_path / "power.json").write_text("{}")
+        assert default.snapshot() is not None
+        assert default.backup_dir == str(tmp_path / "backups")
+        assert len(os.listdir(tmp_path / "backups" / "snapshots")) == 1
+
+    def test_changed_file_stores_only_new_content(self, store):
+        store.snapshot()
+        data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": 2}}))
+        store.snapshot()
+        assert len(store.list_snapshots()) == 2
+        assert object_count(store) == 3
+
+    def test_retention_and_garbage_collection(self, store):
+        for merits in range(6):
+            data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": merits}}))
+            store.snapshot()
+        assert len(store.list_snapshots()) == 3
+        # power.json shared by all snapshots + 3 retained systems.json versions
+        assert object_count(store) == 4
+
+    def test_restore(self, store):
+        snapshot_id = store.snapshot()
+        data_file(store, "systems.json").write_text(json.dumps({"Sol": {"Merits": 99}}))
+
+        assert store.restore(snapshot_id, ["systems.json"]) == ["systems.json"]
+        assert json.loads(data_file(store, "systems.json").read_text()) == {"Sol": {"Merits": 1}}
+        # The overwritten state was kept as a pre-restore snapshot
+        labels = [s["label"] for s in store.list_snapshots()]
+        assert labels == ["manual", "pre-restore"]
+
+    def test_nothing_to_back_up(self, tmp_path):
+        empty = BackupStore(backup_dir=str(tmp_path / "backups"), data_dir=str(tmp_path))
+        assert empty.snapshot() is None
+
+
+class TestSaveJsonBackup:
+    """Test save_json(create_backup=True) snapshots the previous file"""
+
+    def test_create_backup_snapshots_previous_content(self, tmp_path, monkeypatch):
+        import emt_core.backups as backups
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+        isolated = BackupStore(backup_dir=str(tmp_path / "backups"), data_dir=str(tmp_path))
+        monkeypatch.setattr(backups, "backup_store", isolated)
+
+        storage.save_json("power.json", {"Merits": 1})
+        storage.save_json("power.json", {"Merits": 2}, create_backup=True)
+
+        snapshots = isolated.list_snapshots()
+        assert len(snapshots) == 1
+        assert json.loads(isolated.read_file(snapshots[0]["id"], "power.json")) == {"Merits": 1}
+        assert not (tmp_path / "power.json.backup").exists()
@@ -0,0 +1,100 @@
+"""
+Test Suite for PowerPlay Cycle Archiving (emt_core/archive.py)
+"""
+import copy
+from emt_core.archive import CycleArchive
+
+
+def make_archive(tmp_path):
+    archive = CycleArchive(archive_dir=str(tmp_path))
+    archive.open()
+    return archive
+
+
+class TestCycleArchive:
+    """Test rollover detection and per-cycle archive files"""
+
+    def test_disabled_until_opened(self, tmp_path):
+        archive = CycleArchive(archive_dir=str(tmp_path))
+        assert archive.check_rollover("2026-10-15T08:00:00Z") is None
+        assert archive.current_cycle is None
+
+    def test_first_timestamp_sets_cycle(self, tmp_path):
+        archive = make_archive(tmp_path)
+        assert archive.check_rollover("2026-10-16T08:00:00Z") is None
+        assert archive.current_cycle == "2026-10-15"
+        assert archive.check_rollover("2026-10-22T06:59:59Z") is None
+
+    def test_rollover_detected_at_tick(self, tmp_path):
+        archive = make_archive(tmp_path)
+        archive.check_rollover("2026-10-16T08:00:00Z")
+        assert archive.check_rollover("2026-10-22T07:00:00Z") == "2026-10-15"
+        assert archive.current_cycle == "2026-10-22"
+
+    def test_never_rolls_backwards(self, tmp_path):
+        archive = make_archive(tmp_path)
+        archive.check_rollover("2026-10-22T08:00:00Z")
+        assert archive.check_rollover("2026-10-16T08:00:00Z") is None
+        assert archive.current_cycle == "2026-10-22"
+
+    def test_archive_and_query(self, tmp_path):
+        archive = make_archive(tmp_path)
+        archive.archive_cycle("2026-10-08", {"Sol": {"Merits": 10}, "Achenar": {"Merits": 5}})
+        archive.archive_cycle("2026-10-15", {"Sol": {"Merits": 7}})
+
+        reopened = CycleArchive(archive_dir=str(tmp_path))
+        assert [c["cycle"] for c in reopened.list_cycles()] == ["2026-10-08", "2026-10-15"]
+        assert reopened.list_cycles()[0]["merits"] == 15
+        assert reopened.load_cycle("2026-10-08")["Achenar"] == {"Merits": 5}
+        assert reopened.load_cycle("2026-10-01") == {}
+        assert reopened.system_history("Sol") == {"2026-10-08": {"Merits": 10}, "2026-10-15": {"Merits": 7}}
+
+    def test_archive_same_cycle_merges(self, tmp_path):
+        archive = make_archive(tmp_path)
+        archive.archive_cycle("2026-10-08", {"Sol": {"Merits": 10}})
+        archive.archive_cycle("2026-10-08", {"Achenar": {"Merits": 5}})
+        assert set(CycleArchive(archive_dir=str(tmp_path)).load_cycle("2026-10-08")) == {"Sol", "Achenar"}
+
+
+class TestJournalRollover:
+    """Test journal_entry archives the previous cycle's systems"""
+
+    def test_systems_archived_on_tick(self, tmp_path, monkeypatch, sample_fortified_system):
+        import load
+        import emt_core.storage as storage
+        from emt_tests.benchmark import reset_plugin_state
+
+        # The rollover saves systems.json; keep it out of the checkout's data/
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(data_dir))
+        monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+
+        reset_plugin_state()
+        archive = make_archive(tmp_path / "archive")
+        original = load.cycle_archive
+        load.cycle_archive = archive
+        try:
+            load.journal_entry("CMDR", False, None, None, sample_fortified_system, None)
+            load.journal_entry("CMDR", False, None, None, {
+                "timestamp": "2026-01-02T20:05:00Z", "event": "PowerplayMerits",
+                "Power": "Felicia Winters", "MeritsGained": 120, "TotalMerits": 1120}, None)
+            other = copy.deepcopy(sample_fortified_system)
+            other.update({"StarSystem": "Sol", "timestamp": "2026-01-02T21:00:00Z"})
+            load.journal_entry("CMDR", False, None, None, other, None)
+            assert set(load.systems) == {"Czerno", "Sol"}
+
+            # First event after Thursday 2026-01-08 07:00 UTC
+            load.journal_entry("CMDR", False, None, None, {
+                "timestamp": "2026-01-08T07:30:00Z", "event": "Music"}, None)
+            live = {name: system.Merits for name, system in load.systems.items()}
+        finally:
+            load.cycle_archive = original
+            reset_plugin_state()
+
+        assert live == {"Sol": 0}
+        assert archive.current_cycle == "2026-01-08"
+        archived = archive.load_cycle("2026-01-01")
+        assert archived["Czerno"]["Merits"] == 120
+        assert "Sol" in archived
+        assert (data_dir / "systems.json").exists()
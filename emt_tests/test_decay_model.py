@@ -0,0 +1,91 @@
+"""
+Test Suite for the Batch Decay / Real Undermining Model (emt_models/system.py)
+
+The batch functions must return exactly what the scalar functions return,
+element for element, on both the NumPy and the pure-Python path.
+"""
+import random
+import pytest
+import emt_models.system as system_module
+from emt_models.system import (_calc_decay_amount, _calc_real_undermining,
+                               _calc_decay_amounts, _calc_real_undermining_batch)
+
+STATES = ["Stronghold", "Fortified", "Exploited", "Unoccupied", "no PP connection", ""]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if system_module.np is None:
+            pytest.skip("NumPy not installed")
+    else:
+        monkeypatch.setattr(system_module, "np", None)
+    return request.param
+
+
+def random_inputs(count, seed=0):
+    rng = random.Random(seed)
+    states, progress, reinf, um = [], [], [], []
+    for _ in range(count):
+        states.append(rng.choice(STATES))
+        progress.append(rng.choice([0.0, 25.0, 25.000001, 100.0, rng.uniform(-50, 200), rng.uniform(0, 100)]))
+        reinf.append(rng.choice([0, rng.randint(0, 500_000)]))
+        um.append(rng.choice([0, rng.randint(0, 500_000), rng.randint(-1000, 0)]))
+    return states, progress, reinf, um
+
+
+class TestDecayBatch:
+    """Test batch results are identical to the scalar functions"""
+
+    def test_decay_amounts_match_scalar(self, backend):
+        states, progress, _, _ = random_inputs(5_000)
+        expected = [_calc_decay_amount(p, s) for s, p in zip(states, progress)]
+        assert _calc_decay_amounts(states, progress) == expected
+
+    def test_real_undermining_matches_scalar(self, backend):
+        states, progress, reinf, um = random_inputs(5_000, seed=1)
+        expected = [_calc_real_undermining(u, r, p, s) for s, p, r, u in zip(states, progress, reinf, um)]
+        assert _calc_real_undermining_batch(states, progress, reinf, um) == expected
+
+    @pytest.mark.parametrize("state,progress,reinf,um", [
+        ("Fortified", 25.0, 0, 10_000),      # exactly at the decay threshold
+        ("Stronghold", 80.0, 50_000, 0),     # no undermining
+        ("Exploited", 95.0, 0, 400_000),     # decay larger than raw undermining
+        ("Unoccupied", 40.0, 10, -5),        # unknown type passes raw value through
+    ])
+    def test_edge_cases(self, backend, state, progress, reinf, um):
+        assert _calc_real_undermining_batch([state], [progress], [reinf], [um]) == [
+            _calc_real_undermining(um, reinf, progress, state)]
+        assert _calc_decay_amounts([state], [progress]) == [_calc_decay_amount(progress, state)]
+
+    def test_empty_and_mismatched(self, backend):
+        assert _calc_decay_amounts([], []) == []
+        assert _calc_real_undermining_batch([], [], [], []) == []
+        with pytest.raises(ValueError):
+            _calc_real_undermining_batch(["Fortified"], [50.0], [], [1])
+
+    def test_results_are_python_ints(self, backend):
+        result = _calc_real_undermining_batch(["Fortified"], [60.0], [0], [50_000])
+        assert type(result[0]) is int
+
+
+class TestTableRecalculation:
+    """Test SystemTable.recalculate_real_undermining"""
+
+    def test_recalculates_changed_rows(self, tmp_path, monkeypatch):
+        from emt_models.system import StarSystem, _system_from_dict, _system_evictable
+        from emt_models.registry import SystemRegistry
+        from emt_models.table import SystemTable
+
+        registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+        table = SystemTable(registry)
+        for name, um in (("A", 80_000), ("B", 0)):
+            registry[name] = StarSystem({"StarSystem": name, "PowerplayState": "Fortified",
+                                         "Powers": ["Felicia Winters", "Zemina Torval"],
+                                         "PowerplayStateControlProgress": 0.6,
+                                         "PowerplayStateUndermining": um})
+        assert table.recalculate_real_undermining() == {}
+
+        monkeypatch.setitem(system_module._DECAY_COEFFICIENTS, "Fortified", (0.0, 0.0, 650_000))
+        assert table.recalculate_real_undermining() == {"A": 80_000}
+        assert table.column("real_undermining") == [80_000, 0]
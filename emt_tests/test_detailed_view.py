@@ -0,0 +1,258 @@
+"""
+Test Suite for the Detailed View Row Model and Virtual Treeview (emt_ui/rows.py)
+"""
+import pytest
+from emt_models.system import StarSystem
+from emt_ui.rows import SystemRowModel, VirtualTreeview, format_system_row, MAX_DETACHED
+from emt_tests.mocks import MockTreeview, MockScrollbar
+
+
+def make_system(name, state="Fortified", power="Felicia Winters", progress=0.5, reinforcement=0):
+    return StarSystem({"StarSystem": name, "PowerplayState": state, "ControllingPower": power,
+                       "Powers": [power], "PowerplayStateControlProgress": progress,
+                       "PowerplayStateReinforcement": reinforcement})
+
+
+def make_view(count, visible=10, overscan=5):
+    source = {f"System {i:05d}": make_system(f"System {i:05d}", reinforcement=i) for i in range(count)}
+    view = VirtualTreeview(MockTreeview(height=28 * (visible + 1)), MockScrollbar(),
+                           SystemRowModel(source), overscan=overscan)
+    view.model.set_names(source)
+    view.refresh()
+    return source, view
+
+
+class TestSystemRowModel:
+    """Test rows are formatted on demand and follow system changes"""
+
+    def test_row_matches_format(self):
+        system = make_system("Sol", reinforcement=1234)
+        model = SystemRowModel({"Sol": system})
+        model.set_names(["Sol"])
+        assert model.row(0) == ("Sol",) + format_system_row("Sol", system)
+        assert model.row(0)[1][:3] == ("Sol", "Fortified", "50.0%")
+
+    def test_formats_only_requested_rows(self):
+        source = {f"S{i}": make_system(f"S{i}") for i in range(100)}
+        model = SystemRowModel(source)
+        model.set_names(source)
+        model.row(5)
+        assert list(model._formatted) == ["S5"]
+
+    def test_sort_is_kept_across_filters(self):
+        source = {name: make_system(name, reinforcement=r) for name, r in (("A", 300), ("B", 1_000), ("C", 20))}
+        model = SystemRowModel(source)
+        model.set_names(source)
+        model.sort("Reinf", reverse=True)
+        assert model.names() == ["B", "A", "C"]
+        model.set_names(["C", "A"])
+        assert model.names() == ["A", "C"]
+        model.sort("System")
+        assert model.names() == ["A", "C"]
+
+    def test_registry_change_invalidates(self):
+        from emt_models.registry import SystemRegistry
+        from emt_models.system import _system_from_dict, _system_evictable
+
+        registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+        registry["Sol"] = make_system("Sol")
+        model = SystemRowModel(registry)
+        model.set_names(["Sol"])
+        assert model.row(0)[1][5] == 0
+        registry["Sol"].PowerplayStateReinforcement = 50
+        registry.notify("Sol")
+        assert model.row(0)[1][5] == 50
+
+
+class TestVirtualTreeview:
+    """Test only the visible rows plus overscan are materialised"""
+
+    def test_first_paint(self):
+        _, view = make_view(10_000)
+        assert len(view.tree.children) == 15
+        assert view.tree.shown()[0][0] == "System 00000"
+        assert view.scrollbar.position == (0.0, 10 / 10_000)
+
+    def test_scroll_within_overscan_keeps_rows(self):
+        _, view = make_view(10_000)
+        inserts = view.tree.calls["insert"]
+        view.yview("scroll", 3, "units")
+        assert view.tree.calls["insert"] == inserts
+        assert view.first == 3
+
+    def test_scroll_past_window_rematerialises(self):
+        _, view = make_view(10_000)
+        view.yview("moveto", 0.5)
+        assert view.first == 5_000
+        shown = [values[0] for values in view.tree.shown()]
+        assert shown == [f"System {i:05d}" for i in range(4_995, 5_015)]
+        assert view.tree.yview_first == 5 / 20
+
+    def test_scroll_clamps_at_the_end(self):
+        _, view = make_view(100)
+        view.yview("scroll", 50, "pages")
+        assert view.first == 90
+        assert view.tree.shown()[-1][0] == "System 00099"
+        assert view.scrollbar.position == (0.9, 1.0)
+
+    def test_zebra_tags_follow_position(self):
+        _, view = make_view(100)
+        view.yview("moveto", 0.31)
+        tags = [view.tree.rows[iid]["tags"][0] for iid in view.tree.children]
+        assert all(tag.endswith("_alt") == (index % 2 == 1) for index, tag in enumerate(tags, start=26))
+
+    def test_empty(self):
+        _, view = make_view(0)
+        assert view.tree.children == []
+        assert view.scrollbar.position == (0.0, 1.0)
+
+
+class TestIncrementalUpdates:
+    """Test filter, sort and system changes only touch the rows that changed"""
+
+    def shown_names(self, view):
+        return [values[0] for values in view.tree.shown()]
+
+    def set_names(self, view, names):
+        view.model.set_names(names)
+        view.first = 0
+        view.refresh()
+
+    def test_filter_round_trip_reattaches(self):
+        source, view = make_view(10_000)
+        ids = dict(view._ids)
+        self.set_names(view, [name for name in source if name.endswith("7")])
+        assert self.shown_names(view)[:2] == ["System 00007", "System 00017"]
+
+        view.tree.calls.clear()
+        self.set_names(view, source)
+        assert self.shown_names(view) == [f"System {i:05d}" for i in range(15)]
+        assert "insert" not in view.tree.calls and "delete" not in view.tree.calls
+        assert {name: view._ids[name] for name in ids} == ids
+
+    def test_filter_change_cost_scales_with_window(self):
+        source, view = make_view(10_000)
+        view.tree.calls.clear()
+        self.set_names(view, list(source)[1:])
+        # One row left the top, one entered at the bottom, every other row only changed stripe
+        assert view.tree.calls.get("insert") == 1
+        assert view.tree.calls.get("detach") == 1
+        assert view.tree.calls.get("item") == 14
+        assert len(view.tree.rows) == 16
+
+    def test_sort_moves_rows(self):
+        _, view = make_view(20, visible=20)
+        view.tree.calls.clear()
+        view.model.sort("Reinf", reverse=True)
+        view.refresh()
+        assert self.shown_names(view) == [f"System {i:05d}" for i in range(19, -1, -1)]
+        assert "insert" not in view.tree.calls
+        assert view.tree.calls["move"] == 19
+
+    def test_system_change_patches_one_row(self):
+        from emt_models.registry import SystemRegistry
+        from emt_models.system import _system_from_dict, _system_evictable
+
+        registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+        for i in range(100):
+            registry[f"S{i}"] = make_system(f"S{i}")
+        view = VirtualTreeview(MockTreeview(height=28 * 11), MockScrollbar(), SystemRowModel(registry), overscan=5)
+        view.model.set_names(registry.keys())
+        view.refresh()
+
+        view.tree.calls.clear()
+        registry["S3"].PowerplayStateReinforcement = 777
+        registry.notify("S3")
+        registry.notify("S90")  # not materialised: nothing to patch
+        assert view.tree.calls == {"item": 1}
+        assert view.tree.rows[view._ids["S3"]]["values"][5] == 777
+
+    def test_detached_rows_are_bounded(self):
+        _, view = make_view(10_000)
+        for first in range(0, 10_000, 15):
+            view.scroll_to(first)
+        assert len(view.tree.children) <= 15
+        assert len(view.tree.rows) <= len(view.tree.children) + MAX_DETACHED
+
+
+class TestTypedSort:
+    """Test sorting uses typed keys rather than the display strings"""
+
+    def sorted_names(self, systems_list, column, reverse=False):
+        source = {system.StarSystem: system for system in systems_list}
+        model = SystemRowModel(source)
+        model.set_names(source)
+        model.sort(column, reverse)
+        return model.names()
+
+    def test_numbers_sort_numerically(self):
+        systems_list = [make_system("A", reinforcement=1_234), make_system("B", reinforcement=999),
+                        make_system("C", reinforcement=10_000)]
+        assert self.sorted_names(systems_list, "Reinf") == ["B", "A", "C"]
+
+        systems_list = [make_system("A", progress=0.095), make_system("B", progress=0.5), make_system("C", progress=0.1)]
+        assert self.sorted_names(systems_list, "Progress", reverse=True) == ["B", "C", "A"]
+
+    def test_text_is_case_insensitive(self):
+        systems_list = [make_system("beta"), make_system("Alpha"), make_system("Gamma")]
+        assert self.sorted_names(systems_list, "System") == ["Alpha", "beta", "Gamma"]
+
+    def test_conflict_rows_go_last(self):
+        conflict = StarSystem({"StarSystem": "War", "PowerplayState": "Unoccupied",
+                               "PowerplayConflictProgress": [{"Power": "Felicia Winters", "ConflictProgress": 0.4}]})
+        systems_list = [make_system("A", reinforcement=5), conflict, make_system("B", reinforcement=1)]
+        assert self.sorted_names(systems_list, "Reinf") == ["B", "A", "War"]
+        assert self.sorted_names(systems_list, "Reinf", reverse=True) == ["A", "B", "War"]
+        assert self.sorted_names(systems_list, "Cycle", reverse=True) == ["A", "B", "War"]
+
+    def test_ties_keep_their_order(self):
+        systems_list = [make_system(name) for name in ("C", "A", "B")]
+        assert self.sorted_names(systems_list, "Power") == ["C", "A", "B"]
+        assert self.sorted_names(systems_list, "Power", reverse=True) == ["C", "A", "B"]
+
+    def test_change_updates_key(self):
+        from emt_models.registry import SystemRegistry
+        from emt_models.system import _system_from_dict, _system_evictable
+
+        registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+        registry["A"] = make_system("A", reinforcement=1)
+        registry["B"] = make_system("B", reinforcement=2)
+        model = SystemRowModel(registry)
+        model.set_names(registry.keys())
+        model.sort("Reinf")
+        assert model.names() == ["A", "B"]
+
+        registry["A"].PowerplayStateReinforcement = 3
+        registry.notify("A")
+        model.sort("Reinf")
+        assert model.names() == ["B", "A"]
+
+
+@pytest.mark.performance
+class TestTreeviewBenchmark:
+    """Virtual first paint versus one inserted row per system"""
+
+    def test_first_paint(self):
+        from emt_tests.benchmark import run_treeview_benchmark, format_results
+
+        results = run_treeview_benchmark(50_000)
+        print(format_results("Detailed view first paint (50,000 systems)", results))
+
+        assert results["virtual_rows"] < 100
+        assert results["virtual_paint_ms"] < results["eager_paint_ms"]
+        assert results["virtual_peak_kb"] < results["eager_peak_kb"]
+
+
+@pytest.mark.performance
+class TestSortBenchmark:
+    """Typed row model sort versus reading and parsing every cell from the tree"""
+
+    @pytest.mark.parametrize("count", [10_000, 50_000])
+    def test_sort(self, count):
+        from emt_tests.benchmark import run_sort_benchmark, format_results
+
+        results = run_sort_benchmark(count)
+        print(format_results(f"Detailed view sort by Reinf ({count:,} rows)", results))
+
+        assert results["typed_ms"] < results["legacy_ms"]
+        assert results["typed_tk_calls"] < 100
@@ -0,0 +1,116 @@
+"""
+Test Suite for the Synthetic Journal Generator and Throughput Benchmark
+
+The generator must be deterministic and produce streams the plugin can
+consume; the performance tests push those streams through journal_entry.
+"""
+import pytest
+from emt_tests.journal_generator import JournalGenerator, generate_journal, DATA_TYPES, SALVAGE_TYPES
+from emt_tests.benchmark import run_journal_benchmark, percentile, format_results
+
+
+class TestJournalGenerator:
+    """Test synthetic journal stream generation"""
+
+    def test_exact_event_count(self):
+        """Test generator yields exactly the requested number of events"""
+        for count in (0, 1, 7, 1000):
+            assert len(list(generate_journal(count, seed=1))) == count
+
+    def test_deterministic_for_same_seed(self):
+        """Test equal seeds produce equal streams"""
+        assert list(generate_journal(2000, seed=42)) == list(generate_journal(2000, seed=42))
+
+    def test_different_seeds_differ(self):
+        """Test different seeds produce different streams"""
+        assert list(generate_journal(500, seed=1)) != list(generate_journal(500, seed=2))
+
+    def test_first_event_is_location(self):
+        """Test stream starts with a Location event like a real session"""
+        first = next(iter(generate_journal(10, seed=3)))
+        assert first["event"] == "Location"
+        assert "StarSystem" in first
+
+    def test_timestamps_monotonic(self):
+        """Test timestamps never go backwards"""
+        stamps = [e["timestamp"] for e in generate_journal(5000, seed=4)]
+        assert stamps == sorted(stamps)
+
+    def test_covers_all_event_kinds(self):
+        """Test realistic event mix is produced"""
+        kinds = {e["event"] for e in generate_journal(20000, seed=5)}
+        for expected in ("FSDJump", "Location", "PowerplayMerits", "BackpackChange",
+                         "DeliverPowerMicroResources", "CollectCargo", "SearchAndRescue",
+                         "ShipLocker", "Docked", "Music"):
+            assert expected in kinds
+
+    def test_total_merits_progress(self):
+        """Test PowerplayMerits TotalMerits progresses so duplicate detection accepts it"""
+        merits = [e for e in generate_journal(20000, seed=6) if e["event"] == "PowerplayMerits"]
+        for prev, cur in zip(merits, merits[1:]):
+            assert cur["TotalMerits"] == prev["TotalMerits"] + cur["MeritsGained"]
+
+    def test_item_names_are_valid(self):
+        """Test generated data and salvage names are recognised by the plugin"""
+        for e in generate_journal(20000, seed=7):
+            if e["event"] == "BackpackChange":
+                assert all(item["Name"] in DATA_TYPES for item in e["Added"])
+            elif e["event"] == "CollectCargo":
+                assert e["Type"] in SALVAGE_TYPES
+
+    def test_system_pool_size(self):
+        """Test number of distinct systems is bounded by system_count"""
+        gen = JournalGenerator(seed=8, system_count=25)
+        names = {e["StarSystem"] for e in gen.events(5000) if e["event"] in ("FSDJump", "Location")}
+        assert 0 < len(names) <= 25
+
+
+class TestBenchmarkHelpers:
+    """Test benchmark helper functions"""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_format_results(self):
+        text = format_results("Title", {"events": 10, "seconds": 1.5})
+        assert text.splitlines()[0] == "Title"
+        assert "1.50" in text
+
+    def test_benchmark_keeps_out_of_data_dir(self, tmp_path, monkeypatch):
+        """Test the benchmark saves into a scratch directory, not the plugin's data/"""
+        import emt_core.storage as storage
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+
+        results = run_journal_benchmark(events=2000, seed=0, measure_memory=False)
+        assert results["events"] == 2000
+        assert list(tmp_path.iterdir()) == []
+        assert storage.get_data_dir() == str(tmp_path)
+
+
+@pytest.mark.performance
+class TestJournalThroughput:
+    """End-to-end journal_entry throughput benchmarks"""
+
+    def test_journal_entry_throughput(self):
+        """Test a 20k event stream is processed and report throughput"""
+        results = run_journal_benchmark(events=20_000, seed=0)
+        print(format_results("journal_entry throughput (20k events)", results))
+
+        assert results["events"] == 20_000
+        assert results["systems"] > 0
+        assert results["events_per_sec"] > 0
+        assert results["p50_us"] <= results["p99_us"] <= results["max_us"]
+        assert results["peak_memory_kb"] > 0
+
+    @pytest.mark.slow
+    def test_journal_entry_throughput_large(self):
+        """Test a 200k event stream over a large system pool"""
+        results = run_journal_benchmark(events=200_000, seed=1, system_count=20_000, measure_memory=False)
+        print(format_results("journal_entry throughput (200k events)", results))
+
+        assert results["events"] == 200_000
+        assert results["systems"] > 1000
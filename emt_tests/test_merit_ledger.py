@@ -0,0 +1,201 @@
+"""
+Test Suite for the Merit Ledger (emt_core/ledger.py) and Cycle Helpers (emt_core/cycle.py)
+"""
+import pytest
+from emt_core.cycle import cycle_id, cycle_start
+from emt_core.ledger import MeritLedger, SOURCE_COMBAT, SOURCE_DATA, SOURCE_SALVAGE
+
+
+def make_ledger(tmp_path, **kwargs):
+    ledger = MeritLedger(ledger_dir=str(tmp_path), **kwargs)
+    ledger.open()
+    return ledger
+
+
+class TestCycle:
+    """Test PowerPlay cycle boundaries (Thursday 07:00 UTC)"""
+
+    @pytest.mark.parametrize("timestamp,expected", [
+        ("2026-10-15T07:00:00Z", "2026-10-15"),  # Thursday at the tick
+        ("2026-10-15T06:59:59Z", "2026-10-08"),  # Thursday just before the tick
+        ("2026-10-18T12:00:00Z", "2026-10-15"),  # Sunday
+        ("2026-10-21T23:59:59Z", "2026-10-15"),  # Wednesday
+    ])
+    def test_cycle_id(self, timestamp, expected):
+        assert cycle_id(timestamp) == expected
+
+    def test_cycle_start_time(self):
+        assert cycle_start("2026-10-18T12:00:00Z").strftime("%a %H:%M") == "Thu 07:00"
+
+
+class TestMeritLedger:
+    """Test ledger recording and queries"""
+
+    def test_disabled_until_opened(self, tmp_path):
+        ledger = MeritLedger(ledger_dir=str(tmp_path))
+        ledger.record("2026-10-15T08:00:00Z", "Sol", SOURCE_COMBAT, 10)
+        assert ledger.total() == 0
+
+    def test_totals_per_dimension(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        ledger.record("2026-10-15T08:00:00Z", "Sol", SOURCE_COMBAT, 10, "Felicia Winters")
+        ledger.record("2026-10-16T08:00:00Z", "Sol", SOURCE_DATA, 20, "Felicia Winters")
+        ledger.record("2026-10-22T08:00:00Z", "Achenar", SOURCE_SALVAGE, 5, "Felicia Winters")
+
+        assert ledger.totals_by("system") == {"Sol": 30, "Achenar": 5}
+        assert ledger.totals_by("day") == {"2026-10-15": 10, "2026-10-16": 20, "2026-10-22": 5}
+        assert ledger.totals_by("cycle") == {"2026-10-15": 30, "2026-10-22": 5}
+        assert ledger.totals_by("source") == {SOURCE_COMBAT: 10, SOURCE_DATA: 20, SOURCE_SALVAGE: 5}
+        assert ledger.total(system="Sol") == 30
+        assert ledger.total(system="Sol", source=SOURCE_DATA) == 20
+        assert ledger.total() == 35
+
+    def test_unknown_dimension(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        with pytest.raises(ValueError):
+            ledger.totals_by("station")
+        with pytest.raises(ValueError):
+            ledger.total(station="Abraham Lincoln")
+
+    def test_flush_and_reload(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        ledger.record("2026-10-15T08:00:00Z", "Sol, Old Worlds", SOURCE_COMBAT, 10)
+        ledger.flush()
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        assert reopened.total(system="Sol, Old Worlds") == 10
+        assert [row["amount"] for row in reopened.rows(system="Sol, Old Worlds")] == [10]
+
+    def test_segment_rotation_and_range_queries(self, tmp_path):
+        ledger = make_ledger(tmp_path, segment_rows=3)
+        for day in range(10, 20):
+            ledger.record(f"2026-10-{day}T12:00:00Z", "Sol" if day % 2 else "Achenar", SOURCE_COMBAT, day)
+        ledger.flush()
+
+        assert len(ledger.segments) == 4
+        assert len(list(tmp_path.glob("ledger-*.csv"))) == 4
+        in_range = ledger.totals_by("system", start="2026-10-12T00:00:00Z", end="2026-10-16T23:59:59Z")
+        assert in_range == {"Achenar": 12 + 14 + 16, "Sol": 13 + 15}
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        assert reopened.totals_by("system") == ledger.totals_by("system")
+        assert reopened.total(system="Sol", cycle="2026-10-15") == 15 + 17 + 19
+
+    def test_multi_filter_skips_segments(self, tmp_path, monkeypatch):
+        ledger = make_ledger(tmp_path, segment_rows=2)
+        ledger.record("2026-10-15T08:00:00Z", "Sol", SOURCE_COMBAT, 1)
+        ledger.record("2026-10-15T09:00:00Z", "Sol", SOURCE_COMBAT, 2)
+        ledger.record("2026-10-15T10:00:00Z", "Achenar", SOURCE_DATA, 3)
+        ledger.flush()
+
+        read = []
+        original = ledger._segment_rows
+        monkeypatch.setattr(ledger, "_segment_rows", lambda segment: read.append(segment["seq"]) or original(segment))
+        assert ledger.total(system="Achenar", source=SOURCE_DATA) == 3
+        assert read == [2]
+
+
+class TestLedgerThreads:
+    """Test rows recorded while the autosave thread flushes are kept"""
+
+    def test_record_during_flush(self, tmp_path, monkeypatch):
+        import threading
+        import emt_core.ledger as ledger_module
+
+        ledger = make_ledger(tmp_path)
+        ledger.record("2026-10-15T08:00:00Z", "Sol", SOURCE_COMBAT, 10)
+        recorder = threading.Thread(target=ledger.record, args=("2026-10-15T09:00:00Z", "Achenar", SOURCE_DATA, 5))
+        calls = []
+
+        def record_mid_flush():
+            # Called between writing the segment and clearing the buffer
+            if not calls:
+                recorder.start()
+                recorder.join(timeout=0.2)
+            calls.append(1)
+            return "none"
+
+        monkeypatch.setattr(ledger_module, "get_durability", record_mid_flush)
+        ledger.flush()
+        recorder.join()
+        ledger.flush()
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        assert [row["amount"] for row in reopened.rows()] == [10, 5]
+        assert reopened.totals_by("system") == {"Sol": 10, "Achenar": 5}
+
+
+class TestLedgerRecovery:
+    """Test the index is rebuilt from segment files that do not match it"""
+
+    def make_flushed(self, tmp_path):
+        ledger = make_ledger(tmp_path)
+        ledger.record("2026-10-15T08:00:00Z", "Sol", SOURCE_COMBAT, 10)
+        ledger.flush()
+        return tmp_path / "ledger-000001.csv"
+
+    def test_rows_written_after_the_index(self, tmp_path):
+        segment = self.make_flushed(tmp_path)
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write("2026-10-15T09:00:00Z,Achenar,data,5,\n")
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        assert reopened.totals_by("system") == {"Sol": 10, "Achenar": 5}
+        assert reopened.segments[0]["rows"] == 2
+        # The rebuilt entry was saved, so the next start trusts the index again
+        assert MeritLedger(ledger_dir=str(tmp_path)).segments[0]["bytes"] == segment.stat().st_size
+
+    def test_index_outliving_lost_rows(self, tmp_path):
+        segment = self.make_flushed(tmp_path)
+        segment.write_text("")
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        assert reopened.total() == 0
+        assert reopened.segments[0]["rows"] == 0
+
+    def test_torn_row_is_cut_off(self, tmp_path):
+        segment = self.make_flushed(tmp_path)
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write("2026-10-15T09:00:00Z,Ach")
+
+        reopened = MeritLedger(ledger_dir=str(tmp_path))
+        reopened.open()
+        reopened.record("2026-10-15T10:00:00Z", "Achenar", SOURCE_DATA, 5)
+        reopened.flush()
+        assert [row["amount"] for row in MeritLedger(ledger_dir=str(tmp_path)).rows()] == [10, 5]
+
+    def test_missing_index(self, tmp_path):
+        self.make_flushed(tmp_path)
+        (tmp_path / "index.json").unlink()
+
+        assert MeritLedger(ledger_dir=str(tmp_path)).total(system="Sol") == 10
+
+
+class TestJournalIntegration:
+    """Test journal_entry credits are recorded in the ledger"""
+
+    def test_combat_and_data_credits(self, tmp_path, sample_fortified_system):
+        import load
+        from emt_tests.benchmark import reset_plugin_state
+
+        reset_plugin_state()
+        ledger = make_ledger(tmp_path)
+        original = load.merit_ledger
+        load.merit_ledger = ledger
+        try:
+            load.pledgedPower.Power = "Felicia Winters"
+            load.journal_entry("CMDR", False, None, None, sample_fortified_system, None)
+            load.journal_entry("CMDR", False, None, None, {
+                "timestamp": "2026-01-02T20:05:00Z", "event": "PowerplayMerits",
+                "Power": "Felicia Winters", "MeritsGained": 120, "TotalMerits": 1120}, None)
+            load.state.last_delivery_counts = {"Sol": 1, "Achenar": 3}
+            load.journal_entry("CMDR", False, None, None, {
+                "timestamp": "2026-01-02T20:10:00Z", "event": "PowerplayMerits",
+                "Power": "Felicia Winters", "MeritsGained": 400, "TotalMerits": 1520}, None)
+        finally:
+            load.merit_ledger = original
+            reset_plugin_state()
+
+        assert ledger.totals_by("system") == {"Czerno": 120, "Sol": 100, "Achenar": 300}
+        assert ledger.totals_by("source") == {SOURCE_COMBAT: 120, SOURCE_DATA: 400}
+        assert ledger.totals_by("power") == {"Felicia Winters": 520}
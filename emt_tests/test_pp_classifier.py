@@ -0,0 +1,59 @@
+"""
+Test Suite for the PowerPlay Data Classifier (emt_ppdata/classifier.py)
+"""
+import pytest
+from emt_ppdata import (classify_pp_data, PP_DATA_TYPES, PP_UM, PP_REINF, PP_ACQ,
+                        is_valid_um_data, is_valid_reinf_data, is_valid_acq_data)
+from emt_ppdata.undermining import get_um_display_name
+from emt_models.backpack import Backpack
+
+
+class TestClassifier:
+    """Test the classifier table agrees with the per-category tables"""
+
+    @pytest.mark.parametrize("name", list(PP_DATA_TYPES) + ["settlementdefenceplans", ""])
+    def test_mask_matches_validators(self, name):
+        mask, display_name = classify_pp_data(name)
+        assert bool(mask & PP_UM) == is_valid_um_data(name)
+        assert bool(mask & PP_REINF) == is_valid_reinf_data(name)
+        assert bool(mask & PP_ACQ) == is_valid_acq_data(name)
+        assert display_name == get_um_display_name(name)
+
+    def test_reinforcement_subset(self):
+        assert classify_pp_data("powerresearchdata")[0] == PP_UM | PP_ACQ
+        assert classify_pp_data("poweremployeedata")[0] == PP_UM | PP_REINF | PP_ACQ
+
+
+class TestBackpackIngest:
+    """Test the backpack ingest paths ignore non-PowerPlay data"""
+
+    def test_non_pp_items_ignored(self):
+        backpack = Backpack()
+        backpack.add_item("settlementdefenceplans", 3, "Sol", "no power", "Felicia Winters")
+        assert backpack.remove_item("settlementdefenceplans", 3) == {}
+        assert backpack.acqbag.get_total() == 0
+
+    def test_territory_routing(self):
+        backpack = Backpack()
+        backpack.add_item("PowerResearchData", 2, "Enemy", "Zemina Torval", "Felicia Winters")
+        backpack.add_item("powerresearchdata", 2, "Own", "Felicia Winters", "Felicia Winters")
+        backpack.add_item("poweremployeedata", 1, "Own", "Felicia Winters", "Felicia Winters")
+        backpack.add_item("powerresearchdata", 4, "Neutral", "no power", "Felicia Winters")
+
+        assert backpack.umbag.get_systems_summary() == {"Enemy": 2}
+        assert backpack.reinfbag.get_systems_summary() == {"Own": 1}  # research data is not reinforcement data
+        assert backpack.acqbag.get_systems_summary() == {"Neutral": 4}
+        assert backpack.remove_item("powerresearchdata", 10) == {"Enemy": 2, "Neutral": 4}
+
+
+@pytest.mark.performance
+class TestClassifierBenchmark:
+    """Single classifier lookup versus three validator calls on a ShipLocker payload"""
+
+    def test_shiplocker_payload(self):
+        from emt_tests.benchmark import run_classifier_benchmark, format_results
+
+        results = run_classifier_benchmark(200_000)
+        print(format_results("ShipLocker Data classification (200,000 items)", results))
+
+        assert results["classifier_ms"] < results["legacy_ms"]
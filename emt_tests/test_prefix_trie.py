@@ -0,0 +1,55 @@
+"""
+Test Suite for the Prefix Trie (emt_core/trie.py)
+"""
+import random
+from emt_core.trie import PrefixTrie
+
+
+def build(names):
+    trie = PrefixTrie()
+    for name in names:
+        trie.insert(name, name)
+    return trie
+
+
+class TestPrefixTrie:
+    """Test prefix search returns exactly the matching names, in key order"""
+
+    def test_search(self):
+        trie = build(["Sol", "Sirius", "Sol Two", "Shinrarta Dezhra", "Achenar"])
+        assert trie.search("s") == ["Shinrarta Dezhra", "Sirius", "Sol", "Sol Two"]
+        assert trie.search("SOL") == ["Sol", "Sol Two"]
+        assert trie.search("sol t") == ["Sol Two"]
+        assert trie.search("solx") == []
+        assert trie.search("x") == []
+        assert trie.search("") == ["Achenar", "Shinrarta Dezhra", "Sirius", "Sol", "Sol Two"]
+        assert trie.search("s", limit=2) == ["Shinrarta Dezhra", "Sirius"]
+        assert len(trie) == 5
+
+    def test_remove_prunes_and_merges(self):
+        trie = build(["Sol", "Sol Two", "Solati"])
+        trie.remove("Sol Two", "Sol Two")
+        trie.remove("Sol", "Sol")
+        trie.remove("Sol", "Sol")  # already gone
+        trie.remove("Sola", "Sola")  # never added
+        assert trie.search("so") == ["Solati"]
+        assert trie._root.edges == {"s": ("solati", trie._root.edges["s"][1])}
+        trie.remove("Solati", "Solati")
+        assert trie._root.edges == {} and len(trie) == 0
+
+    def test_random_against_scan(self):
+        rng = random.Random(0)
+        alphabet = "abc "
+        names = set()
+        trie = PrefixTrie()
+        for _ in range(3_000):
+            name = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+            if name in names and rng.random() < 0.5:
+                names.discard(name)
+                trie.remove(name, name)
+            else:
+                names.add(name)
+                trie.insert(name, name)
+        assert len(trie) == len(names)
+        for prefix in ["", "a", "ab", "b c", "cc", "abca"]:
+            assert trie.search(prefix) == sorted(n for n in names if n.startswith(prefix))
@@ -0,0 +1,88 @@
+"""
+Test Suite for the Salvage Reverse Index (emt_models/salvage.py)
+"""
+import random
+import pytest
+import emt_models.salvage as salvage_module
+from emt_models.salvage import Salvage, SalvageInventory, VALID_POWERPLAY_SALVAGE_TYPES
+
+
+def recount(inventory):
+    """Reverse index built by walking every Salvage"""
+    by_type = {}
+    for system_name, salvage in inventory.items():
+        for cargo_type, cargo in salvage.inventory.items():
+            if cargo.count > 0:
+                by_type.setdefault(cargo_type, {})[system_name] = cargo.count
+    return by_type
+
+
+@pytest.fixture
+def inventory(monkeypatch):
+    """A fresh inventory standing in for the global salvageInventory"""
+    inventory = SalvageInventory()
+    monkeypatch.setattr(salvage_module, "salvageInventory", inventory)
+    return inventory
+
+
+class TestSalvageIndex:
+    """Test the cargo type -> systems index follows every change"""
+
+    def test_cargo_operations(self, inventory):
+        inventory["Sol"] = Salvage("Sol")
+        inventory["Sol"].add_cargo("PowerResearch", 3)
+        inventory.setdefault("Lave", Salvage("Lave")).add_cargo("powerresearch", 2)
+
+        assert inventory.systems_for("powerresearch") == {"Sol": inventory["Sol"].inventory["powerresearch"].count,
+                                                          "Lave": inventory["Lave"].inventory["powerresearch"].count}
+        assert inventory.type_total("POWERRESEARCH") == sum(inventory.systems_for("powerresearch").values())
+
+        inventory["Sol"].remove_cargo("powerresearch", 100)
+        assert list(inventory.systems_for("powerresearch")) == ["Lave"]
+        assert inventory.systems_for("powersecurity") == {}
+
+        inventory["Lave"].set_count("powersecurity", 7)
+        inventory["Lave"].set_count("powerresearch", 0)
+        assert inventory._by_type == {"powersecurity": {"Lave": 7}}
+        assert inventory.total() == 7
+
+    def test_dict_operations(self, inventory):
+        sol = Salvage("Sol")
+        sol.add_cargo("powermedical", 4)  # not yet in the inventory
+        inventory.update({"Sol": sol})
+        assert inventory.type_total("powermedical") == sol.inventory["powermedical"].count
+
+        replacement = Salvage("Sol")
+        replacement.add_cargo("powersecurity", 1)
+        inventory["Sol"] = replacement
+        assert inventory.type_total("powermedical") == 0
+        sol.add_cargo("powermedical", 1)  # detached object no longer reports
+        assert recount(inventory) == inventory._by_type
+
+        del inventory["Sol"]
+        assert inventory._by_type == {} and inventory.total() == 0
+        inventory["Lave"] = replacement
+        inventory.pop("Lave")
+        inventory.clear()
+        assert inventory._type_totals == {}
+
+    def test_random_operations_match_recount(self, inventory):
+        rng = random.Random(0)
+        types = list(VALID_POWERPLAY_SALVAGE_TYPES)
+        systems = [f"System {i}" for i in range(6)]
+        for _ in range(2_000):
+            system_name = rng.choice(systems)
+            op = rng.random()
+            if op < 0.1:
+                inventory.pop(system_name, None)
+                continue
+            salvage = inventory.setdefault(system_name, Salvage(system_name))
+            if op < 0.6:
+                salvage.add_cargo(rng.choice(types), rng.randint(1, 5))
+            elif op < 0.9:
+                salvage.remove_cargo(rng.choice(types), rng.randint(1, 5))
+            else:
+                salvage.set_count(rng.choice(types), rng.randint(0, 3))
+            assert recount(inventory) == inventory._by_type
+
+        assert inventory.total() == sum(c.count for s in inventory.values() for c in s.inventory.values())
@@ -0,0 +1,131 @@
+"""
+Test Suite for Versioned Data Files (emt_core/schema.py)
+
+Covers the schema header, the migration chain and the one-time upgrade of
+legacy systems.json, backpack.json and power.json files on load.
+"""
+import json
+import pytest
+import emt_core.storage as storage
+import emt_core.schema as schema
+from emt_core.schema import wrap, unwrap, migrate, register_schema, register_migration
+from emt_core.storage import load_document, set_storage_backend, STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point storage and backups at a temporary data directory"""
+    import emt_core.backups as backups
+    monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(backups, "backup_store", backups.BackupStore(str(tmp_path / "backups"), str(tmp_path)))
+    yield tmp_path
+    storage.close_storage()
+    storage._sqlite_store = None
+    storage._backend = STORAGE_BACKEND_JSON
+
+
+def read(data_dir, filename):
+    return json.loads((data_dir / filename).read_text())
+
+
+class TestSchemaHeader:
+    """Test wrapping, unwrapping and the migration chain"""
+
+    @pytest.fixture
+    def chain(self, monkeypatch):
+        monkeypatch.setattr(schema, "_versions", {})
+        monkeypatch.setattr(schema, "_migrations", {})
+        register_schema("test.json", 3)
+        register_migration("test.json", 1)(lambda d: {**d, "v2": True})
+        register_migration("test.json", 2)(lambda d: {**d, "v3": True})
+
+    def test_round_trip(self, chain):
+        assert wrap("test.json", {"a": 1}) == {"_schema": 3, "data": {"a": 1}}
+        assert unwrap(wrap("test.json", {"a": 1})) == (3, {"a": 1})
+
+    def test_headerless_is_version_one(self):
+        assert unwrap({"a": 1}) == (1, {"a": 1})
+
+    def test_migrates_through_every_step(self, chain):
+        assert migrate("test.json", 1, {}) == {"v2": True, "v3": True}
+        assert migrate("test.json", 2, {}) == {"v3": True}
+
+    def test_newer_file_is_rejected(self, chain):
+        with pytest.raises(ValueError):
+            migrate("test.json", 4, {})
+
+
+class TestLegacyFiles:
+    """Test v1 files are upgraded once and rewritten with a header"""
+
+    def test_backpack_legacy_formats(self, data_dir):
+        legacy = {
+            "umbag": {"items": {"powerspyware": {"Sol": 3}}, "cp_values": {}},
+            "reinfbag": {"powerinventory": {"Sol": 2, "Achenar": 1}},
+            "acqbag": {"powerresearch": {"system": "Lave", "count": 4},
+                       "powerpolitical": {"system": "Lave", "count": 0}},
+        }
+        (data_dir / "backpack.json").write_text(json.dumps(legacy))
+
+        expected = {"umbag": {"powerspyware": {"Sol": 3}},
+                    "reinfbag": {"powerinventory": {"Sol": 2, "Achenar": 1}},
+                    "acqbag": {"powerresearch": {"Lave": 4}}}
+        assert load_document("backpack.json") == expected
+        assert read(data_dir, "backpack.json") == wrap("backpack.json", expected)
+
+    def test_power_name_renamed(self, data_dir):
+        from emt_models.power import PledgedPower
+
+        (data_dir / "power.json").write_text(json.dumps({"PowerName": "Aisling Duval", "Merits": 5}))
+        power = PledgedPower()
+        power.loadPower()
+        assert power.Power == "Aisling Duval"
+        assert read(data_dir, "power.json")["data"] == {"Power": "Aisling Duval", "Merits": 5}
+
+    def test_systems_normalised(self, data_dir):
+        from emt_models.system import StarSystem
+
+        legacy = {"Sol": {"StarSystem": "Sol", "Merits": 10, "PowerplayState": "Unoccupied",
+                          "Powers": ["Felicia Winters", "Zemina Torval"],
+                          "PowerplayConflictProgress": [{"Power": "Zemina Torval", "ConflictProgress": 0.2},
+                                                        {"Power": "Felicia Winters", "ConflictProgress": 0.4}],
+                          "SystemSecurity": "$SYSTEM_SECURITY_low;"}}
+        (data_dir / "systems.json").write_text(json.dumps(legacy))
+
+        data = load_document("systems.json")["Sol"]
+        assert data["ControllingPower"] == "Felicia Winters"
+        assert data["Opposition"] == ["Zemina Torval"]
+        assert data["PowerplayConflictProgress"][0] == {"power": "Felicia Winters", "progress": 0.4}
+        assert data["SystemSecurity"] == "Low"
+
+        system = StarSystem()
+        system.from_dict(data)
+        assert system.PowerplayConflictProgress[1].power == "Zemina Torval"
+        assert read(data_dir, "systems.json")["_schema"] == 2
+
+    def test_migration_snapshots_old_file(self, data_dir):
+        import emt_core.backups as backups
+
+        (data_dir / "power.json").write_text(json.dumps({"PowerName": "Aisling Duval"}))
+        load_document("power.json")
+        snapshots = backups.backup_store.list_snapshots()
+        assert len(snapshots) == 1
+        assert json.loads(backups.backup_store.read_file(snapshots[0]["id"], "power.json")) == {
+            "PowerName": "Aisling Duval"}
+
+    def test_current_file_not_rewritten(self, data_dir, monkeypatch):
+        (data_dir / "power.json").write_text(json.dumps(wrap("power.json", {"Power": "Aisling Duval"})))
+        monkeypatch.setattr(storage, "save_json", lambda *a, **k: pytest.fail("current file rewritten"))
+        assert load_document("power.json") == {"Power": "Aisling Duval"}
+
+    def test_sqlite_database_migrated_once(self, data_dir):
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        store = storage.get_sqlite_store()
+        # A database written before schema versions existed
+        store.conn.execute("DELETE FROM meta WHERE key = 'schema:systems.json'")
+        store.save_document("systems.json", {"Sol": {"StarSystem": "Sol", "Merits": 1,
+                                                     "SystemSecurity": "$SYSTEM_SECURITY_high;"}})
+
+        assert load_document("systems.json")["Sol"]["SystemSecurity"] == "High"
+        assert store.get_meta("schema:systems.json") == "2"
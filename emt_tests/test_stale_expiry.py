@@ -0,0 +1,175 @@
+"""
+Test Suite for Ageing Backpack and Salvage Entries into Stale Buckets
+
+Covers the expiry queue (emt_core/expiry.py), Bag/SalvageInventory.expire and
+the expiry.json round trip (emt_models/expiry.py).
+"""
+import pytest
+import emt_core.storage as storage
+import emt_models.salvage as salvage_module
+from emt_core.expiry import ExpiryQueue, stale_cutoff
+from emt_models.backpack import Bag, Backpack
+from emt_models.salvage import Salvage, SalvageInventory
+
+DAY1 = "2026-10-01T12:00:00Z"
+DAY2 = "2026-10-02T12:00:00Z"
+DAY5 = "2026-10-05T12:00:00Z"
+
+
+class TestExpiryQueue:
+    """Test the oldest entries come out first and re-stamps win"""
+
+    def test_pop_expired(self):
+        queue = ExpiryQueue()
+        queue.touch("a", DAY2)
+        queue.touch("b", DAY1)
+        queue.touch("c", DAY5)
+        queue.touch("a", DAY5)  # collected again later
+        queue.discard("c")
+
+        assert queue.pop_expired(DAY5) == ["b"]
+        assert queue.pop_expired("2026-10-06T00:00:00Z") == ["a"]
+        assert len(queue) == 0
+
+    def test_heap_compacts(self):
+        queue = ExpiryQueue()
+        for minute in range(1000):
+            queue.touch("a", f"2026-10-01T12:{minute // 60:02d}:{minute % 60:02d}Z")
+        assert len(queue._heap) < 100
+        assert queue.pop_expired(DAY5) == ["a"]
+
+    def test_stale_cutoff(self):
+        assert stale_cutoff(DAY5, 72) == DAY2
+
+
+class TestBagExpiry:
+    """Test expired bag entries leave the attribution path"""
+
+    def test_expire_moves_to_stale(self):
+        bag = Bag("test")
+        bag.add_item("powerspyware", 3, "Old", timestamp=DAY1)
+        bag.add_item("powerspyware", 2, "New", timestamp=DAY5)
+
+        assert bag.expire(DAY2, DAY5) == {"powerspyware": {"Old": 3}}
+        assert bag.items == {"powerspyware": {"New": 2}}
+        assert bag.stale == {"powerspyware": {"Old": 3}}
+        assert bag.get_total() == 2 and bag.verify_totals()
+        assert bag.remove_item("powerspyware", 5) == {"New": 2}
+
+    def test_unstamped_entries_age_from_first_check(self):
+        bag = Bag("test")
+        bag.from_dict({"powerspyware": {"Sol": 1}})
+        assert bag.expire(DAY1, DAY2) == {}
+        assert bag.expire(DAY5, DAY5) == {"powerspyware": {"Sol": 1}}
+
+    def test_recollecting_refreshes(self):
+        bag = Bag("test")
+        bag.add_item("powerspyware", 1, "Sol", timestamp=DAY1)
+        bag.add_item("powerspyware", 1, "Sol", timestamp=DAY5)
+        assert bag.expire(DAY2, DAY5) == {}
+
+    def test_backpack_hand_in_uses_stale_without_attribution(self):
+        backpack = Backpack()
+        backpack.add_item("powerresearchdata", 2, "Old", "no power", "Felicia Winters", DAY1)
+        backpack.add_item("powerresearchdata", 1, "New", "no power", "Felicia Winters", DAY5)
+        assert backpack.expire(DAY2, DAY5) == {"acquisition": {"powerresearchdata": {"Old": 2}}}
+
+        assert backpack.remove_item("powerresearchdata", 3) == {"New": 1}
+        assert backpack.acqbag.stale == {}
+
+
+@pytest.fixture
+def inventory(monkeypatch):
+    """A fresh inventory standing in for the global salvageInventory"""
+    inventory = SalvageInventory()
+    monkeypatch.setattr(salvage_module, "salvageInventory", inventory)
+    return inventory
+
+
+class TestSalvageExpiry:
+    """Test expired salvage leaves the reverse index but stays on its system"""
+
+    def test_expire_moves_to_stale(self, inventory):
+        inventory["Old"] = Salvage("Old")
+        inventory["Old"].add_cargo("powersecurity", 2, DAY1)
+        inventory["New"] = Salvage("New")
+        inventory["New"].add_cargo("powersecurity", 2, DAY5)
+        old_count = inventory["Old"].inventory["powersecurity"].count
+
+        assert inventory.expire(DAY2, DAY5) == {"Old": {"powersecurity": old_count}}
+        assert list(inventory.systems_for("powersecurity")) == ["New"]
+        assert inventory["Old"].stale == {"powersecurity": old_count}
+        assert inventory.stale_total() == old_count
+
+        assert inventory["Old"].remove_stale("powersecurity", 100) == old_count
+        assert inventory["Old"].stale == {}
+
+
+class TestSalvageHandIn:
+    """Test Search and Rescue hand-ins drain stale salvage"""
+
+    def test_all_stale_cargo(self, tmp_path, monkeypatch, sample_fortified_system):
+        import load
+        from emt_core.state import state
+        from emt_models.salvage import salvageInventory
+        from emt_tests.benchmark import reset_plugin_state
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        reset_plugin_state()
+        try:
+            load.journal_entry("CMDR", False, None, None, dict(sample_fortified_system), None)
+            salvageInventory["Czerno"] = Salvage("Czerno")
+            salvageInventory["Czerno"].stale["usscargoblackbox"] = 3
+            warnings = []
+            monkeypatch.setattr(load.logger, "warning", warnings.append)
+
+            for _ in range(2):
+                load.journal_entry("CMDR", False, None, None, {
+                    "timestamp": "2026-01-02T20:10:00Z", "event": "SearchAndRescue",
+                    "Name": "usscargoblackbox", "Count": 2}, None)
+            assert salvageInventory["Czerno"].stale == {}
+            assert not state.last_sar_counts
+            # Only the second hand-in, of which one was not tracked, is short
+            assert len(warnings) == 1 and "only had 1 tracked" in warnings[0]
+        finally:
+            reset_plugin_state()
+
+
+class TestExpiryPersistence:
+    """Test timestamps and stale buckets survive a save/load"""
+
+    def test_round_trip(self, tmp_path, monkeypatch):
+        from emt_models import expiry
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        inventory = SalvageInventory()
+        monkeypatch.setattr(salvage_module, "salvageInventory", inventory)
+        monkeypatch.setattr(expiry, "salvageInventory", inventory)
+        backpack = Backpack()
+        monkeypatch.setattr(expiry, "playerBackpack", backpack)
+
+        backpack.umbag.add_item("powerspyware", 1, "Old", timestamp=DAY1)
+        backpack.umbag.add_item("powerspyware", 1, "New", timestamp=DAY5)
+        inventory["Sol"] = Salvage("Sol")
+        inventory["Sol"].add_cargo("powermedical", 1, DAY1)
+        assert expiry.expire_stale_items(DAY5, 48) > 0
+        inventory["Sol"].add_cargo("powermedical", 1, DAY5)
+        expiry.save_expiry()
+        saved_bag = backpack.umbag.to_dict()
+        saved_salvage = {name: s.to_dict() for name, s in inventory.items()}
+
+        backpack.umbag.clear()
+        backpack.umbag.from_dict(saved_bag)
+        inventory.clear()
+        inventory.update({name: Salvage.from_dict(data) for name, data in saved_salvage.items()})
+        expiry.load_expiry()
+
+        assert backpack.umbag.stale == {"powerspyware": {"Old": 1}}
+        assert backpack.umbag.collected_to_dict() == {"powerspyware": {"New": DAY5}}
+        assert inventory.collected_to_dict() == {"Sol": {"powermedical": DAY5}}
+        assert inventory["Sol"].stale["powermedical"] > 0
+
+    def test_disabled(self):
+        from emt_models.expiry import expire_stale_items
+        assert expire_stale_items(DAY5, 0) == 0
+        assert expire_stale_items(None, 48) == 0
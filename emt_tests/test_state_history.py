@@ -0,0 +1,168 @@
+"""
+Test Suite for Point-in-time State History (emt_core/history.py)
+"""
+import json
+import os
+import subprocess
+import sys
+import pytest
+from emt_core.history import StateHistory, normalize_timestamp, apply_changes, main
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_history(tmp_path, state, **kwargs):
+    history = StateHistory(history_dir=str(tmp_path), **kwargs)
+    history.attach(lambda: json.loads(json.dumps(state)))
+    return history
+
+
+class TestNormalizeTimestamp:
+    """Test user supplied timestamp normalization"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("2026-10-12 21:05", "2026-10-12T21:05:00Z"),
+        ("2026-10-12T21:05:30Z", "2026-10-12T21:05:30Z"),
+        ("2026-10-12T21:05:30", "2026-10-12T21:05:30Z"),
+        ("2026-10-12", "2026-10-12T00:00:00Z"),
+    ])
+    def test_formats(self, value, expected):
+        assert normalize_timestamp(value) == expected
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            normalize_timestamp("yesterday")
+
+
+class TestApplyChanges:
+    """Test change record replay"""
+
+    def test_keyed_parts_merge_and_delete(self):
+        state = {"systems": {"A": {"Merits": 1}, "B": {"Merits": 2}}, "power": {"Merits": 5}}
+        apply_changes(state, {"systems": {"A": {"Merits": 10}, "B": None, "C": {"Merits": 3}},
+                              "power": {"Merits": 6}})
+        assert state == {"systems": {"A": {"Merits": 10}, "C": {"Merits": 3}}, "power": {"Merits": 6}}
+
+
+class TestStateHistory:
+    """Test snapshot + change log store"""
+
+    def test_disabled_until_attached(self, tmp_path):
+        history = StateHistory(history_dir=str(tmp_path))
+        history.record("2026-10-12T21:00:00Z", "FSDJump", {"systems": {"A": {}}})
+        assert history.list_snapshots() == []
+        assert not history.snapshot()
+
+    def test_state_at_replays_tail(self, tmp_path):
+        live = {"systems": {}, "power": {"Merits": 0}}
+        history = make_history(tmp_path, live)
+        history.snapshot("2026-10-12T20:00:00Z")
+
+        history.record("2026-10-12T21:00:00Z", "FSDJump", {"systems": {"A": {"Merits": 0}}})
+        history.record("2026-10-12T21:05:00Z", "PowerplayMerits", {"systems": {"A": {"Merits": 50}}})
+        history.record("2026-10-12T21:10:00Z", "PowerplayMerits", {"systems": {"A": {"Merits": 90}}})
+
+        assert history.state_at("2026-10-12 20:30")["systems"] == {}
+        assert history.system_at("A", "2026-10-12 21:05") == {"Merits": 50}
+        assert history.system_at("A", "2026-10-12 22:00") == {"Merits": 90}
+        assert history.state_at("2026-10-11") is None
+
+    def test_flushed_log_survives_reload(self, tmp_path):
+        history = make_history(tmp_path, {"systems": {}})
+        history.snapshot("2026-10-12T20:00:00Z")
+        history.record("2026-10-12T21:00:00Z", "FSDJump", {"systems": {"A": {"Merits": 7}}})
+        history.flush()
+
+        reopened = StateHistory(history_dir=str(tmp_path))
+        assert reopened.system_at("A", "2026-10-12T21:00:00Z") == {"Merits": 7}
+
+    def test_snapshot_interval_starts_new_segment(self, tmp_path):
+        live = {"systems": {}}
+        history = make_history(tmp_path, live, snapshot_interval=2)
+        history.snapshot("2026-10-12T20:00:00Z")
+        for minute in range(5):
+            live["systems"]["A"] = {"Merits": minute}
+            history.record(f"2026-10-12T21:0{minute}:00Z", "PowerplayMerits", {"systems": {"A": {"Merits": minute}}})
+        history.flush()
+
+        assert len(history.list_snapshots()) == 3
+        for minute in range(5):
+            assert history.system_at("A", f"2026-10-12T21:0{minute}:00Z") == {"Merits": minute}
+
+    def test_retention(self, tmp_path):
+        history = make_history(tmp_path, {"systems": {}}, max_snapshots=3)
+        for hour in range(10, 16):
+            history.snapshot(f"2026-10-12T{hour}:00:00Z")
+        seqs = [s["seq"] for s in history.list_snapshots()]
+        assert seqs == [4, 5, 6]
+        assert len(list(tmp_path.glob("snapshot-*.json.gz"))) == 3
+
+    def test_snapshot_timestamps_never_go_backwards(self, tmp_path):
+        history = make_history(tmp_path, {"systems": {}})
+        history.snapshot("2026-10-12T21:00:00Z")
+        history.snapshot("2026-10-12T20:00:00Z")
+        stamps = [s["timestamp"] for s in history.list_snapshots()]
+        assert stamps == sorted(stamps)
+
+    def test_changes_between(self, tmp_path):
+        history = make_history(tmp_path, {"systems": {}})
+        history.snapshot("2026-10-12T20:00:00Z")
+        history.record("2026-10-12T21:00:00Z", "FSDJump", {"systems": {"A": {}}})
+        history.record("2026-10-12T22:00:00Z", "FSDJump", {"systems": {"B": {}}})
+        records = history.changes_between("2026-10-12 20:30", "2026-10-12 21:30")
+        assert [r["event"] for r in records] == ["FSDJump"]
+        assert "A" in records[0]["changes"]["systems"]
+
+
+class TestHistoryCli:
+    """Test the history command line"""
+
+    def test_cli_at_system(self, tmp_path, capsys):
+        history = make_history(tmp_path, {"systems": {"Czerno": {"Merits": 3}}})
+        history.snapshot("2026-10-12T20:00:00Z")
+
+        assert main(["--dir", str(tmp_path), "--at", "2026-10-12 21:05", "--system", "Czerno"]) == 0
+        assert json.loads(capsys.readouterr().out) == {"Merits": 3}
+
+        assert main(["--dir", str(tmp_path), "--at", "2026-10-11"]) == 1
+        assert main(["--dir", str(tmp_path), "--list"]) == 0
+        assert "2026-10-12T20:00:00Z" in capsys.readouterr().out
+
+    def test_cli_runs_outside_edmc(self, tmp_path):
+        history = make_history(tmp_path / "history", {"systems": {"Czerno": {"Merits": 3}}})
+        history.snapshot("2026-10-12T20:00:00Z")
+
+        # A fresh interpreter has none of the test mocks, so EDMC's config module is missing
+        result = subprocess.run(
+            [sys.executable, "-m", "emt_core.history", "--data-dir", str(tmp_path),
+             "--at", "2026-10-12 21:05", "--system", "Czerno"],
+            cwd=PLUGIN_DIR, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {"Merits": 3}
+
+
+class TestJournalIntegration:
+    """Test journal_entry records history changes"""
+
+    def test_journal_entry_records_merits(self, tmp_path, sample_fortified_system):
+        import load
+        from emt_tests.benchmark import reset_plugin_state
+
+        reset_plugin_state()
+        history = StateHistory(history_dir=str(tmp_path))
+        original = load.state_history
+        load.state_history = history
+        try:
+            history.attach(load._capture_state)
+            history.snapshot("2026-01-02T19:00:00Z")
+            load.journal_entry("CMDR", False, None, None, sample_fortified_system, None)
+            load.journal_entry("CMDR", False, None, None, {
+                "timestamp": "2026-01-02T20:05:00Z", "event": "PowerplayMerits",
+                "Power": "Felicia Winters", "MeritsGained": 120, "TotalMerits": 1120}, None)
+        finally:
+            load.state_history = original
+            reset_plugin_state()
+
+        assert history.system_at("Czerno", "2026-01-02T20:00:00Z")["Merits"] == 0
+        assert history.system_at("Czerno", "2026-01-02T20:05:00Z")["Merits"] == 120
+        assert history.state_at("2026-01-02T20:05:00Z")["power"]["Merits"] == 1120
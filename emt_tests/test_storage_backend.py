@@ -0,0 +1,205 @@
+"""
+Test Suite for the SQLite Storage Backend (emt_core/storage.py)
+
+Covers row-level saves, JSON import/export migration and the model save/load
+paths running on either backend, plus save/load latency benchmarks.
+"""
+import json
+import pytest
+import emt_core.storage as storage
+import emt_models  # registers the data file schema versions
+from emt_core.schema import wrap, unwrap
+from emt_core.storage import (SQLiteStore, load_document, save_document, set_storage_backend,
+                              get_storage_backend, STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the storage module at a temporary data directory"""
+    monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+    yield tmp_path
+    storage.close_storage()
+    storage._sqlite_store = None
+    storage._backend = STORAGE_BACKEND_JSON
+
+
+def make_systems(count):
+    return {f"System {i}": {"StarSystem": f"System {i}", "Merits": i, "Active": False,
+                            "PowerplayState": "Fortified", "Powers": ["Felicia Winters"]}
+            for i in range(count)}
+
+
+BACKPACK = {"umbag": {"powerspyware": {"Sol": 3, "Achenar": 1}},
+            "reinfbag": {"powerinventory": {"Sol": 2}},
+            "acqbag": {}}
+
+SALVAGE = {"Sol": {"system_name": "Sol",
+                   "inventory": {"usscargoblackbox": {"name": "usscargoblackbox", "count": 2}}}}
+
+
+class TestSQLiteStore:
+    """Test row-level document storage"""
+
+    @pytest.mark.parametrize("filename,document", [
+        ("systems.json", make_systems(5)),
+        ("backpack.json", BACKPACK),
+        ("salvage.json", SALVAGE),
+    ])
+    def test_round_trip(self, tmp_path, filename, document):
+        store = SQLiteStore(str(tmp_path / "tracker.db"))
+        store.save_document(filename, document)
+        store.close()
+        assert SQLiteStore(str(tmp_path / "tracker.db")).load_document(filename) == document
+
+    def test_only_changed_rows_written(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "tracker.db"))
+        docs = make_systems(100)
+        assert store.save_document("systems.json", docs) == 100
+        assert store.save_document("systems.json", docs) == 0
+
+        docs["System 3"]["Merits"] = 999
+        del docs["System 4"]
+        assert store.save_document("systems.json", docs) == 2
+        assert store.load_document("systems.json") == docs
+
+    def test_backpack_item_removal(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "tracker.db"))
+        store.save_document("backpack.json", BACKPACK)
+        trimmed = {"umbag": {"powerspyware": {"Sol": 3}}, "reinfbag": {}, "acqbag": {}}
+        assert store.save_document("backpack.json", trimmed) == 2
+        assert store.load_document("backpack.json") == trimmed
+
+    def test_backup(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "tracker.db"))
+        store.save_document("salvage.json", SALVAGE)
+        assert store.backup()
+        assert SQLiteStore(str(tmp_path / "tracker.db.backup")).load_document("salvage.json") == SALVAGE
+
+
+    def test_saves_from_two_threads(self, tmp_path):
+        # The autosave timer and the main thread share one connection
+        import threading
+        store = SQLiteStore(str(tmp_path / "tracker.db"))
+        errors = []
+
+        def save_systems():
+            try:
+                for i in range(1, 201):
+                    store.save_document("systems.json", make_systems(i % 20 + 1))
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=save_systems)
+        worker.start()
+        for i in range(200):
+            salvage = {f"System {n}": {"system_name": f"System {n}", "inventory": {
+                "usscargoblackbox": {"name": "usscargoblackbox", "count": i + n}}} for n in range(20)}
+            store.save_document("salvage.json", salvage)
+        worker.join()
+        store.close()
+
+        assert errors == []
+        reopened = SQLiteStore(str(tmp_path / "tracker.db"))
+        assert reopened.load_document("systems.json") == make_systems(200 % 20 + 1)
+        assert reopened.load_document("salvage.json") == salvage
+
+
+class TestBackendMigration:
+    """Test switching backends imports and exports the JSON files"""
+
+    def test_switch_to_sqlite_imports_json(self, data_dir):
+        (data_dir / "systems.json").write_text(json.dumps(wrap("systems.json", make_systems(3))))
+        (data_dir / "backpack.json").write_text(json.dumps(wrap("backpack.json", BACKPACK)))
+
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        assert get_storage_backend() == STORAGE_BACKEND_SQLITE
+        assert load_document("systems.json") == make_systems(3)
+        assert load_document("backpack.json") == BACKPACK
+        assert load_document("salvage.json") == {}
+
+    def test_import_happens_once(self, data_dir):
+        (data_dir / "systems.json").write_text(json.dumps(make_systems(3)))
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        save_document("systems.json", make_systems(1))
+
+        (data_dir / "systems.json").write_text(json.dumps(make_systems(5)))
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        assert load_document("systems.json") == make_systems(1)
+
+    def test_switch_back_exports_json(self, data_dir):
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        save_document("salvage.json", SALVAGE)
+        assert not (data_dir / "salvage.json").exists()
+
+        set_storage_backend(STORAGE_BACKEND_JSON)
+        assert json.loads((data_dir / "salvage.json").read_text()) == wrap("salvage.json", SALVAGE)
+        assert not (data_dir / "tracker.db").exists()
+        assert (data_dir / "tracker.db.old").exists()
+
+    def test_other_documents_stay_json(self, data_dir):
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        save_document("power.json", {"Power": "Felicia Winters"})
+        assert unwrap(json.loads((data_dir / "power.json").read_text()))[1] == {"Power": "Felicia Winters"}
+
+
+class TestModelPersistence:
+    """Test model save/load functions on the SQLite backend"""
+
+    def test_systems_backpack_salvage(self, data_dir, sample_fortified_system):
+        from emt_models.system import StarSystem, systems, dumpSystems, loadSystems
+        from emt_models.backpack import playerBackpack, save_backpack, load_backpack
+        from emt_models.salvage import salvageInventory, save_salvage, load_salvage, Salvage
+
+        set_storage_backend(STORAGE_BACKEND_SQLITE)
+        saved_systems = dict(systems)
+        saved_salvage = dict(salvageInventory)
+        try:
+            systems.clear()
+            system = StarSystem(sample_fortified_system)
+            system.Merits = 120
+            systems["Czerno"] = system
+            playerBackpack.umbag.clear()
+            playerBackpack.umbag.add_item("powerspyware", 4, "Czerno")
+            salvageInventory.clear()
+            salvageInventory["Czerno"] = Salvage("Czerno")
+            salvageInventory["Czerno"].add_cargo("usscargoblackbox", 2)
+            cargo_count = salvageInventory["Czerno"].inventory["usscargoblackbox"].count
+
+            dumpSystems()
+            save_backpack()
+            save_salvage()
+
+            systems.clear()
+            playerBackpack.umbag.clear()
+            salvageInventory.clear()
+            loadSystems()
+            load_backpack()
+            load_salvage()
+
+            assert systems["Czerno"].Merits == 120
+            assert systems["Czerno"].PowerplayState == system.PowerplayState
+            assert playerBackpack.umbag.items["powerspyware"] == {"Czerno": 4}
+            assert salvageInventory["Czerno"].inventory["usscargoblackbox"].count == cargo_count
+        finally:
+            systems.clear()
+            systems.update(saved_systems)
+            salvageInventory.clear()
+            salvageInventory.update(saved_salvage)
+            playerBackpack.umbag.clear()
+
+
+@pytest.mark.performance
+class TestStorageBenchmark:
+    """Save/load latency of JSON files versus SQLite rows"""
+
+    @pytest.mark.parametrize("count", [10_000, pytest.param(50_000, marks=pytest.mark.slow)])
+    def test_save_load_latency(self, data_dir, count):
+        from emt_tests.benchmark import run_storage_benchmark, format_results
+
+        results = run_storage_benchmark(count)
+        print(format_results(f"systems.json save/load ({count:,} systems)", results))
+
+        assert results["systems"] == count
+        # A single changed system must rewrite far less than the whole JSON file
+        assert results["sqlite_save_one_ms"] < results["json_save_ms"]
@@ -0,0 +1,147 @@
+"""
+Test Suite for save_json Durability Modes and Group Commit (emt_core/storage.py)
+"""
+import json
+import pytest
+import emt_core.storage as storage
+from emt_core.storage import (save_json, load_json, group_commit, set_durability, get_durability,
+                              get_save_stats, reset_save_stats,
+                              DURABILITY_NONE, DURABILITY_FSYNC_FILE, DURABILITY_FSYNC_DIR)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the storage module at a temporary data directory and count fsyncs"""
+    monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+    previous = get_durability()
+    reset_save_stats()
+    yield tmp_path
+    set_durability(previous)
+    reset_save_stats()
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    calls = []
+    real_fsync = storage.os.fsync
+    monkeypatch.setattr(storage.os, "fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+    dir_calls = []
+    real_dir = storage._fsync_dir
+    monkeypatch.setattr(storage, "_fsync_dir", lambda path: dir_calls.append(path) or real_dir(path))
+    return calls, dir_calls
+
+
+class TestDurabilityModes:
+    """Test fsync behaviour of each mode"""
+
+    @pytest.mark.parametrize("mode,file_syncs,dir_syncs", [
+        (DURABILITY_NONE, 0, 0),
+        (DURABILITY_FSYNC_FILE, 1, 0),
+        (DURABILITY_FSYNC_DIR, 1, 1),
+    ])
+    def test_single_save(self, data_dir, fsyncs, mode, file_syncs, dir_syncs):
+        set_durability(mode)
+        assert save_json("power.json", {"Power": "Felicia Winters"})
+        assert load_json("power.json") == {"Power": "Felicia Winters"}
+        assert len(fsyncs[1]) == dir_syncs
+        assert len(fsyncs[0]) - (dir_syncs if storage.os.name != "nt" else 0) == file_syncs
+
+    def test_unknown_mode_falls_back(self, data_dir):
+        set_durability("paranoid")
+        assert get_durability() == DURABILITY_FSYNC_FILE
+
+    def test_stats_per_mode(self, data_dir):
+        set_durability(DURABILITY_NONE)
+        save_json("a.json", {})
+        set_durability(DURABILITY_FSYNC_FILE)
+        save_json("a.json", {})
+        save_json("b.json", {})
+        stats = get_save_stats()
+        assert stats[DURABILITY_NONE]["saves"] == 1
+        assert stats[DURABILITY_NONE]["fsync_ms"] == 0
+        assert stats[DURABILITY_FSYNC_FILE]["saves"] == 2
+        assert stats[DURABILITY_FSYNC_FILE]["total_ms"] >= stats[DURABILITY_FSYNC_FILE]["max_ms"] > 0
+
+
+class TestGroupCommit:
+    """Test saves inside a group share one barrier"""
+
+    def test_renames_deferred_until_exit(self, data_dir):
+        set_durability(DURABILITY_FSYNC_FILE)
+        save_json("systems.json", {"old": True})
+        with group_commit():
+            save_json("systems.json", {"new": True})
+            save_json("backpack.json", {"umbag": {}})
+            assert json.loads((data_dir / "systems.json").read_text()) == {"old": True}
+            assert not (data_dir / "backpack.json").exists()
+        assert load_json("systems.json") == {"new": True}
+        assert load_json("backpack.json") == {"umbag": {}}
+        assert list(data_dir.glob("*.tmp")) == []
+
+    def test_one_directory_barrier(self, data_dir, fsyncs):
+        set_durability(DURABILITY_FSYNC_DIR)
+        with group_commit():
+            for name in ("a.json", "b.json", "c.json"):
+                save_json(name, {})
+        assert len(fsyncs[1]) == 1
+        stats = get_save_stats()[DURABILITY_FSYNC_DIR]
+        assert stats["saves"] == 3 and stats["groups"] == 1
+
+    def test_nested_groups_commit_once(self, data_dir):
+        with group_commit():
+            with group_commit():
+                save_json("a.json", {"x": 1})
+            assert not (data_dir / "a.json").exists()
+        assert load_json("a.json") == {"x": 1}
+
+    def test_same_file_twice_in_one_group(self, data_dir, monkeypatch):
+        groups = []
+        real_commit = storage._commit_group
+        monkeypatch.setattr(storage, "_commit_group", lambda pending: groups.append(len(pending)) or real_commit(pending))
+        with group_commit():
+            save_json("a.json", {"x": 1})
+            save_json("a.json", {"x": 2})
+        assert groups == [1]
+        assert load_json("a.json") == {"x": 2}
+        assert list(data_dir.glob("*.tmp")) == []
+
+    def test_group_belongs_to_its_thread(self, data_dir, monkeypatch):
+        import threading
+        groups = []
+        real_commit = storage._commit_group
+        monkeypatch.setattr(storage, "_commit_group", lambda pending: groups.append(len(pending)) or real_commit(pending))
+
+        with group_commit():
+            save_json("systems.json", {"main": True})
+            # An autosave on another thread saves straight away, outside this group
+            autosave = threading.Thread(target=save_json, args=("power.json", {"timer": True}))
+            autosave.start()
+            autosave.join()
+            assert load_json("power.json") == {"timer": True}
+            assert not (data_dir / "systems.json").exists()
+        assert groups == [1]
+        assert load_json("systems.json") == {"main": True}
+
+    def test_update_json_file_uses_group(self, data_dir, monkeypatch):
+        import load
+        groups = []
+        real_commit = storage._commit_group
+        monkeypatch.setattr(storage, "_commit_group", lambda pending: groups.append(len(pending)) or real_commit(pending))
+        load.update_json_file()
+        assert groups == [6]  # power, systems, salvage, backpack, expiry, reconciliation
+
+
+@pytest.mark.performance
+class TestDurabilityBenchmark:
+    """Save cost of each durability mode, separate versus grouped"""
+
+    def test_durability_timings(self, data_dir):
+        from emt_tests.benchmark import run_durability_benchmark, format_results
+
+        results = run_durability_benchmark(rounds=5, system_count=1_000)
+        print(format_results("update_json_file save cost per mode", results))
+
+        for mode in (DURABILITY_NONE, DURABILITY_FSYNC_FILE, DURABILITY_FSYNC_DIR):
+            assert results[f"{mode}_ms"] > 0
+            assert results[f"{mode}_group_ms"] > 0
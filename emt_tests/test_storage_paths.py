@@ -0,0 +1,73 @@
+"""
+Test Suite for Path Resolution and One-shot Legacy Migration (emt_core/storage.py)
+"""
+import json
+import os
+import pytest
+import emt_core.storage as storage
+from emt_core.storage import run_legacy_migration, save_json, LEGACY_MARKER
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    """Point the real get_data_dir at a temporary plugin directory"""
+    monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(storage, "_data_dirs", {})
+    return tmp_path
+
+
+class TestLegacyMigration:
+    """Test legacy data files are moved and cleanup runs exactly once"""
+
+    def test_moves_files_and_writes_marker(self, plugin_dir):
+        (plugin_dir / "systems.json").write_text(json.dumps({"Sol": {}}))
+        calls = []
+
+        assert run_legacy_migration(cleanup=lambda: calls.append(1))
+        assert not (plugin_dir / "systems.json").exists()
+        assert json.loads((plugin_dir / "data" / "systems.json").read_text()) == {"Sol": {}}
+        assert json.loads((plugin_dir / "data" / LEGACY_MARKER).read_text())["version"] == 1
+        assert calls == [1]
+
+    def test_runs_once(self, plugin_dir):
+        calls = []
+        run_legacy_migration(cleanup=lambda: calls.append(1))
+        (plugin_dir / "power.json").write_text("{}")
+
+        assert not run_legacy_migration(cleanup=lambda: calls.append(1))
+        assert calls == [1]
+        assert (plugin_dir / "power.json").exists()
+
+    def test_existing_data_file_is_kept(self, plugin_dir):
+        (plugin_dir / "data").mkdir()
+        (plugin_dir / "data" / "power.json").write_text('{"Power": "new"}')
+        (plugin_dir / "power.json").write_text('{"Power": "old"}')
+
+        run_legacy_migration()
+        assert json.loads((plugin_dir / "data" / "power.json").read_text()) == {"Power": "new"}
+
+    def test_newer_migration_version_reruns(self, plugin_dir, monkeypatch):
+        run_legacy_migration()
+        monkeypatch.setattr(storage, "LEGACY_MIGRATION_VERSION", 2)
+        assert run_legacy_migration()
+
+
+class TestPathResolution:
+    """Test the steady-state save path makes no filesystem metadata calls"""
+
+    def test_data_dir_created_once(self, plugin_dir, monkeypatch):
+        data_dir = storage.get_data_dir()
+        assert os.path.isdir(data_dir)
+
+        monkeypatch.setattr(os, "makedirs", lambda *a, **k: pytest.fail("makedirs called again"))
+        assert storage.get_data_dir() == data_dir
+
+    def test_save_makes_no_stat_calls(self, plugin_dir, monkeypatch):
+        storage.get_data_dir()
+        calls = []
+        real_exists = os.path.exists
+        monkeypatch.setattr(os.path, "exists", lambda path: calls.append(path) or real_exists(path))
+
+        for merits in range(3):
+            assert save_json("power.json", {"Merits": merits})
+        assert calls == []
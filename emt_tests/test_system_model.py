@@ -746,6 +746,14 @@ class TestSystemEdgeCases:
 class TestFileIOFunctions:
     """Test file I/O functions for system storage"""
 
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path, monkeypatch):
+        """Save systems.json and its backups under tmp_path, not the plugin's data/"""
+        import emt_core.storage as storage
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+        return tmp_path
+
     def test_dump_and_load_systems(self):
         """Test dumpSystems and loadSystems functions"""
         from emt_models.system import systems, dumpSystems, loadSystems, StarSystem
@@ -879,3 +887,83 @@ class TestSystemEncoder:
         # and it can't serialize CustomObject
         with pytest.raises(TypeError):
             json.dumps(obj, cls=SystemEncoder)
+
+
+class TestSlots:
+    """Test the slotted models keep their JSON shape"""
+
+    def test_no_instance_dict(self, sample_fsdjump_event):
+        """Test models carry no per-instance __dict__"""
+        from emt_models.power import PledgedPower
+        from emt_models.salvage import Salvage
+        from emt_models.ppcargo import Cargo
+
+        system = StarSystem(sample_fsdjump_event, "TestCMDR")
+        for obj in (system, system.PowerplayConflictProgress[0], PledgedPower(), Salvage("Sol"), Cargo("x")):
+            assert not hasattr(obj, "__dict__")
+
+    def test_encoder_matches_to_dict(self, sample_multi_power_acquisition):
+        """Test SystemEncoder writes the same fields as to_dict"""
+        import json
+        from emt_models.system import SystemEncoder
+
+        system = StarSystem(sample_multi_power_acquisition, "TestCMDR")
+        assert json.loads(json.dumps(system, cls=SystemEncoder)) == json.loads(json.dumps(system.to_dict()))
+
+    def test_power_encoder_fields(self):
+        """Test PowerEncoder writes every power.json field"""
+        import json
+        from emt_models.power import PledgedPower, PowerEncoder
+
+        power = PledgedPower({"Power": "Felicia Winters", "Merits": 10, "Rank": "5"}, "CMDR")
+        data = json.loads(json.dumps(power, cls=PowerEncoder))
+        assert data == {"Power": "Felicia Winters", "Commander": "CMDR", "Merits": 10, "MeritsSession": 0,
+                        "Rank": "5", "TimePledged": 0, "TimePledgedStr": "0y 0d 0h"}
+
+
+@pytest.mark.performance
+class TestMemoryBenchmark:
+    """tracemalloc memory of slotted versus __dict__-based StarSystem objects"""
+
+    @pytest.mark.parametrize("count", [10_000, pytest.param(100_000, marks=pytest.mark.slow)])
+    def test_slots_memory(self, count):
+        from emt_tests.benchmark import run_memory_benchmark, format_results
+
+        results = run_memory_benchmark(count)
+        print(format_results(f"StarSystem memory ({count:,} systems)", results))
+
+        assert results["systems"] == count
+        assert results["slots_mb"] < results["dict_mb"]
+
+
+class TestDerivedValueCache:
+    """Test derived getters are cached and invalidated on updates"""
+
+    def test_repeated_calls_use_cache(self, sample_fsdjump_event):
+        """Test a second call returns the cached value"""
+        system = StarSystem(sample_fsdjump_event, "TestCMDR")
+        state = system.getSystemStateText()
+        system.PowerplayState = "Fortified"  # bypasses invalidation on purpose
+        assert system.getSystemStateText() == state
+
+    def test_update_invalidates(self, sample_fsdjump_event, sample_fortified_system):
+        """Test updateSystem and from_dict refresh the cached values"""
+        system = StarSystem(sample_fsdjump_event, "TestCMDR")
+        assert system.getSystemStatusShort() != "Fort"
+
+        system.updateSystem(sample_fortified_system)
+        assert system.getSystemStatusShort() == "Fort"
+        assert system.getSystemProgressNumber() == StarSystem(sample_fortified_system).getSystemProgressNumber()
+
+        system.from_dict(StarSystem(sample_fsdjump_event).to_dict())
+        assert system.getSystemStateText() == StarSystem(sample_fsdjump_event).getSystemStateText()
+
+    def test_merit_mutators_invalidate(self, sample_fsdjump_event):
+        """Test addMerits and setReported drop the cache"""
+        system = StarSystem(sample_fsdjump_event, "TestCMDR")
+        system.getSystemStateText()
+        system.addMerits(10)
+        assert system._cache is None
+        system.getSystemStateText()
+        system.setReported(True)
+        assert system._cache is None
@@ -0,0 +1,234 @@
+"""
+Test Suite for the Bounded Systems Registry (emt_models/registry.py)
+"""
+import json
+import pytest
+import emt_core.storage as storage
+from emt_models.system import StarSystem, _system_from_dict, _system_evictable
+from emt_models.registry import SystemRegistry
+
+
+def make_registry(tmp_path, max_resident=3):
+    registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+    registry.configure(max_resident=max_resident, spill_dir=str(tmp_path))
+    return registry
+
+
+def make_system(name, merits=0, active=False):
+    system = StarSystem({"StarSystem": name, "PowerplayState": "Fortified", "ControllingPower": "Felicia Winters",
+                         "Powers": ["Felicia Winters"], "PowerplayStateControlProgress": 0.5})
+    system.Merits = merits
+    system.Active = active
+    return system
+
+
+class TestSystemRegistry:
+    """Test LRU eviction and transparent reload"""
+
+    def test_unbounded_behaves_like_dict(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=None)
+        for i in range(10):
+            registry[f"S{i}"] = make_system(f"S{i}")
+        assert len(registry) == 10
+        assert registry.resident_count == 10
+        assert registry.evictions == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        registry = make_registry(tmp_path)
+        for name in ("A", "B", "C"):
+            registry[name] = make_system(name)
+        registry["A"]  # A becomes most recently used
+        registry["D"] = make_system("D")
+
+        assert registry.resident_count == 3
+        assert registry.spilled_count == 1
+        assert "B" in registry
+        assert set(registry) == {"A", "B", "C", "D"}
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_reload_on_access(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=1)
+        registry["A"] = make_system("A")
+        registry["B"] = make_system("B")
+
+        reloaded = registry["A"]
+        assert reloaded.StarSystem == "A"
+        assert reloaded.PowerplayState == "Fortified"
+        assert registry.reloads == 1
+        assert registry.stats()["reload_max_ms"] > 0
+        assert "B" in registry and registry.resident_count == 1
+
+    def test_merits_and_active_never_evicted(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=1)
+        registry["A"] = make_system("A", merits=10)
+        registry["B"] = make_system("B", active=True)
+        registry["C"] = make_system("C")
+
+        assert registry.spilled_count == 0
+        assert registry.resident_count == 3
+
+    def test_items_keep_the_cap(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=2)
+        for name in ("A", "B", "C", "D"):
+            registry[name] = make_system(name)
+
+        for name, system in registry.items():
+            assert registry.resident_count <= 3  # the cap plus the system being walked
+            system.PowerplayStateReinforcement = ord(name)
+        assert registry.resident_count == 2 and registry.spilled_count == 2
+        assert sorted(s.StarSystem for s in registry.values()) == ["A", "B", "C", "D"]
+        assert registry.resident_count == 2
+
+        # Changes made through items() survive being spilled and reloaded
+        assert {name: registry[name].PowerplayStateReinforcement for name in "ABCD"} == \
+            {name: ord(name) for name in "ABCD"}
+
+    def test_lookups_during_items_keep_the_current_system(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=2)
+        for name in ("A", "B", "C", "D"):
+            registry[name] = make_system(name)
+
+        for name, system in registry.items():
+            if name == "C":
+                registry["A"], registry["B"]  # would spill C, the least recently used
+                assert registry.owns("C", system)
+                system.PowerplayStateReinforcement = 99
+        assert registry.resident_count == 2
+        assert registry["C"].PowerplayStateReinforcement == 99
+
+    def test_unevictable_systems_move_out_of_the_scan(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=2)
+        registry["A"] = make_system("A", merits=10)
+        registry["B"] = make_system("B", active=True)
+        registry["C"] = make_system("C")
+        registry["D"] = make_system("D")
+
+        assert list(registry._resident) == ["D", "A", "B"]
+        assert registry.spilled_count == 1
+
+    def test_items_materialise_lazy_entries_under_the_cap(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=2)
+        registry.load_raw({name: make_system(name).to_dict() for name in ("A", "B", "C", "D", "E")})
+        assert sorted(name for name, _ in registry.items()) == ["A", "B", "C", "D", "E"]
+        assert registry.resident_count == 2
+        assert registry.lazy_count == 0 and registry.spilled_count == 3
+
+    def test_delete_and_clear_remove_spill_files(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=1)
+        for name in ("A", "B", "C"):
+            registry[name] = make_system(name)
+        del registry["A"]
+        assert "A" not in registry
+        registry.clear()
+        assert len(registry) == 0
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_overwrite_spilled_entry(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=1)
+        registry["A"] = make_system("A")
+        registry["B"] = make_system("B")
+        registry["A"] = make_system("A", merits=5)
+        assert registry["A"].Merits == 5
+        assert len(registry) == 2
+
+    def test_stats(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=1)
+        registry["A"] = make_system("A")
+        registry["B"] = make_system("B")
+        assert registry.stats() == {"resident": 1, "spilled": 1, "lazy": 0, "materialized": 0,
+                                    "evictions": 1, "reloads": 0, "reload_avg_ms": 0.0, "reload_max_ms": 0.0}
+
+
+class TestLazyLoading:
+    """Test parsed dicts are only materialised on access"""
+
+    def make_lazy(self, tmp_path):
+        registry = make_registry(tmp_path, max_resident=None)
+        registry.load_raw({name: make_system(name, merits=5, active=(name == "B")).to_dict()
+                           for name in ("A", "B", "C")})
+        return registry
+
+    def test_access_materialises_once(self, tmp_path):
+        registry = self.make_lazy(tmp_path)
+        assert len(registry) == 3 and "A" in registry
+        assert registry.lazy_count == 3
+
+        system = registry["A"]
+        assert isinstance(system, StarSystem) and system.Merits == 5
+        assert registry["A"] is system
+        assert registry.materialized == 1
+        assert registry.lazy_count == 2
+
+    def test_select_and_serialize_stay_lazy(self, tmp_path):
+        registry = self.make_lazy(tmp_path)
+        active = registry.select(lambda s: s.Active, lambda d: d.get("Active"))
+        assert [name for name, _ in active] == ["B"]
+        assert dict(registry.serialized_items())["C"]["Merits"] == 5
+        assert registry.materialized == 1
+
+    def test_overwrite_and_delete_lazy_entry(self, tmp_path):
+        registry = self.make_lazy(tmp_path)
+        registry["A"] = make_system("A", merits=9)
+        del registry["C"]
+        assert registry["A"].Merits == 9
+        assert set(registry) == {"A", "B"}
+        assert registry.materialized == 0
+
+    def test_load_and_dump_systems(self, tmp_path, monkeypatch):
+        from emt_models.system import systems, loadSystems, dumpSystems, active_systems
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+        saved = {name: make_system(name, merits=5, active=(name == "B")).to_dict() for name in ("A", "B")}
+        (tmp_path / "systems.json").write_text(json.dumps({"_schema": 2, "data": saved}))
+
+        previous = dict(systems)
+        try:
+            systems.clear()
+            loadSystems()
+            assert [s.StarSystem for s in active_systems()] == ["B"]
+            assert systems.lazy_count == 1
+            dumpSystems()
+            assert json.loads((tmp_path / "systems.json").read_text())["data"]["A"] == saved["A"]
+        finally:
+            systems.clear()
+            systems.update(previous)
+
+    def test_peek_systems_loads_nothing(self, tmp_path, monkeypatch):
+        from emt_models.system import systems, peek_systems
+
+        monkeypatch.setattr(systems, "max_resident", 1)
+        monkeypatch.setattr(systems, "_spill_dir", str(tmp_path))
+        previous = dict(systems)
+        try:
+            systems.clear()
+            systems["A"] = make_system("A")
+            systems["B"] = make_system("B")
+            systems.load_raw({"C": make_system("C", merits=5).to_dict()})
+            reloads = systems.reloads
+
+            walked = {name: system.StarSystem for name, system in peek_systems()}
+            assert walked == {"A": "A", "B": "B", "C": "C"}
+            assert (systems.resident_count, systems.spilled_count, systems.lazy_count) == (1, 1, 1)
+            assert systems.reloads == reloads
+        finally:
+            systems.clear()
+            systems.max_resident = None
+            systems.update(previous)
+
+
+@pytest.mark.performance
+class TestStartupBenchmark:
+    """systems.json load time: eager StarSystem builds versus lazy dicts"""
+
+    @pytest.mark.parametrize("count", [10_000, pytest.param(50_000, marks=pytest.mark.slow)])
+    def test_lazy_startup(self, tmp_path, monkeypatch, count):
+        from emt_tests.benchmark import run_startup_benchmark, format_results
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        monkeypatch.setattr(storage, "get_plugin_dir", lambda: str(tmp_path))
+        results = run_startup_benchmark(count)
+        print(format_results(f"loadSystems startup ({count:,} systems)", results))
+
+        assert results["systems"] == count
+        assert results["lazy_ms"] < results["eager_ms"]
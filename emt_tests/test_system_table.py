@@ -0,0 +1,280 @@
+"""
+Test Suite for the Columnar System Table (emt_models/table.py)
+"""
+import pytest
+from emt_models.system import StarSystem, _system_from_dict, _system_evictable
+from emt_models.registry import SystemRegistry
+from emt_models.table import SystemTable
+import emt_models.table as table_module
+
+
+def make_system(name, state="Fortified", power="Felicia Winters", merits=0, reinforcement=0):
+    system = StarSystem({"StarSystem": name, "PowerplayState": state, "ControllingPower": power,
+                         "Powers": [power], "PowerplayStateControlProgress": 0.5,
+                         "PowerplayStateReinforcement": reinforcement})
+    system.Merits = merits
+    return system
+
+
+@pytest.fixture(params=["python", "numpy"])
+def make_table(request, tmp_path):
+    """Build a registry plus table, once per query backend"""
+    if request.param == "numpy" and table_module.np is None:
+        pytest.skip("NumPy not installed")
+
+    def build(systems_list, max_resident=None):
+        registry = SystemRegistry(_system_from_dict, StarSystem.to_dict, _system_evictable)
+        registry.configure(max_resident=max_resident, spill_dir=str(tmp_path))
+        table = SystemTable(registry, use_numpy=request.param == "numpy")
+        for system in systems_list:
+            registry[system.StarSystem] = system
+        return registry, table
+    return build
+
+
+SYSTEMS = [
+    ("A", "Fortified", "Felicia Winters", 10, 300),
+    ("B", "Stronghold", "Zemina Torval", 0, 100),
+    ("C", "Fortified", "Zemina Torval", 5, 200),
+    ("D", "Exploited", "Felicia Winters", 5, 0),
+]
+
+
+class TestSystemTable:
+    """Test sort, filter and group-by over the columns"""
+
+    def build(self, make_table, **kwargs):
+        return make_table([make_system(n, s, p, m, r) for n, s, p, m, r in SYSTEMS], **kwargs)
+
+    def test_columns(self, make_table):
+        _, table = self.build(make_table)
+        assert len(table) == 4
+        assert table.column("merits") == [10, 0, 5, 5]
+        assert table.column("state") == ["Fortified", "Stronghold", "Fortified", "Exploited"]
+        assert table.categories("power") == ["Felicia Winters", "Zemina Torval"]
+
+    def test_sort(self, make_table):
+        _, table = self.build(make_table)
+        assert table.sort("reinforcement") == ["D", "B", "C", "A"]
+        # Ties keep row order in both directions
+        assert table.sort("merits", reverse=True) == ["A", "C", "D", "B"]
+        assert table.sort("state") == ["D", "A", "C", "B"]
+        assert table.sort("merits", names=table.filter(power="Zemina Torval")) == ["B", "C"]
+
+    def test_filter(self, make_table):
+        _, table = self.build(make_table)
+        assert table.filter(state="Fortified") == ["A", "C"]
+        assert table.filter(power="Zemina Torval", min_merits=1) == ["C"]
+        assert table.filter(state="Unknown") == []
+        assert table.filter() == ["A", "B", "C", "D"]
+
+    def test_group_by(self, make_table):
+        _, table = self.build(make_table)
+        assert table.group_by("power", "merits") == {"Felicia Winters": 15, "Zemina Torval": 5}
+        assert table.group_by("state", "merits", agg="count") == {"Fortified": 2, "Stronghold": 1, "Exploited": 1}
+        assert table.group_by("power", "reinforcement", agg="max") == {"Felicia Winters": 300, "Zemina Torval": 200}
+        with pytest.raises(ValueError):
+            table.group_by("power", "merits", agg="median")
+
+    def test_tracks_registry_changes(self, make_table):
+        registry, table = self.build(make_table)
+        assert len(table) == 4
+
+        del registry["A"]
+        registry["E"] = make_system("E", "Stronghold", "Aisling Duval", 7)
+        assert sorted(table.names()) == ["B", "C", "D", "E"]
+        assert table.filter(power="Aisling Duval") == ["E"]
+
+        registry.clear()
+        assert len(table) == 0
+
+    def test_spilled_and_lazy_rows_not_materialised(self, make_table):
+        registry, table = self.build(make_table, max_resident=1)
+        registry.load_raw({"L": make_system("L", merits=3).to_dict()})
+        assert registry.spilled_count > 0
+
+        assert sorted(table.names()) == ["A", "B", "C", "D", "L"]
+        assert registry.reloads == 0 and registry.materialized == 0
+
+
+class TestIndexes:
+    """Test the inverted indexes and name trie behind filter() and search()"""
+
+    def test_filter_by_prefix(self, make_table):
+        registry, table = make_table([make_system(n, s, p) for n, s, p, _, _ in SYSTEMS] +
+                                     [make_system("Alpha Centauri", "Stronghold", "Zemina Torval")])
+        assert table.search("a") == ["A", "Alpha Centauri"]
+        assert table.search("", limit=2) == ["A", "Alpha Centauri"]
+        assert table.filter(prefix="a") == ["A", "Alpha Centauri"]
+        assert table.filter(prefix="A", power="Zemina Torval") == ["Alpha Centauri"]
+        assert table.filter(prefix="b", state="Fortified") == []
+
+    def test_indexes_follow_changes(self, make_table):
+        registry, table = make_table([make_system(n, s, p) for n, s, p, _, _ in SYSTEMS])
+        assert table.members("power", "Zemina Torval") == {"B", "C"}
+
+        registry["B"].ControllingPower = "Aisling Duval"
+        registry.notify("B")
+        del registry["C"]
+        assert table.members("power", "Zemina Torval") == set()
+        assert table.filter(power="Aisling Duval") == ["B"]
+        assert table.categories("power") == ["Aisling Duval", "Felicia Winters"]
+        assert table.search("c") == []
+
+        registry.clear()
+        assert table.search("") == [] and table.members("state", "Fortified") == set()
+
+    def test_matches_scan(self, make_table):
+        import random
+        rng = random.Random(0)
+        states = ["Fortified", "Stronghold", "Exploited"]
+        powers = ["Felicia Winters", "Zemina Torval", "Aisling Duval"]
+        registry, table = make_table([make_system(f"S{i}", rng.choice(states), rng.choice(powers), rng.randint(0, 3))
+                                      for i in range(300)])
+        for i in rng.sample(range(300), 50):
+            registry[f"S{i}"].PowerplayState = rng.choice(states)
+            registry.notify(f"S{i}")
+        for state in states:
+            for power in powers:
+                expected = [name for name, s in registry.items()
+                            if s.PowerplayState == state and s.ControllingPower == power and s.Merits >= 1]
+                assert table.filter(state=state, power=power, min_merits=1) == expected
+                assert table.filter(state=state, power=power, prefix="s1") == [
+                    name for name, s in registry.items()
+                    if s.PowerplayState == state and s.ControllingPower == power and name.startswith("S1")]
+
+
+class TestModelSync:
+    """Test StarSystem mutators keep the global table in sync"""
+
+    def test_mutators_update_rows(self, sample_fortified_system):
+        from emt_models.system import systems
+        from emt_models.table import system_table
+
+        previous = dict(systems)
+        try:
+            systems.clear()
+            system = StarSystem(sample_fortified_system)
+            systems[system.StarSystem] = system
+            assert system_table.column("merits") == [0]
+
+            system.addMerits(40)
+            assert system_table.column("merits") == [40]
+            system.setMerits(0)
+            assert system_table.column("merits") == [0]
+        finally:
+            systems.clear()
+            systems.update(previous)
+
+    def test_update_notifies_after_the_change(self, sample_fortified_system):
+        from emt_models.system import systems
+
+        previous = dict(systems)
+        seen = []
+        listener = lambda name: seen.append((name, systems.peek(name).PowerplayStateReinforcement))
+        try:
+            systems.clear()
+            system = StarSystem(sample_fortified_system)
+            systems[system.StarSystem] = system
+            systems.add_listener(listener)
+
+            system.updateSystem(dict(sample_fortified_system, PowerplayStateReinforcement=4321))
+            assert seen == [("Czerno", 4321)]
+        finally:
+            systems._listeners.remove(listener)
+            systems.clear()
+            systems.update(previous)
+
+    def test_untracked_copies_stay_silent(self, sample_fortified_system):
+        from emt_models.system import systems, _system_from_dict
+
+        previous = dict(systems)
+        seen = []
+        try:
+            systems.clear()
+            systems["Czerno"] = StarSystem(sample_fortified_system)
+            systems.add_listener(seen.append)
+
+            copy = StarSystem(sample_fortified_system)
+            copy.addMerits(10)
+            _system_from_dict(copy.to_dict()).setMerits(0)
+            assert seen == []
+            assert systems["Czerno"].Merits == 0
+        finally:
+            systems._listeners.remove(seen.append)
+            systems.clear()
+            systems.update(previous)
+
+    def test_journal_merits_update_rows(self, sample_fortified_system, tmp_path, monkeypatch):
+        import load
+        import emt_core.storage as storage
+        from emt_models.table import system_table
+        from emt_tests.benchmark import reset_plugin_state
+
+        monkeypatch.setattr(storage, "get_data_dir", lambda: str(tmp_path))
+        reset_plugin_state()
+        try:
+            load.journal_entry("Cmdr", False, None, None, dict(sample_fortified_system), {})
+            load.journal_entry("Cmdr", False, None, None, {
+                "timestamp": "2026-01-02T20:05:00Z", "event": "PowerplayMerits",
+                "Power": "Felicia Winters", "MeritsGained": 50, "TotalMerits": 1050}, {})
+            assert system_table.filter(min_merits=10) == ["Czerno"]
+
+            load._add_merits_to_system("Czerno", 5)
+            assert system_table.column("merits") == [55]
+        finally:
+            reset_plugin_state()
+
+    def test_default_view_follows_merits(self, sample_fortified_system, monkeypatch):
+        from emt_models.system import systems
+        from emt_ui import details
+
+        monkeypatch.setattr(details, "add_default_row", lambda name, content, row_index: [])
+        monkeypatch.setattr(details, "update_default_empty_state", lambda: None)
+        monkeypatch.setattr(details, "default_rows", {})
+        previous = dict(systems)
+        try:
+            systems.clear()
+            system = StarSystem(sample_fortified_system)
+            systems[system.StarSystem] = system
+            details.refresh_default_rows()
+            assert details.default_rows == {}
+
+            system.addMerits(25)
+            details.refresh_default_rows()
+            assert details.default_rows["Czerno"][0][0] == 25
+            system.setMerits(0)
+            details.refresh_default_rows()
+            assert details.default_rows == {}
+        finally:
+            systems.clear()
+            systems.update(previous)
+
+
+@pytest.mark.performance
+class TestTableBenchmark:
+    """Filter + sort over the columns versus a Python loop over StarSystem objects"""
+
+    @pytest.mark.parametrize("count", [20_000, pytest.param(100_000, marks=pytest.mark.slow)])
+    def test_table_queries(self, count):
+        from emt_tests.benchmark import run_table_benchmark, format_results
+
+        results = run_table_benchmark(count)
+        print(format_results(f"System table queries ({count:,} systems)", results))
+
+        assert results["systems"] == count
+        assert results["table_ms"] < results["loop_ms"]
+
+
+@pytest.mark.performance
+class TestIndexBenchmark:
+    """Indexed filter changes versus scanning every row"""
+
+    def test_few_matches(self):
+        from emt_tests.benchmark import run_index_benchmark, format_results
+
+        results = run_index_benchmark(50_000)
+        print(format_results("Indexed filters (50,000 systems)", results))
+
+        assert results["matches"] < 100
+        assert results["indexed_ms"] * 10 < results["scan_ms"]
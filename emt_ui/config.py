@@ -237,6 +237,12 @@ def create_config_frame(parent, nb):
         variable=configPlugin.hide_stats
     ).grid(row=next_config_row(), columnspan=2, sticky=tk.W)
 
+    nb.Checkbutton(
+        config_frame,
+        text="Store systems, backpack and salvage in SQLite (applies on restart)",
+        variable=configPlugin.useSqlite
+    ).grid(row=next_config_row(), columnspan=2, sticky=tk.W)
+
     nb.Label(config_frame, text="").grid(row=next_config_row(), column=0, sticky="w", padx=5, pady=5)
 
     # Duplicate Scanner Section
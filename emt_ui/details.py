@@ -5,7 +5,9 @@ import csv
 from config import config, appname
 from theme import theme
 from emt_core.report import Report, report
-from emt_models.system import systems
+from emt_models.system import systems, peek_systems
+from emt_models.table import system_table
+from emt_ui.rows import COLUMNS, SystemRowModel, VirtualTreeview
 from emt_models.power import pledgedPower
 from emt_core.config import configPlugin
 from emt_core.logging import logger, plugin_name
@@ -13,7 +15,6 @@ from typing import Dict, Any, List, Optional
 
 # Global GUI variables
 data_frame_default = None
-data_frame_detailed = None
 detailed_view = False
 toggle_button = None
 csv_button = None
@@ -29,9 +30,18 @@ filter_power_var = None
 main_tracker_frame = None
 info_window = None
 treeview = None
+virtual_tree = None  # VirtualTreeview driving `treeview`
+system_rows = SystemRowModel(systems)
 sort_column = None
 sort_reverse = False
 outer_scrollbar = None  # Outer scrollbar for default view
+header_widgets = []     # Power info header of the default view, hidden in the detailed view
+header_values = {}      # Header label -> value widget
+detailed_widgets = []   # Filter and treeview frames, hidden in the default view
+default_rows = {}       # System name -> ((merits, report text), grid row, widgets) in the default view
+default_next_row = 1    # Grid row for the next system added to the default view
+default_copy_mode = None  # Copy/report mode the default view rows were built for
+default_empty_label = None
 
 
 def copy_to_clipboard_or_report(text, name, table_frame, update_scrollregion):
@@ -49,19 +59,14 @@ def copy_to_clipboard_or_report(text, name, table_frame, update_scrollregion):
 
 
 def delete_entry(system_name, table_frame, update_scrollregion):
-    global data_frame_default, data_frame_detailed, detailed_view, systems, pledgedPower, main_tracker_frame
+    global data_frame_default, detailed_view, systems, pledgedPower, main_tracker_frame
 
     if system_name in systems:
-        systems[system_name].Merits = 0
+        # The detailed view patches the row through the row model's listener
+        systems[system_name].setMerits(0)
 
-        if detailed_view and data_frame_detailed:
-            for widget in data_frame_detailed.winfo_children():
-                widget.destroy()
-        elif not detailed_view and data_frame_default:
-            for widget in data_frame_default.winfo_children():
-                widget.destroy()
-
-        populate_table(table_frame, update_scrollregion)
+        if not detailed_view and data_frame_default:
+            remove_default_row(system_name)
 
         if main_tracker_frame:
             from emt_core.state import state
@@ -80,23 +85,43 @@ def toggle_view():
 
     toggle_button.config(text="Show Default View" if detailed_view else "Show Detailed View")
 
-    for widget in table_frame.winfo_children():
-        widget.destroy()
-
+    # Both views keep their widgets; switching only hides one and shows the other
     if detailed_view:
         csv_button.grid(row=0, column=1, padx=5)
         shiplocker_button.grid_forget()
         copy_all_button.grid_forget()
+        for widget in header_widgets:
+            widget.grid_remove()
+        if data_frame_default:
+            data_frame_default.grid_remove()
     else:
         csv_button.grid_forget()
         shiplocker_button.grid(row=0, column=2, padx=5)
         copy_all_button.grid(row=0, column=3, padx=5)
+        for widget in detailed_widgets:
+            widget.grid_remove()
         add_power_info_headers()
 
     colors = get_theme_colors()
     table_frame.after(100, lambda: (populate_table(table_frame, update_scrollregion), apply_theme_to_widget(info_window, colors)))
 
 
+def reset_view_widgets():
+    """Forget the widgets of a closed Power Info window"""
+    global data_frame_default, treeview, virtual_tree, default_next_row, default_copy_mode, default_empty_label
+    data_frame_default = None
+    treeview = None
+    virtual_tree = None
+    system_rows.clear()
+    header_widgets.clear()
+    header_values.clear()
+    detailed_widgets.clear()
+    default_rows.clear()
+    default_next_row = 1
+    default_copy_mode = None
+    default_empty_label = None
+
+
 def save_window_size(window):
     try:
         if window and window.winfo_exists():
@@ -124,7 +149,7 @@ def export_to_csv():
     with open(file_path, mode="w", newline="") as file:
         writer = csv.writer(file, delimiter=";")
         writer.writerow(headers)
-        for system_name, system_data in systems.items():
+        for system_name, system_data in peek_systems():
             state = system_data.PowerplayState
             progress = system_data.getSystemProgressNumber()
             controlling_power = system_data.ControllingPower
@@ -316,6 +341,7 @@ def show_power_info(parent, pp, sy, tracker_frame=None):
     systems = sy
     main_tracker_frame = tracker_frame
     detailed_view = False
+    reset_view_widgets()
 
     # Get theme colors
     colors = get_theme_colors()
@@ -365,6 +391,7 @@ def show_power_info(parent, pp, sy, tracker_frame=None):
             save_window_size(info_window)
             info_window.destroy()
         info_window = None
+        reset_view_widgets()
 
     info_window.protocol("WM_DELETE_WINDOW", on_close)
 
@@ -392,33 +419,36 @@ def show_power_info(parent, pp, sy, tracker_frame=None):
     apply_theme_to_widget(info_window, colors)
 
 
+def build_report_text(system_name, system_data):
+    """Copy/report text of a system from the configured template"""
+    dcText = configPlugin.copyText.get().replace('@MeritsValue', str(system_data.Merits))
+    if '@SystemStatus' in dcText:
+        dcText = dcText.replace('@SystemStatus', system_data.getSystemStatusShort())
+    dcText = dcText.replace('@System', system_name)
+    if '@CPControlling' in dcText:
+        # For acquisition systems, show progress percentage instead of reinforcement
+        if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 0:
+            progress = system_data.getSystemProgressNumber()
+            dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {progress:.2f}%")
+        else:
+            dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {str(system_data.PowerplayStateReinforcement)}")
+    if '@CPOpposition' in dcText:
+        # For acquisition systems, show 2nd place power progress percentage
+        if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 1:
+            second_power = system_data.PowerplayConflictProgress[1]
+            progress = second_power.progress * 100
+            dcText = dcText.replace('@CPOpposition', f"{second_power.power} {progress:.2f}%")
+        else:
+            real_um = getattr(system_data, 'RealUndermining', system_data.PowerplayStateUndermining)
+            dcText = dcText.replace('@CPOpposition', f"Opposition {str(real_um)}")
+    return dcText
+
+
 def copy_all_systems_to_clipboard_or_report():
     global systems, configPlugin, report
     all_texts = []
-    for system_name, system_data in systems.items():
-        merits = str(system_data.Merits)
-        if int(merits) > 0:
-            dcText = configPlugin.copyText.get().replace('@MeritsValue', merits)
-            if '@SystemStatus' in dcText:
-                dcText = dcText.replace('@SystemStatus', system_data.getSystemStatusShort())
-            dcText = dcText.replace('@System', system_name)
-            if '@CPControlling' in dcText:
-                # For acquisition systems, show progress percentage instead of reinforcement
-                if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 0:
-                    progress = system_data.getSystemProgressNumber()
-                    dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {progress:.2f}%")
-                else:
-                    dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {str(system_data.PowerplayStateReinforcement)}")
-            if '@CPOpposition' in dcText:
-                # For acquisition systems, show 2nd place power progress percentage
-                if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 1:
-                    second_power = system_data.PowerplayConflictProgress[1]
-                    progress = second_power.progress * 100
-                    dcText = dcText.replace('@CPOpposition', f"{second_power.power} {progress:.2f}%")
-                else:
-                    real_um = getattr(system_data, 'RealUndermining', system_data.PowerplayStateUndermining)
-                    dcText = dcText.replace('@CPOpposition', f"Opposition {str(real_um)}")
-            all_texts.append(dcText)
+    for system_name in system_table.filter(min_merits=1):
+        all_texts.append(build_report_text(system_name, systems[system_name]))
     combined_text = "\n".join(all_texts)
     copy_to_clipboard_or_report(combined_text, "Systems worked on", table_frame, update_scrollregion)
 
@@ -428,6 +458,21 @@ def add_power_info_headers():
     if detailed_view:
         return
 
+    labels = [
+        ("Power:", pledgedPower.Power),
+        ("Rank:", str(pledgedPower.Rank)),
+        ("Total Merits:", f"{pledgedPower.Merits:,}"),
+        ("Time Pledged:", pledgedPower.TimePledgedStr),
+    ]
+
+    # Already built: show it again with current values
+    if header_widgets:
+        for widget in header_widgets:
+            widget.grid()
+        for label, value in labels:
+            header_values[label].config(text=value)
+        return
+
     colors = get_theme_colors()
     lbl_opts = {'background': colors['bg'], 'foreground': colors['fg']}
 
@@ -439,55 +484,46 @@ def add_power_info_headers():
     info_frame = tk.Frame(table_frame, background=colors['bg'])
     info_frame.grid(row=1, column=0, columnspan=7, sticky="w", padx=10, pady=5)
 
-    labels = [
-        ("Power:", pledgedPower.Power),
-        ("Rank:", str(pledgedPower.Rank)),
-        ("Total Merits:", f"{pledgedPower.Merits:,}"),
-        ("Time Pledged:", pledgedPower.TimePledgedStr),
-    ]
-
     for i, (label, value) in enumerate(labels):
         lbl = tk.Label(info_frame, text=label, font=("Arial", 10, "bold"), **lbl_opts)
         lbl.grid(row=0, column=i*2, sticky="w", padx=(0, 5))
 
         val = tk.Label(info_frame, text=value, font=("Arial", 10), **lbl_opts)
         val.grid(row=0, column=i*2+1, sticky="w", padx=(0, 20))
+        header_values[label] = val
 
     # Separator
     sep = ttk.Separator(table_frame, orient="horizontal")
     sep.grid(row=2, column=0, columnspan=7, sticky="ew", padx=10, pady=10)
 
+    header_widgets.extend([title, info_frame, sep])
 
-def sort_treeview(tree, col, reverse):
-    """Sort treeview by column"""
-    global sort_column, sort_reverse
 
-    data = [(tree.set(child, col), child) for child in tree.get_children('')]
-
-    # Try numeric sort first
-    try:
-        data.sort(key=lambda t: float(t[0].replace(',', '').replace('%', '').split('(')[-1].split(')')[0]) if t[0] else 0, reverse=reverse)
-    except (ValueError, IndexError, AttributeError):
-        data.sort(key=lambda t: t[0].lower() if t[0] else '', reverse=reverse)
+def sort_treeview(view, col, reverse):
+    """Sort the detailed view by column"""
+    global sort_column, sort_reverse
 
-    for index, (val, child) in enumerate(data):
-        tree.move(child, '', index)
+    view.model.sort(col, reverse)
+    view.first = 0
+    view.refresh()
 
     sort_column = col
     sort_reverse = reverse
 
     # Update header to show sort direction
+    tree = view.tree
     for column in tree["columns"]:
         if column == col:
             tree.heading(column, text=f"{column} {'▼' if reverse else '▲'}",
-                        command=lambda c=col: sort_treeview(tree, c, not reverse))
+                        command=lambda c=col: sort_treeview(view, c, not reverse))
         else:
             tree.heading(column, text=column,
-                        command=lambda c=column: sort_treeview(tree, c, False))
+                        command=lambda c=column: sort_treeview(view, c, False))
 
 
 def populate_table(table_frame, update_scrollregion, show_filters_only=False):
-    global detailed_view, data_frame_default, systems, pledgedPower, treeview, outer_scrollbar
+    global detailed_view, data_frame_default, systems, pledgedPower, treeview, virtual_tree, outer_scrollbar
+    global default_next_row, default_copy_mode, default_empty_label
 
     colors = get_theme_colors()
     lbl_opts = {'background': colors['bg'], 'foreground': colors['fg']}
@@ -514,6 +550,13 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
         table_frame.rowconfigure(0, weight=0)  # Filter row - no expansion
         table_frame.rowconfigure(1, weight=1)  # Treeview row - expand
 
+        # Already built: show it again and pick up systems added meanwhile
+        if detailed_widgets:
+            for widget in detailed_widgets:
+                widget.grid()
+            refresh_filtered_treeview()
+            return
+
         # Filter frame
         filter_container = tk.Frame(table_frame, background=colors['bg'])
         filter_container.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
@@ -526,7 +569,7 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
         tree_frame.columnconfigure(0, weight=1)
         tree_frame.rowconfigure(0, weight=1)
 
-        columns = ("System", "Status", "Progress", "Power", "Cycle", "Reinf", "Underm", "Opposition")
+        columns = COLUMNS
 
         # Configure treeview style for better row separation and theme matching
         style = ttk.Style()
@@ -587,17 +630,19 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
             ("Opposition", 150, "center"),
         ]
         for col, width, anchor in col_config:
-            treeview.heading(col, text=col, command=lambda c=col: sort_treeview(treeview, c, False))
+            treeview.heading(col, text=col, command=lambda c=col: sort_treeview(virtual_tree, c, False))
             # System column: fixed width, no shrinking; others can shrink
             if col == "System":
                 treeview.column(col, width=width, minwidth=width, anchor=anchor, stretch=False)
             else:
                 treeview.column(col, width=width, minwidth=50, anchor=anchor)
 
-        # Scrollbars
-        tree_scroll_y = ttk.Scrollbar(tree_frame, orient="vertical", command=treeview.yview)
+        # Scrollbars - the vertical one is driven by the virtual view, which
+        # keeps only the rows in sight in the tree
+        tree_scroll_y = ttk.Scrollbar(tree_frame, orient="vertical")
         tree_scroll_x = ttk.Scrollbar(tree_frame, orient="horizontal", command=treeview.xview)
-        treeview.configure(yscrollcommand=tree_scroll_y.set, xscrollcommand=tree_scroll_x.set)
+        treeview.configure(xscrollcommand=tree_scroll_x.set)
+        virtual_tree = VirtualTreeview(treeview, tree_scroll_y, system_rows)
 
         treeview.grid(row=0, column=0, sticky="nsew")
         tree_scroll_y.grid(row=0, column=1, sticky="ns")
@@ -606,7 +651,7 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
         tree_frame.rowconfigure(0, weight=1)
 
         # Populate treeview
-        populate_treeview(treeview, systems)
+        populate_treeview(virtual_tree, systems.keys())
 
         # Configure tag colors with darker/lighter variants for better separation
         # Using slightly different shades and adding a visible border effect via contrasting colors
@@ -618,6 +663,7 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
         treeview.tag_configure('warning_alt', background='#a05000', foreground='#fff')
         treeview.tag_configure('neutral', background='#606060', foreground='#fff')
         treeview.tag_configure('neutral_alt', background='#404040', foreground='#fff')
+        detailed_widgets.extend([filter_container, tree_frame])
         return
 
     # ----- DEFAULT VIEW -----
@@ -634,8 +680,18 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
     for i in range(7):
         table_frame.columnconfigure(i, weight=1)
 
+    # Already built for the current copy/report mode: show it again and patch changed rows
+    if data_frame_default and default_copy_mode == textCopyReport:
+        data_frame_default.grid()
+        refresh_default_rows()
+        return
+
     if data_frame_default:
         data_frame_default.destroy()
+    default_rows.clear()
+    default_next_row = 1
+    default_copy_mode = textCopyReport
+    default_empty_label = None
 
     data_frame_default = tk.Frame(table_frame, background=colors['bg'])
     data_frame_default.grid(row=3, column=0, columnspan=7, sticky="nsew", padx=10, pady=5)
@@ -648,72 +704,112 @@ def populate_table(table_frame, update_scrollregion, show_filters_only=False):
             lbl = tk.Label(data_frame_default, text=header, font=("Arial", 10, "bold"), anchor="w", **lbl_opts)
             lbl.grid(row=0, column=col, padx=5, pady=(5, 10), sticky="w")
 
-    row_index = 1
-    for system_name, system_data in systems.items():
-        merits = system_data.Merits
-
-        if merits > 0:
-            dcText = configPlugin.copyText.get().replace('@MeritsValue', str(merits))
-            if '@SystemStatus' in dcText:
-                dcText = dcText.replace('@SystemStatus', system_data.getSystemStatusShort())
-            dcText = dcText.replace('@System', system_name)
-            if '@CPControlling' in dcText:
-                # For acquisition systems, show progress percentage instead of reinforcement
-                if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 0:
-                    progress = system_data.getSystemProgressNumber()
-                    dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {progress:.2f}%")
-                else:
-                    dcText = dcText.replace('@CPControlling', f"{system_data.ControllingPower} {str(system_data.PowerplayStateReinforcement)}")
-            if '@CPOpposition' in dcText:
-                # For acquisition systems, show 2nd place power progress percentage
-                if system_data.PowerplayConflictProgress and len(system_data.PowerplayConflictProgress) > 1:
-                    second_power = system_data.PowerplayConflictProgress[1]
-                    progress = second_power.progress * 100
-                    dcText = dcText.replace('@CPOpposition', f"{second_power.power} {progress:.2f}%")
-                else:
-                    real_um = getattr(system_data, 'RealUndermining', system_data.PowerplayStateUndermining)
-                    dcText = dcText.replace('@CPOpposition', f"Opposition {str(real_um)}")
-
-            # System name
-            tk.Label(data_frame_default, text=system_name, width=28, anchor="w", **lbl_opts).grid(
-                row=row_index, column=0, padx=5, pady=2, sticky="w")
-
-            # Merits (bold, highlight color)
-            tk.Label(data_frame_default, text=f"{merits:,}", width=12, anchor="w",
-                    font=("Arial", 10, "bold"), background=colors['bg'], foreground=colors['highlight']).grid(
-                row=row_index, column=1, padx=5, pady=2, sticky="w")
-
-            # Copy button
-            copy_btn = create_bordered_button(
-                data_frame_default, textCopyReport,
-                lambda text=dcText, name=system_name: copy_to_clipboard_or_report(text, name, table_frame, update_scrollregion),
-                colors, width=6
-            )
-            copy_btn.grid(row=row_index, column=2, padx=5, pady=2)
+    refresh_default_rows()
+
+
+def refresh_default_rows():
+    """Bring the default view's rows in line with the systems that have merits.
+
+    Rows whose merits and report text are unchanged are left alone, changed
+    rows are rebuilt in place and new systems are appended.
+    """
+    global default_next_row
 
-            # Reset button
-            if tlColumn:
-                reset_btn = create_bordered_button(
-                    data_frame_default, "Reset",
-                    lambda name=system_name: delete_entry(name, table_frame, update_scrollregion),
-                    colors, width=6
-                )
-                reset_btn.grid(row=row_index, column=3, padx=5, pady=2)
+    wanted = {}
+    for system_name in system_table.filter(min_merits=1):
+        system_data = systems[system_name]
+        wanted[system_name] = (system_data, (system_data.Merits, build_report_text(system_name, system_data)))
 
-            # Report text
-            tk.Label(data_frame_default, text=dcText, width=50, anchor="w", wraplength=350, **lbl_opts).grid(
-                row=row_index, column=4, padx=5, pady=2, sticky="w")
+    for system_name in [name for name in default_rows if name not in wanted]:
+        remove_default_row(system_name)
 
-            row_index += 1
+    for system_name, (system_data, content) in wanted.items():
+        existing = default_rows.get(system_name)
+        if existing and existing[0] == content:
+            continue
+        if existing:
+            row_index = existing[1]
+            for widget in existing[2]:
+                widget.destroy()
+        else:
+            row_index = default_next_row
+            default_next_row += 1
+        default_rows[system_name] = (content, row_index, add_default_row(system_name, content, row_index))
 
-    # Empty state
-    if row_index == 1:
-        tk.Label(data_frame_default, text="No systems with merits yet. Start earning merits!",
-                font=("Arial", 11, "italic"), **lbl_opts).grid(row=1, column=0, columnspan=5, pady=20)
+    update_default_empty_state()
+
+
+def add_default_row(system_name, content, row_index):
+    """Create the widgets of one default view row and return them"""
+    colors = get_theme_colors()
+    lbl_opts = {'background': colors['bg'], 'foreground': colors['fg']}
+    merits, dcText = content
+    widgets = []
+
+    # System name
+    label = tk.Label(data_frame_default, text=system_name, width=28, anchor="w", **lbl_opts)
+    label.grid(row=row_index, column=0, padx=5, pady=2, sticky="w")
+    widgets.append(label)
+
+    # Merits (bold, highlight color)
+    label = tk.Label(data_frame_default, text=f"{merits:,}", width=12, anchor="w",
+                     font=("Arial", 10, "bold"), background=colors['bg'], foreground=colors['highlight'])
+    label.grid(row=row_index, column=1, padx=5, pady=2, sticky="w")
+    widgets.append(label)
+
+    # Copy button
+    copy_btn = create_bordered_button(
+        data_frame_default, default_copy_mode,
+        lambda text=dcText, name=system_name: copy_to_clipboard_or_report(text, name, table_frame, update_scrollregion),
+        colors, width=6
+    )
+    copy_btn.grid(row=row_index, column=2, padx=5, pady=2)
+    widgets.append(copy_btn)
+
+    # Reset button
+    if default_copy_mode == "copy":
+        reset_btn = create_bordered_button(
+            data_frame_default, "Reset",
+            lambda name=system_name: delete_entry(name, table_frame, update_scrollregion),
+            colors, width=6
+        )
+        reset_btn.grid(row=row_index, column=3, padx=5, pady=2)
+        widgets.append(reset_btn)
+
+    # Report text
+    label = tk.Label(data_frame_default, text=dcText, width=50, anchor="w", wraplength=350, **lbl_opts)
+    label.grid(row=row_index, column=4, padx=5, pady=2, sticky="w")
+    widgets.append(label)
+    return widgets
+
+
+def remove_default_row(system_name):
+    """Drop one system's row from the default view"""
+    row = default_rows.pop(system_name, None)
+    if row:
+        for widget in row[2]:
+            widget.destroy()
+        update_default_empty_state()
+
+
+def update_default_empty_state():
+    """Show the empty-state hint when no system has merits"""
+    global default_empty_label
+    if default_rows and default_empty_label:
+        default_empty_label.destroy()
+        default_empty_label = None
+    elif not default_rows and not default_empty_label:
+        colors = get_theme_colors()
+        default_empty_label = tk.Label(data_frame_default, text="No systems with merits yet. Start earning merits!",
+                                       font=("Arial", 11, "italic"), background=colors['bg'], foreground=colors['fg'])
+        default_empty_label.grid(row=1, column=0, columnspan=5, pady=20)
+
+
+SYSTEM_SUGGESTIONS = 50  # Names offered in the system search drop-down
 
 
 def create_filter_widgets(parent):
-    """Create filter dropdown widgets for detailed view"""
+    """Create filter widgets for detailed view: system name search plus state and power dropdowns"""
     global filter_system_var, filter_state_var, filter_power_var
 
     colors = get_theme_colors()
@@ -721,30 +817,33 @@ def create_filter_widgets(parent):
 
     tk.Label(parent, text="Filters:", font=("Arial", 10, "bold"), **lbl_opts).grid(row=0, column=0, padx=(0, 10), sticky="w")
 
-    powers = sorted({data.ControllingPower for data in systems.values() if data.ControllingPower})
-    states = sorted({data.PowerplayState for data in systems.values() if data.PowerplayState})
-    system_names = sorted(systems.keys())
-
-    filter_system_var = tk.StringVar(value="All Systems")
+    filter_system_var = tk.StringVar(value="")
     filter_state_var = tk.StringVar(value="All States")
     filter_power_var = tk.StringVar(value="All Powers")
 
-    # System filter
+    # Drop-down values are looked up when a list opens, from the table's indexes
+    def suggest_systems():
+        system_menu.configure(values=system_table.search(filter_system_var.get().strip(), limit=SYSTEM_SUGGESTIONS))
+
+    def list_states():
+        state_menu.configure(values=["All States"] + system_table.categories("state"))
+
+    def list_powers():
+        power_menu.configure(values=["All Powers"] + system_table.categories("power"))
+
+    # System filter - type-ahead search by name prefix
     tk.Label(parent, text="System:", **lbl_opts).grid(row=0, column=1, padx=5)
-    system_menu = ttk.Combobox(parent, textvariable=filter_system_var,
-                               values=["All Systems"] + system_names, width=20, state="readonly")
+    system_menu = ttk.Combobox(parent, textvariable=filter_system_var, width=20, postcommand=suggest_systems)
     system_menu.grid(row=0, column=2, padx=5)
 
     # State filter
     tk.Label(parent, text="State:", **lbl_opts).grid(row=0, column=3, padx=5)
-    state_menu = ttk.Combobox(parent, textvariable=filter_state_var,
-                              values=["All States"] + states, width=15, state="readonly")
+    state_menu = ttk.Combobox(parent, textvariable=filter_state_var, width=15, state="readonly", postcommand=list_states)
     state_menu.grid(row=0, column=4, padx=5)
 
     # Power filter
     tk.Label(parent, text="Power:", **lbl_opts).grid(row=0, column=5, padx=5)
-    power_menu = ttk.Combobox(parent, textvariable=filter_power_var,
-                              values=["All Powers"] + powers, width=20, state="readonly")
+    power_menu = ttk.Combobox(parent, textvariable=filter_power_var, width=20, state="readonly", postcommand=list_powers)
     power_menu.grid(row=0, column=6, padx=5)
 
     # Bind filter changes
@@ -754,78 +853,29 @@ def create_filter_widgets(parent):
 
 def refresh_filtered_treeview():
     """Refresh treeview with filtered data"""
-    global treeview, systems
+    global virtual_tree, systems
 
-    if not treeview:
+    if not virtual_tree:
         return
 
-    selected_system = filter_system_var.get()
+    selected_system = filter_system_var.get().strip()
     selected_state = filter_state_var.get()
     selected_power = filter_power_var.get()
 
-    filtered = {}
-    for name, data in systems.items():
-        if selected_system != "All Systems" and name != selected_system:
-            continue
-        if selected_state != "All States" and data.PowerplayState != selected_state:
-            continue
-        if selected_power != "All Powers" and data.ControllingPower != selected_power:
-            continue
-        filtered[name] = data
-
-    # Clear and repopulate
-    for item in treeview.get_children():
-        treeview.delete(item)
-
-    populate_treeview(treeview, filtered)
-
+    names = system_table.filter(
+        state=None if selected_state == "All States" else selected_state,
+        power=None if selected_power == "All Powers" else selected_power,
+        prefix=selected_system or None,
+    )
 
-def populate_treeview(tree, data):
-    """Populate treeview with system data"""
-    row_index = 0
-    for system_name, system_data in data.items():
-        controlling_power = system_data.ControllingPower
-        opposition = ", ".join(system_data.Opposition) if system_data.Opposition else ""
-        progress = system_data.getSystemProgressNumber()
-        state_text = system_data.getSystemStateText()
+    populate_treeview(virtual_tree, names)
 
-        # Determine status tag
-        if controlling_power == "no power":
-            base_tag = 'neutral'
-        else:
-            display_progress = progress - 100 if progress > 100 and state_text != "Stronghold" else progress
-            if 0 <= display_progress < 20:
-                base_tag = 'danger'
-            elif 20 <= display_progress < 80:
-                base_tag = 'safe'
-            elif display_progress >= 80:
-                base_tag = 'safe' if state_text == "Stronghold" else 'warning'
-            else:
-                base_tag = 'neutral'
 
-        # Alternate between normal and _alt tag for zebra striping
-        tag = base_tag if row_index % 2 == 0 else f"{base_tag}_alt"
-
-        if not system_data.PowerplayConflictProgress or len(system_data.PowerplayConflictProgress) == 0:
-            power_status = system_data.getPowerPlayCycleNetStatusText()
-            reinforcement = system_data.PowerplayStateReinforcement
-            undermining = getattr(system_data, 'RealUndermining', system_data.PowerplayStateUndermining)
-        else:
-            power_status = "Conflict"
-            reinforcement = "-"
-            undermining = "-"
-
-        tree.insert("", "end", values=(
-            system_name,
-            state_text,
-            f"{progress:.1f}%",
-            controlling_power,
-            power_status,
-            reinforcement,
-            undermining,
-            opposition
-        ), tags=(tag,))
-        row_index += 1
+def populate_treeview(view, names):
+    """Show these systems in the virtual treeview; only the rows in view are formatted and inserted"""
+    view.model.set_names(names)
+    view.first = 0
+    view.refresh()
 
 
 # ============================================================
@@ -833,6 +883,14 @@ def populate_treeview(tree, data):
 # ============================================================
 
 backpack_window = None
+_backpack_refreshers = []  # Repopulate functions of the open backpack window's bag tables
+
+
+def refresh_backpack_view():
+    """Repopulate the open backpack window's bag tables after the backpack changed outside the editor"""
+    if backpack_window and backpack_window.winfo_exists():
+        for refresh in _backpack_refreshers:
+            refresh()
 
 
 def show_backpack_view(parent):
@@ -851,6 +909,7 @@ def show_backpack_view(parent):
     colors = get_theme_colors()
 
     backpack_window = tk.Toplevel(parent)
+    _backpack_refreshers.clear()
     backpack_window.title("Shiplocker - Elite Merit Tracker")
     backpack_window.geometry("1200x800")
     backpack_window.configure(background=colors['bg'])
@@ -874,6 +933,7 @@ def show_backpack_view(parent):
         if backpack_window and backpack_window.winfo_exists():
             backpack_window.destroy()
         backpack_window = None
+        _backpack_refreshers.clear()
 
     backpack_window.protocol("WM_DELETE_WINDOW", on_close)
 
@@ -968,18 +1028,29 @@ def show_backpack_view(parent):
         tree_scrollbar.pack(side="right", fill="y")
 
         # Populate table
-        row_index = 0
-        for data_type, systems_dict in sorted(bag.items.items()):
-            for system_name, count in sorted(systems_dict.items()):
-                display_name = display_name_func(data_type)
-                tag = "even" if row_index % 2 == 0 else "odd"
-                tree.insert("", "end", values=(system_name, count, display_name),
-                           tags=(tag,))
-                row_index += 1
+        def populate():
+            tree.delete(*tree.get_children(""))
+            row_index = 0
+            for data_type, systems_dict in sorted(bag.items.items()):
+                for system_name, count in sorted(systems_dict.items()):
+                    display_name = display_name_func(data_type)
+                    tag = "even" if row_index % 2 == 0 else "odd"
+                    tree.insert("", "end", values=(system_name, count, display_name),
+                               tags=(tag,))
+                    row_index += 1
+
+            # Stale entries (expired, never attributed) are listed last and are read-only
+            for data_type, systems_dict in sorted(bag.stale.items()):
+                for system_name, count in sorted(systems_dict.items()):
+                    tree.insert("", "end", values=(system_name, count, f"{display_name_func(data_type)} (stale)"),
+                               tags=("stale",))
+
+        populate()
 
         # Configure row tags for alternating colors with better contrast
         tree.tag_configure("even", background=colors['table_row_even'], foreground=colors['fg'])
         tree.tag_configure("odd", background=colors['table_row_odd'], foreground=colors['fg'])
+        tree.tag_configure("stale", background=colors['bg'], foreground="gray")
 
         # Change cursor to indicate editable Count column
         def on_motion(event):
@@ -995,7 +1066,7 @@ def show_backpack_view(parent):
         # Add double-click to edit Count
         def on_double_click(event):
             item = tree.selection()
-            if not item:
+            if not item or "stale" in tree.item(item[0], "tags"):
                 return
 
             # Get the clicked column
@@ -1038,17 +1109,11 @@ def show_backpack_view(parent):
                     int_value = int(new_value) if new_value else 0
 
                     # Update count
+                    bag.set_count(data_type_key, system_name, int_value)
                     if int_value > 0:
-                        bag.items[data_type_key][system_name] = int_value
                         # Update tree display
                         tree.item(item[0], values=(system_name, int_value, data_type_display))
                     else:
-                        # Remove entry if count is 0
-                        if system_name in bag.items[data_type_key]:
-                            del bag.items[data_type_key][system_name]
-                        # If no systems left, remove the data type
-                        if not bag.items[data_type_key]:
-                            del bag.items[data_type_key]
                         # Remove the row
                         tree.delete(item[0])
 
@@ -1177,6 +1242,11 @@ def show_backpack_view(parent):
                               background=colors['bg'], foreground=colors['fg'])
         total_label.pack(side="right", pady=5)
 
+        def refresh():
+            populate()
+            total_label.config(text=f"Total: {bag.get_total()} items")
+        _backpack_refreshers.append(refresh)
+
         return tree
 
     def create_salvage_table(parent_frame, title, colors):
@@ -1262,9 +1332,17 @@ def show_backpack_view(parent):
                     total_items += count
                     row_index += 1
 
+        # Stale cargo (expired, never attributed) is listed last and is read-only
+        for system_name, salvage in sorted(salvageInventory.items()):
+            for item_type, count in sorted(salvage.stale.items()):
+                display_name = VALID_POWERPLAY_SALVAGE_TYPES.get(item_type, item_type)
+                tree.insert("", "end", values=(system_name, f"{display_name} (stale)", count),
+                           tags=("stale",))
+
         # Configure row tags for alternating colors
         tree.tag_configure("even", background=colors['table_row_even'], foreground=colors['fg'])
         tree.tag_configure("odd", background=colors['table_row_odd'], foreground=colors['fg'])
+        tree.tag_configure("stale", background=colors['bg'], foreground="gray")
 
         # Change cursor to indicate editable Count column
         def on_motion(event):
@@ -1280,7 +1358,7 @@ def show_backpack_view(parent):
         # Add double-click to edit Count
         def on_double_click(event):
             item = tree.selection()
-            if not item:
+            if not item or "stale" in tree.item(item[0], "tags"):
                 return
 
             # Get the clicked column
@@ -1294,14 +1372,8 @@ def show_backpack_view(parent):
             item_type_display = values[1]
 
             # Find the actual item_type key from display name
-            item_type_key = None
-            for salvage in salvageInventory.values():
-                for it_key, cargo in salvage.inventory.items():
-                    if VALID_POWERPLAY_SALVAGE_TYPES.get(it_key) == item_type_display:
-                        item_type_key = it_key
-                        break
-                if item_type_key:
-                    break
+            item_type_key = next((it_key for it_key, display in VALID_POWERPLAY_SALVAGE_TYPES.items()
+                                  if display == item_type_display), None)
 
             if not item_type_key or system_name not in salvageInventory:
                 return
@@ -1327,19 +1399,11 @@ def show_backpack_view(parent):
                     int_value = int(new_value) if new_value else 0
 
                     # Update count
+                    salvageInventory[system_name].set_count(item_type_key, int_value)
                     if int_value > 0:
-                        if item_type_key in salvageInventory[system_name].inventory:
-                            salvageInventory[system_name].inventory[item_type_key].count = int_value
-                        else:
-                            from emt_models.ppcargo import Cargo
-                            salvageInventory[system_name].inventory[item_type_key] = Cargo(item_type_key)
-                            salvageInventory[system_name].inventory[item_type_key].count = int_value
                         # Update tree display
                         tree.item(item[0], values=(system_name, item_type_display, int_value))
                     else:
-                        # Remove entry if count is 0
-                        if item_type_key in salvageInventory[system_name].inventory:
-                            del salvageInventory[system_name].inventory[item_type_key]
                         # If no items left in system, remove the system
                         if not salvageInventory[system_name].inventory:
                             del salvageInventory[system_name]
@@ -1347,11 +1411,7 @@ def show_backpack_view(parent):
                         tree.delete(item[0])
 
                     # Update total
-                    new_total = sum(
-                        cargo.count
-                        for salvage in salvageInventory.values()
-                        for cargo in salvage.inventory.values()
-                    )
+                    new_total = salvageInventory.total()
                     total_label.config(text=f"Total: {new_total} items")
 
                     # Save to JSON
@@ -1433,11 +1493,7 @@ def show_backpack_view(parent):
                                    tags=(tag,))
 
                         # Update total
-                        new_total = sum(
-                            cargo.count
-                            for salvage in salvageInventory.values()
-                            for cargo in salvage.inventory.values()
-                        )
+                        new_total = salvageInventory.total()
                         total_label.config(text=f"Total: {new_total} items")
 
                         # Save to JSON
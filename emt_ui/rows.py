@@ -0,0 +1,349 @@
+# ui/rows.py - Row model and virtualised Treeview for the detailed system view
+from collections import OrderedDict
+
+COLUMNS = ("System", "Status", "Progress", "Power", "Cycle", "Reinf", "Underm", "Opposition")
+
+DEFAULT_ROW_HEIGHT = 28   # Matches the Spaced.Treeview rowheight
+DEFAULT_VISIBLE_ROWS = 30  # Used until the widget has been laid out
+DEFAULT_OVERSCAN = 20
+MAX_DETACHED = 500  # Detached rows kept in the tree for reattaching
+
+
+def format_system_row(name, system):
+    """Display values and base status tag of one detailed-view row
+
+    Returns:
+        (values tuple in COLUMNS order, tag) where tag is danger/safe/warning/neutral
+    """
+    controlling_power = system.ControllingPower
+    opposition = ", ".join(system.Opposition) if system.Opposition else ""
+    progress = system.getSystemProgressNumber()
+    state_text = system.getSystemStateText()
+
+    # Determine status tag
+    if controlling_power == "no power":
+        base_tag = 'neutral'
+    else:
+        display_progress = progress - 100 if progress > 100 and state_text != "Stronghold" else progress
+        if 0 <= display_progress < 20:
+            base_tag = 'danger'
+        elif 20 <= display_progress < 80:
+            base_tag = 'safe'
+        elif display_progress >= 80:
+            base_tag = 'safe' if state_text == "Stronghold" else 'warning'
+        else:
+            base_tag = 'neutral'
+
+    if not system.PowerplayConflictProgress:
+        power_status = system.getPowerPlayCycleNetStatusText()
+        reinforcement = system.PowerplayStateReinforcement
+        undermining = getattr(system, 'RealUndermining', system.PowerplayStateUndermining)
+    else:
+        power_status = "Conflict"
+        reinforcement = "-"
+        undermining = "-"
+
+    values = (name, state_text, f"{progress:.1f}%", controlling_power, power_status,
+              reinforcement, undermining, opposition)
+    return values, base_tag
+
+
+def system_sort_keys(name, system):
+    """Typed sort key of every detailed-view column, in COLUMNS order
+
+    Text columns sort case-insensitively, Progress by its percentage and Cycle
+    by net reinforcement (reinforcement minus real undermining). Reinf, Underm
+    and Cycle are None for systems in conflict, which show "-".
+    """
+    if system.PowerplayConflictProgress:
+        cycle = reinforcement = undermining = None
+    else:
+        reinforcement = system.PowerplayStateReinforcement
+        undermining = getattr(system, 'RealUndermining', system.PowerplayStateUndermining)
+        cycle = reinforcement - undermining
+    opposition = ", ".join(system.Opposition) if system.Opposition else ""
+    return (name.lower(), system.getSystemStateText().lower(), system.getSystemProgressNumber(),
+            system.ControllingPower.lower(), cycle, reinforcement, undermining, opposition.lower())
+
+
+class SystemRowModel:
+    """In-memory rows of the detailed view, formatted on demand.
+
+    Holds the ordered system names currently shown (after filtering and
+    sorting). A row is only formatted, and its system only looked up, when it
+    is requested, so opening the view costs O(visible rows) regardless of how
+    many systems are tracked. Formatted rows are cached until the registry
+    reports a change to the system.
+    """
+
+    def __init__(self, source):
+        """
+        Args:
+            source: Mapping of system name -> StarSystem (normally the systems registry)
+        """
+        self._source = source
+        self._names = []
+        self._formatted = {}  # name -> (values, tag)
+        self._keys = {}       # name -> system_sort_keys()
+        self._column_keys = [{} for _ in COLUMNS]  # per column: name -> typed key
+        self._sort = None     # (column, reverse) re-applied when the names change
+        self.row_listener = None  # Called with a system name (None = all) when its row changes
+        if hasattr(source, "add_listener"):
+            source.add_listener(self._on_change)
+
+    def _on_change(self, name):
+        if name is None:
+            self._formatted.clear()
+            self._keys.clear()
+            for keys in self._column_keys:
+                keys.clear()
+        else:
+            self._formatted.pop(name, None)
+            self._keys.pop(name, None)
+            for keys in self._column_keys:
+                keys.pop(name, None)
+        if self.row_listener:
+            self.row_listener(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def names(self):
+        """System names in display order"""
+        return list(self._names)
+
+    def set_names(self, names):
+        """Show these systems, keeping the current sort order if one is set"""
+        self._names = list(names)
+        if self._sort:
+            self._apply_sort()
+
+    def clear(self):
+        """Forget rows and cached formatting (when the detailed view closes)"""
+        self._names = []
+        self._formatted.clear()
+        self._keys.clear()
+        for keys in self._column_keys:
+            keys.clear()
+        self._sort = None
+        self.row_listener = None
+
+    def name(self, index):
+        """System name at a display position"""
+        return self._names[index]
+
+    def row(self, index):
+        """(name, values, tag) of the row at a display position"""
+        name = self._names[index]
+        values, tag = self.format(name)
+        return name, values, tag
+
+    def format(self, name):
+        """Cached (values, tag) of a system"""
+        formatted = self._formatted.get(name)
+        if formatted is None:
+            formatted = self._formatted[name] = format_system_row(name, self._source[name])
+        return formatted
+
+    def sort_keys(self, name):
+        """Cached typed sort keys of a system"""
+        keys = self._keys.get(name)
+        if keys is None:
+            keys = self._keys[name] = system_sort_keys(name, self._source[name])
+        return keys
+
+    def sort(self, column, reverse=False):
+        """Order the rows by a column of COLUMNS (stable; rows without a value go last)"""
+        self._sort = (column, reverse)
+        self._apply_sort()
+
+    def _apply_sort(self):
+        column, reverse = self._sort
+        index = COLUMNS.index(column)
+        keys = self._column_keys[index]
+        for name in [name for name in self._names if name not in keys]:
+            keys[name] = self.sort_keys(name)[index]
+        # The sort itself only calls dict.__getitem__, which runs in C
+        present = [name for name in self._names if keys[name] is not None]
+        present.sort(key=keys.__getitem__, reverse=reverse)
+        if len(present) < len(self._names):
+            present.extend(name for name in self._names if keys[name] is None)
+        self._names = present
+
+
+class VirtualTreeview:
+    """Drives a ttk.Treeview that only holds the rows in view plus an overscan.
+
+    The vertical scrollbar is connected to this object instead of the tree, and
+    reflects the position within the whole row model. The tree holds the rows
+    [first - overscan, first + visible + overscan); scrolling inside that window
+    only moves the tree's own view, scrolling past it moves the window.
+
+    Every system keeps one item ID for the life of the view. Moving the window
+    (scrolling, filtering, sorting) detaches the rows that leave it and
+    reattaches or inserts the ones that enter, writing values only where they
+    differ; a system change patches just that row's values and tags. Tk work is
+    therefore proportional to what changed on screen, never to the row count.
+    """
+
+    def __init__(self, tree, scrollbar, model, overscan=DEFAULT_OVERSCAN, row_height=DEFAULT_ROW_HEIGHT):
+        """
+        Args:
+            tree: ttk.Treeview with the COLUMNS columns
+            scrollbar: Vertical ttk.Scrollbar for the tree
+            model: SystemRowModel providing the rows
+            overscan: Rows materialised above and below the visible ones
+            row_height: Row height in pixels, to work out how many rows fit
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.model = model
+        self.overscan = overscan
+        self.row_height = row_height
+        self.first = 0
+        self._window = (0, 0)            # model positions currently attached
+        self._ids = {}                   # system name -> item ID
+        self._shown = []                 # attached names in tree order
+        self._written = {}               # name -> (values, tags) in its item, attached or detached
+        self._detached = OrderedDict()   # names with a detached item, oldest first
+        self._pending = set()            # names whose system changed since the last patch
+        self._patch_scheduled = False
+
+        scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        tree.bind("<MouseWheel>", self._on_mousewheel)
+        tree.bind("<Configure>", lambda event: self.refresh(resync=False))
+        model.row_listener = self._row_changed
+
+    def item_id(self, name):
+        """Stable item ID of a system's row"""
+        iid = self._ids.get(name)
+        if iid is None:
+            iid = self._ids[name] = f"S{len(self._ids)}"
+        return iid
+
+    def visible_rows(self):
+        """Number of rows that fit in the tree (one row height goes to the heading)"""
+        height = self.tree.winfo_height()
+        if height <= 1:  # not laid out yet
+            return DEFAULT_VISIBLE_ROWS
+        return max(1, height // self.row_height - 1)
+
+    def refresh(self, resync=True):
+        """Show the model's rows from self.first
+
+        Args:
+            resync: Re-check the window even if it still covers the view
+                    (after the model's names or order changed)
+        """
+        count = len(self.model)
+        visible = self.visible_rows()
+        self.first = max(0, min(self.first, count - visible))
+        start, stop = self._window
+        if resync or self.first < start or min(count, self.first + visible) > stop:
+            self._materialise(max(0, self.first - self.overscan),
+                              min(count, self.first + visible + self.overscan))
+        self._position(count, visible)
+
+    def _row_tags(self, index, tag):
+        return (tag if index % 2 == 0 else f"{tag}_alt",)
+
+    def _write(self, name, values, tags):
+        """Patch an existing item if its values or tags differ"""
+        if self._written[name] != (values, tags):
+            self.tree.item(self._ids[name], values=values, tags=tags)
+            self._written[name] = (values, tags)
+
+    def _materialise(self, start, stop):
+        """Attach exactly the rows [start, stop) in model order"""
+        tree = self.tree
+        names = [self.model.name(index) for index in range(start, stop)]
+        wanted = set(names)
+
+        leaving = [name for name in self._shown if name not in wanted]
+        if leaving:
+            tree.detach(*[self._ids[name] for name in leaving])
+            for name in leaving:
+                self._detached[name] = None
+        shown = [name for name in self._shown if name in wanted]
+
+        for position, name in enumerate(names):
+            values, tag = self.model.format(name)
+            tags = self._row_tags(start + position, tag)
+            if name not in self._written:
+                tree.insert("", position, iid=self.item_id(name), values=values, tags=tags)
+                self._written[name] = (values, tags)
+                shown.insert(position, name)
+                continue
+            self._write(name, values, tags)
+            if position < len(shown) and shown[position] == name:
+                continue
+            # move() also reattaches a detached item
+            tree.move(self._ids[name], "", position)
+            if name in self._detached:
+                del self._detached[name]
+            else:
+                shown.remove(name)
+            shown.insert(position, name)
+
+        self._shown = shown
+        self._window = (start, stop)
+        while len(self._detached) > MAX_DETACHED:
+            name, _ = self._detached.popitem(last=False)
+            tree.delete(self._ids[name])
+            del self._written[name]
+
+    def _row_changed(self, name):
+        """Row model listener: queue the system's row for patching on the next idle"""
+        if name is not None and name not in self._written:
+            return
+        self._pending.add(name)
+        if not self._patch_scheduled:
+            self._patch_scheduled = True
+            self.tree.after_idle(self._patch)
+
+    def _patch(self):
+        """Rewrite the values and tags of attached rows whose system changed"""
+        self._patch_scheduled = False
+        pending, self._pending = self._pending, set()
+        start = self._window[0]
+        for position, name in enumerate(self._shown):
+            if None in pending or name in pending:
+                values, tag = self.model.format(name)
+                self._write(name, values, self._row_tags(start + position, tag))
+        # Detached rows are compared again when they are reattached
+
+    def _position(self, count, visible):
+        start, stop = self._window
+        if stop > start:
+            self.tree.yview_moveto((self.first - start) / (stop - start))
+        if count:
+            self.scrollbar.set(self.first / count, min(1.0, (self.first + visible) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, first):
+        """Make a model position the top row"""
+        self.first = first
+        self.refresh(resync=False)
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.model)))
+        elif args[0] == "scroll":
+            step = self.visible_rows() if args[2] == "pages" else 1
+            self.scroll_to(self.first + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_to(self.first - 3 * (event.delta // 120))
+        return "break"
+
+    def _on_tree_scroll(self, low, high):
+        """The tree scrolled itself (keyboard navigation); follow it and extend the window at its edges"""
+        start, stop = self._window
+        first = start + round(float(low) * (stop - start))
+        if first != self.first:
+            self.scroll_to(first)
@@ -10,20 +10,28 @@ import threading
 from typing import Dict, Any
 
 from emt_core.report import report
-from emt_models.system import systems, StarSystem, loadSystems, dumpSystems
+from emt_models.system import systems, StarSystem, loadSystems, dumpSystems, active_systems
 from emt_models.salvage import Salvage, salvageInventory, save_salvage, load_salvage, VALID_POWERPLAY_SALVAGE_TYPES
 from emt_models.power import pledgedPower
 from emt_ui.main import TrackerFrame
+from emt_ui.details import refresh_backpack_view
 from emt_core.duplicate import track_journal_event, process_powerplay_event, reset_duplicate_tracking
 from emt_core.config import configPlugin
 from emt_core.logging import logger
 from config import config, appname
 from emt_ui.config import create_config_frame
 from emt_models.backpack import playerBackpack, save_backpack, load_backpack
-from emt_ppdata.undermining import is_valid_um_data
-from emt_ppdata.reinforcement import is_valid_reinf_data
-from emt_ppdata.acquisition import is_valid_acq_data
+from emt_models.expiry import expire_stale_items, save_expiry, load_expiry
+from emt_models.reconcile import reconcile_backpack, save_reconciliation_log, load_reconciliation_log
 from emt_core.state import state
+from emt_core.history import state_history
+from emt_core.archive import cycle_archive
+from emt_core.ledger import merit_ledger, SOURCE_COMBAT, SOURCE_DATA, SOURCE_SALVAGE, SOURCE_CARGO, SOURCE_CORRECTION
+from emt_core.storage import (set_storage_backend, get_storage_backend, get_sqlite_store, close_storage,
+                              set_durability, group_commit, get_save_stats, run_legacy_migration,
+                              STORAGE_BACKEND_SQLITE, STORAGE_BACKEND_JSON)
+from emt_core.backups import backup_store
+from emt_models.power import PowerEncoder
 
 # Module globals
 trackerFrame = None
@@ -57,7 +65,7 @@ def _get_github_prerelease_data():
 
 
 # Legacy files that have been moved to subfolders and should be cleaned up
-# JSON files are migrated to data/ by storage.py before this cleanup runs
+# JSON files are migrated to data/ by storage.run_legacy_migration() before this cleanup runs
 LEGACY_FILES_TO_REMOVE = [
     "pluginUI.py", "pluginDetailsUI.py", "pluginConfigUI.py",  # moved to ui/
     "system.py", "power.py", "backpack.py", "salvage.py", "ppcargo.py",  # moved to models/
@@ -81,7 +89,7 @@ LEGACY_FOLDERS_TO_REMOVE = [
 def _cleanup_legacy_files(plugin_dir):
     """Backup and remove legacy files/folders that have been moved or renamed.
 
-    JSON files are already migrated to data/ by storage.py before this runs.
+    JSON files are already migrated to data/ by storage.run_legacy_migration() before this runs.
     """
     backup_dir = os.path.join(plugin_dir, "backup_legacy")
     files_backed_up = False
@@ -175,21 +183,16 @@ def _download_system_game_data(release_data):
 
 
 def _backup_data_files():
-    """Create backup of all data files before update"""
+    """Create a backup snapshot of all data files before update"""
     try:
         logger.info("Creating data backups before update...")
 
-        # Save current state with backups enabled
-        from emt_models.system import dumpSystems
-        from emt_models.salvage import save_salvage
-        from emt_models.backpack import save_backpack
-        from emt_models.power import pledgedPower
-
-        # Save all data files with backup flag
-        pledgedPower.dumpJson(create_backup=True)
-        dumpSystems(create_backup=True)
-        save_salvage(create_backup=True)
-        save_backpack(create_backup=True)
+        # Save current state, then snapshot it (unchanged files are not stored again)
+        update_json_file()
+        if get_storage_backend() == STORAGE_BACKEND_SQLITE:
+            get_sqlite_store().backup()
+        if backup_store.snapshot(label="update") is None:
+            return False
 
         logger.info("Data backups created successfully")
         return True
@@ -406,7 +409,7 @@ def report_on_FSD(sourceSystem):
     if '@CPPledged' in dcText:
         dcText = dcText.replace('@CPPledged', f"Pledged {sourceSystem.PowerplayStateReinforcement}")
         
-    systems[sourceSystem.StarSystem].Merits = 0
+    systems[sourceSystem.StarSystem].setMerits(0)
     report.send_to_discord(dcText)
 
 def checkVersion():
@@ -461,23 +464,34 @@ def _cancel_autosave():
 def plugin_start3(plugin_dir):
     logger.info("EliteMeritTracker plugin starting")
 
-    # Clean up legacy folders/files from older versions
-    _cleanup_legacy_files(plugin_dir)
+    # Move legacy data files into data/ and clean up old folders/files, once per install
+    run_legacy_migration(cleanup=lambda: _cleanup_legacy_files(plugin_dir))
 
     configPlugin.loadConfig()
+    set_durability(configPlugin.durability)
+    set_storage_backend(STORAGE_BACKEND_SQLITE if configPlugin.useSqlite.get() else STORAGE_BACKEND_JSON)
+    systems.configure(max_resident=configPlugin.maxResidentSystems)
+    playerBackpack.set_removal_order(configPlugin.bagRemovalOrder)
     loadSystems()
     load_salvage()
     load_backpack()
+    load_expiry()
+    load_reconciliation_log()
     state.newest = checkVersion()
-    for system in systems.values():
-        if system.Active:
-            state.current_system = system
-            # DISABLED: Validation feature disabled to prevent data loss
-            # state.need_location_validation = True
-            logger.info(f"Restored active system: {system.StarSystem}")
+    for system in active_systems():
+        state.current_system = system
+        # DISABLED: Validation feature disabled to prevent data loss
+        # state.need_location_validation = True
+        logger.info(f"Restored active system: {system.StarSystem}")
     pledgedPower.loadPower()
     logger.info(f"Plugin initialized - Systems: {len(systems)}, Power: {pledgedPower.Power}")
 
+    # Start state history with a baseline snapshot of the loaded data
+    state_history.attach(_capture_state)
+    state_history.snapshot()
+    merit_ledger.open()
+    cycle_archive.open()
+
     # Start auto-save timer
     _schedule_autosave()
     logger.info("Auto-save scheduled for every 5 minutes")
@@ -496,6 +510,9 @@ def plugin_stop():
 
     # Final save on shutdown
     update_json_file()
+    close_storage()
+    logger.info(f"Systems registry: {systems.stats()}")
+    logger.info(f"Save timings: {get_save_stats()}")
     if trackerFrame:
         logger.warning("Destroying tracker frame.")
         trackerFrame.destroy_tracker_frame()
@@ -560,11 +577,8 @@ def reset():
     pledgedPower.MeritsSession = 0
 
     # Find most recently active system from systems dict
-    current_system_name = None
-    for name, system_data in systems.items():
-        if system_data.Active:
-            current_system_name = name
-            break
+    active = active_systems()
+    current_system_name = active[0].StarSystem if active else None
 
     # Fallback to state.current_system if available and no active system found
     if not current_system_name and state.current_system:
@@ -580,7 +594,7 @@ def reset():
 
     # Restore current system with its data but reset merits
     if current_system_data:
-        current_system_data.Merits = 0
+        current_system_data.setMerits(0)
         systems[current_system_name] = current_system_data
         logger.info(f"Restored current system with 0 merits: {current_system_name}")
     else:
@@ -588,6 +602,7 @@ def reset():
 
     # Save the cleared systems to disk
     dumpSystems()
+    state_history.snapshot()
 
     # Update the display with current system
     trackerFrame.update_display(state.current_system)
@@ -604,7 +619,7 @@ MERIT_CARGO_MULTIPLIER = 0.65
 def _add_merits_to_system(system_name: str, merits: int):
     """Add merits to a system, creating it if necessary."""
     if system_name in systems:
-        systems[system_name].Merits += merits
+        systems[system_name].addMerits(merits)
     else:
         new_system = StarSystem()
         new_system.StarSystem = system_name
@@ -612,7 +627,8 @@ def _add_merits_to_system(system_name: str, merits: int):
         systems[system_name] = new_system
 
 
-def update_system_merits(merits_value, system_name: str = None, apply_cargo_formula: bool = False, update_ui: bool = False):
+def update_system_merits(merits_value, system_name: str = None, apply_cargo_formula: bool = False, update_ui: bool = False,
+                         source: str = SOURCE_COMBAT, timestamp: str = None):
     """Unified merit update function.
 
     Args:
@@ -620,6 +636,8 @@ def update_system_merits(merits_value, system_name: str = None, apply_cargo_form
         system_name: Target system (uses current system if None)
         apply_cargo_formula: If True, applies cargo delivery reduction formula
         update_ui: If True, updates the tracker UI after adding merits
+        source: Merit source recorded in the ledger (cargo formula implies SOURCE_CARGO)
+        timestamp: Journal timestamp recorded in the ledger
     """
     global trackerFrame
 
@@ -637,6 +655,7 @@ def update_system_merits(merits_value, system_name: str = None, apply_cargo_form
         original = merits
         merits = int((merits / MERIT_CARGO_DIVISOR) * MERIT_CARGO_MULTIPLIER)
         logger.info(f"PowerPlay cargo delivery: {system_name} gets {merits} merits (reduced from {original})")
+        source = SOURCE_CARGO
 
     # Update session total
     pledgedPower.MeritsSession += merits
@@ -645,11 +664,14 @@ def update_system_merits(merits_value, system_name: str = None, apply_cargo_form
     if system_name:
         _add_merits_to_system(system_name, merits)
     else:
-        sys_name = getattr(state.current_system, "StarSystem", None)
-        if sys_name:
-            current = systems.get(sys_name, state.current_system)
-            current.Merits += merits
-            systems[sys_name] = current
+        system_name = getattr(state.current_system, "StarSystem", None)
+        if system_name:
+            current = systems.get(system_name, state.current_system)
+            current.addMerits(merits)
+            systems[system_name] = current
+
+    if system_name:
+        merit_ledger.record(timestamp, system_name, source, merits, pledgedPower.Power)
 
     # Update UI if requested
     if update_ui:
@@ -662,12 +684,96 @@ def prefs_changed(cmdr, is_beta):
         trackerFrame.update_display(state.current_system)
            
 def update_json_file():
-    pledgedPower.dumpJson()
+    # One durability barrier for all model files
+    with group_commit():
+        pledgedPower.dumpJson()
+        dumpSystems()
+        save_salvage()
+        save_backpack()
+        save_expiry()
+        save_reconciliation_log()
+    state_history.flush()
+    merit_ledger.flush()
+
+
+# Journal events that can change model state and are recorded in the state history
+HISTORY_EVENTS = {
+    'FSDJump', 'Location', 'CarrierJump', 'Docked', 'BackpackChange', 'DeliverPowerMicroResources',
+    'ShipLocker', 'CollectCargo', 'SearchAndRescue', 'Powerplay', 'PowerplayRank', 'PowerplayMerits',
+}
+
+
+def _capture_state():
+    """Full model state as plain dicts for state history snapshots"""
+    return {
+        "systems": dict(systems.serialized_items()),
+        "backpack": playerBackpack.to_dict(),
+        "salvage": {name: salvage.to_dict() for name, salvage in salvageInventory.items()},
+        "power": PowerEncoder().default(pledgedPower),
+    }
+
+
+def _history_touched_systems():
+    """Systems a journal event may change: current system plus pending merit distributions"""
+    touched = set()
+    if state.current_system:
+        touched.add(state.current_system.StarSystem)
+    if state.last_delivery_counts:
+        touched.update(state.last_delivery_counts)
+    if state.last_sar_counts:
+        touched.update(state.last_sar_counts)
+    return touched
+
+
+def _record_history(entry, touched_before):
+    """Record the state changed by a journal event in the state history"""
+    event = entry['event']
+    if event not in HISTORY_EVENTS:
+        return
+    touched = touched_before | _history_touched_systems()
+    changes = {"systems": {name: systems[name].to_dict() if name in systems else None for name in touched}}
+    if event in ('BackpackChange', 'DeliverPowerMicroResources', 'ShipLocker'):
+        changes["backpack"] = playerBackpack.to_dict()
+    if event in ('CollectCargo', 'SearchAndRescue') and state.current_system:
+        name = state.current_system.StarSystem
+        changes["salvage"] = {name: salvageInventory[name].to_dict() if name in salvageInventory else None}
+    if event in ('Powerplay', 'PowerplayRank', 'PowerplayMerits'):
+        changes["power"] = PowerEncoder().default(pledgedPower)
+    state_history.record(entry.get('timestamp'), event, changes)
+
+
+def _archive_cycle_rollover(entry):
+    """Move the previous cycle's systems to the cycle archive when the weekly tick has passed"""
+    ended = cycle_archive.check_rollover(entry.get('timestamp'))
+    if ended is None:
+        return
+
+    archived = dict(systems.serialized_items())
+    if archived:
+        cycle_archive.archive_cycle(ended, archived)
+
+    # Keep only the current system, starting the new cycle with 0 merits
+    systems.clear()
+    if state.current_system:
+        state.current_system.setMerits(0)
+        state.current_system.setReported(False)
+        systems[state.current_system.StarSystem] = state.current_system
+
     dumpSystems()
-    save_salvage()
-    save_backpack()
+    state_history.snapshot(entry.get('timestamp'))
+    logger.info(f"PowerPlay cycle {ended} ended - archived {len(archived)} systems")
+
 
 def journal_entry(cmdr, is_beta, system, station, entry, game_state):
+    if cycle_archive.enabled:
+        _archive_cycle_rollover(entry)
+    touched = _history_touched_systems() if state_history.enabled else None
+    _handle_journal_entry(cmdr, is_beta, system, station, entry, game_state)
+    if touched is not None:
+        _record_history(entry, touched)
+
+
+def _handle_journal_entry(cmdr, is_beta, system, station, entry, game_state):
     global trackerFrame
 
     # Track any journal event timestamp for duplicate detection
@@ -683,41 +789,38 @@ def journal_entry(cmdr, is_beta, system, station, entry, game_state):
 
     if entry['event'] in ['LoadGame']:
         state.commander = entry.get('Commander', "")
+    if entry['event'] in ['LoadGame', 'FSDJump']:
+        # Age out backpack/salvage entries from earlier sessions so they are never attributed
+        expire_stale_items(current_timestamp, configPlugin.staleAfterHours)
     if entry['event'] == 'BackpackChange':
         # Track PowerPlay data collection
         current_system = state.current_system.StarSystem if state.current_system else None
         controlling_power = state.current_system.ControllingPower if state.current_system else None
         player_pledged_power = pledgedPower.Power
 
-        # Process added items
+        # Process added/removed items; the backpack ignores anything that is not PowerPlay data
         for item in entry.get('Added', []):
-            item_name = item.get('Name', '').lower()
-            item_count = item.get('Count', 1)
-            if is_valid_um_data(item_name) or is_valid_reinf_data(item_name) or is_valid_acq_data(item_name):
-                playerBackpack.add_item(item_name, item_count, current_system, controlling_power, player_pledged_power)
-
-        # Process removed items
+            playerBackpack.add_item(item.get('Name', '').lower(), item.get('Count', 1),
+                                    current_system, controlling_power, player_pledged_power, current_timestamp)
         for item in entry.get('Removed', []):
-            item_name = item.get('Name', '').lower()
-            item_count = item.get('Count', 1)
-            if is_valid_um_data(item_name) or is_valid_reinf_data(item_name) or is_valid_acq_data(item_name):
-                playerBackpack.remove_item(item_name, item_count)
+            playerBackpack.remove_item(item.get('Name', '').lower(), item.get('Count', 1))
     if entry['event'] == 'DeliverPowerMicroResources':
         # Hand-in PowerPlay data at power contact - capture system distribution for merit assignment
         state.last_delivery_counts = {}
         for item in entry.get('MicroResources', []):
-            item_name = item.get('Name', '').lower()
-            item_count = item.get('Count', 1)
-            if is_valid_um_data(item_name) or is_valid_reinf_data(item_name) or is_valid_acq_data(item_name):
-                systems_removed = playerBackpack.remove_item(item_name, item_count)
-                # Aggregate system counts for merit distribution
-                for sys_name, count in systems_removed.items():
-                    state.add_delivery_count(sys_name, count)
-    if entry['event'] == 'ShipLocker':
-        # Cross-check backpack against game state (handles death, etc.)
-        data_items = entry.get('Data', [])
-        if data_items:
-            playerBackpack.sync_from_shiplocker(data_items)
+            systems_removed = playerBackpack.remove_item(item.get('Name', '').lower(), item.get('Count', 1))
+            # Aggregate system counts for merit distribution
+            for sys_name, count in systems_removed.items():
+                state.add_delivery_count(sys_name, count)
+    if entry['event'] == 'ShipLocker' and 'Data' in entry:
+        # Reconcile backpack with game state (handles death, etc.); an empty Data list means no data carried
+        if reconcile_backpack(entry['Data'], current_timestamp):
+            # One save and one backpack window refresh for the whole batch
+            with group_commit():
+                save_backpack()
+                save_expiry()
+                save_reconciliation_log()
+            refresh_backpack_view()
     if entry['event'] in ['CollectCargo']:
         # Only track PowerPlay salvage cargo, not mining commodities
         cargo_type = entry.get("Type", "Unknown").lower()
@@ -739,15 +842,19 @@ def journal_entry(cmdr, is_beta, system, station, entry, game_state):
             # Only process salvage from current system to prevent attribution to wrong systems
             if state.current_system and state.current_system.StarSystem in salvageInventory:
                 system_name = state.current_system.StarSystem
-                if salvageInventory[system_name].has_cargo(cargo_type):
-                    removed = salvageInventory[system_name].remove_cargo(cargo_type, count)
+                salvage = salvageInventory[system_name]
+                removed = 0
+                if salvage.has_cargo(cargo_type):
+                    removed = salvage.remove_cargo(cargo_type, count)
                     state.add_sar_count(system_name, removed)
+                # The rest may be stale cargo from an earlier session: drop it without attribution
+                removed += salvage.remove_stale(cargo_type, count - removed)
 
-                    # Warn if inventory is short (salvage count mismatch)
-                    if removed < count:
-                        logger.warning(f"Salvage inventory short: handed in {count} {cargo_type} but only had {removed} tracked in {system_name}")
-                else:
+                # Warn if inventory is short (salvage count mismatch)
+                if removed == 0:
                     logger.warning(f"Handed in {count} {cargo_type} but no inventory tracked in {system_name}")
+                elif removed < count:
+                    logger.warning(f"Salvage inventory short: handed in {count} {cargo_type} but only had {removed} tracked in {system_name}")
             else:
                 logger.warning(f"SearchAndRescue in unknown system - cannot track salvage source")
     if entry['event'] in ['Powerplay']:
@@ -779,7 +886,9 @@ def journal_entry(cmdr, is_beta, system, station, entry, game_state):
             # Also correct system merits if they were affected
             if state.current_system and state.current_system.StarSystem in systems:
                 if systems[state.current_system.StarSystem].Merits >= retroactive_correction:
-                    systems[state.current_system.StarSystem].Merits -= retroactive_correction
+                    systems[state.current_system.StarSystem].addMerits(-retroactive_correction)
+                    merit_ledger.record(current_timestamp, state.current_system.StarSystem, SOURCE_CORRECTION,
+                                        -retroactive_correction, pledgedPower.Power)
                     logger.info(f"Corrected system merits for {state.current_system.StarSystem}: -{retroactive_correction}")
 
         # Process the valid PowerplayMerits event
@@ -792,7 +901,8 @@ def journal_entry(cmdr, is_beta, system, station, entry, game_state):
                 merits_per_item = merits_gained / total_items
                 for system_name, item_count in state.last_delivery_counts.items():
                     system_merits = int(merits_per_item * item_count)
-                    update_system_merits(system_merits, system_name=system_name)
+                    update_system_merits(system_merits, system_name=system_name,
+                                         source=SOURCE_DATA, timestamp=current_timestamp)
             state.reset_delivery_tracking()
             # Update UI after distributing merits across systems
             trackerFrame.update_display(state.current_system)
@@ -802,12 +912,13 @@ def journal_entry(cmdr, is_beta, system, station, entry, game_state):
                 merits_per_item = merits_gained / total_items
                 for system_name, item_count in state.last_sar_counts.items():
                     system_merits = int(merits_per_item * item_count)
-                    update_system_merits(system_merits, system_name=system_name)
+                    update_system_merits(system_merits, system_name=system_name,
+                                         source=SOURCE_SALVAGE, timestamp=current_timestamp)
             state.reset_sar_tracking()
             # Update UI after distributing merits across systems
             trackerFrame.update_display(state.current_system)
         else:
-            update_system_merits(merits_gained, update_ui=True)
+            update_system_merits(merits_gained, update_ui=True, timestamp=current_timestamp)
 
         pledgedPower.Merits = entry.get('TotalMerits', pledgedPower.Merits)
         pledgedPower.Power = entry.get('Power', pledgedPower.Power)